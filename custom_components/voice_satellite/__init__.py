@@ -12,6 +12,7 @@ import asyncio
 import json
 import logging
 import shutil
+import time
 from pathlib import Path
 
 import voluptuous as vol
@@ -19,12 +20,30 @@ import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import Context, HomeAssistant, ServiceCall
+from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 
+from .audio_codecs import AUDIO_CODEC_PCM16, AUDIO_CODECS
+from .audio_frames import (
+    AUDIO_FRAME_MS_CHOICES,
+    DEFAULT_AUDIO_FRAME_MS,
+    PREROLL_CAPACITY_MS,
+)
+from .audio_queue import (
+    AUDIO_QUEUE_PAUSE,
+    AUDIO_QUEUE_POLICIES,
+    DEFAULT_AUDIO_QUEUE_MAX_BYTES,
+    DEFAULT_AUDIO_QUEUE_POLICY,
+    AudioFrameQueue,
+)
+from .audio_resample import PIPELINE_SAMPLE_RATE
+from .audio_vad import DEFAULT_HANGOVER_MS
 from .const import DOMAIN
 from .diagnostics import register as register_diagnostics
+from .entity_index import async_get_index
+from .inference_pool import async_shutdown_inference_pool
 from .media_proxy import async_setup_media_proxy
+from .pipeline_handoff import async_start_drain
 from .frontend import (
     async_register_resource,
     async_register_sidebar_panel,
@@ -32,20 +51,14 @@ from .frontend import (
     async_unregister_resource,
 )
 from .settings_store import async_get_panel_settings, async_save_panel_settings
+from .stream_session import AudioIngest, StreamSession, TurnConnection
+from .wake_word_verify import DEFAULT_VERIFY_PREROLL_MS, VERIFY_MAX_PREROLL_MS
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-PLATFORMS = [Platform.ASSIST_SATELLITE, Platform.BINARY_SENSOR, Platform.MEDIA_PLAYER, Platform.NUMBER, Platform.SELECT, Platform.SWITCH]
-
-
-def _find_entity(hass: HomeAssistant, entity_id: str, predicate=None):
-    """Find a registered entity by entity_id, with optional extra filter."""
-    for _, ent in hass.data.get(DOMAIN, {}).items():
-        if ent.entity_id == entity_id and (predicate is None or predicate(ent)):
-            return ent
-    return None
+PLATFORMS = [Platform.ASSIST_SATELLITE, Platform.BINARY_SENSOR, Platform.MEDIA_PLAYER, Platform.NUMBER, Platform.SELECT, Platform.SENSOR, Platform.SWITCH, Platform.WAKE_WORD]
 
 
 _BUILTIN_MODELS = {"ok_nabu", "hey_jarvis", "alexa", "hey_mycroft", "hey_home_assistant", "hey_luna", "okay_computer", "stop"}
@@ -252,7 +265,7 @@ async def _async_handle_wake_service(call: ServiceCall) -> None:
     entity_ids = call.data["entity_id"]
 
     for entity_id in entity_ids:
-        entity = _find_entity(hass, entity_id)
+        entity = async_get_index(hass).satellite(entity_id)
         if entity is None:
             _LOGGER.warning("voice_satellite.wake: entity %s not found", entity_id)
             continue
@@ -291,7 +304,7 @@ async def _async_handle_start_timer_service(call: ServiceCall) -> None:
     language = hass.config.language or "en"
 
     for entity_id in entity_ids:
-        entity = _find_entity(hass, entity_id)
+        entity = async_get_index(hass).satellite(entity_id)
         if entity is None:
             _LOGGER.warning(
                 "voice_satellite.start_timer: entity %s not found", entity_id
@@ -333,7 +346,7 @@ async def _async_handle_set_screensaver_service(call: ServiceCall) -> None:
     payload = {k: v for k, v in call.data.items() if k != "entity_id"}
 
     for entity_id in entity_ids:
-        entity = _find_entity(hass, entity_id)
+        entity = async_get_index(hass).satellite(entity_id)
         if entity is None:
             _LOGGER.warning(
                 "voice_satellite.set_screensaver: entity %s not found", entity_id
@@ -364,7 +377,7 @@ async def _async_handle_show_service(call: ServiceCall) -> None:
     duration: int = call.data.get("duration", 0)
 
     for entity_id in entity_ids:
-        entity = _find_entity(hass, entity_id)
+        entity = async_get_index(hass).satellite(entity_id)
         if entity is None:
             _LOGGER.warning("voice_satellite.show: entity %s not found", entity_id)
             continue
@@ -402,6 +415,8 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     websocket_api.async_register_command(hass, ws_fire_chat_event)
     websocket_api.async_register_command(hass, ws_question_answered)
     websocket_api.async_register_command(hass, ws_run_pipeline)
+    websocket_api.async_register_command(hass, ws_stream_session)
+    websocket_api.async_register_command(hass, ws_session_turn)
     websocket_api.async_register_command(hass, ws_subscribe_satellite_events)
     websocket_api.async_register_command(hass, ws_subscription_check)
     websocket_api.async_register_command(hass, ws_cancel_timer)
@@ -409,6 +424,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     websocket_api.async_register_command(hass, ws_screensaver_state)
     websocket_api.async_register_command(hass, ws_get_panel_settings)
     websocket_api.async_register_command(hass, ws_save_panel_settings)
+    websocket_api.async_register_command(hass, ws_get_metrics)
+    websocket_api.async_register_command(hass, ws_get_latency)
+    websocket_api.async_register_command(hass, ws_tts_playback_started)
     register_diagnostics(hass)
 
     # Same-origin proxy for HTTP-only media sources (e.g. Music Assistant)
@@ -530,7 +548,7 @@ async def ws_save_panel_settings(
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Voice Satellite from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    async_get_index(hass)
 
     # Safety net: verify frontend resources exist (covers HACS update edge cases
     # where async_setup registration may have failed or the resource was deleted
@@ -548,12 +566,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     result = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if result:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-        hass.data[DOMAIN].pop(f"{entry.entry_id}_media_player", None)
-        hass.data[DOMAIN].pop(f"{entry.entry_id}_screensaver_sensor", None)
+        index = async_get_index(hass)
+        index.pop_entry(entry.entry_id)
         # Remove Lovelace resource when last entry is unloaded
-        if not hass.data[DOMAIN]:
+        if not index:
             await async_unregister_resource(hass)
+            async_shutdown_inference_pool(hass)
     return result
 
 
@@ -574,7 +592,7 @@ async def ws_announce_finished(
     entity_id = msg["entity_id"]
     announce_id = msg["announce_id"]
 
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Entity {entity_id} not found"
@@ -602,7 +620,7 @@ async def ws_update_state(
     entity_id = msg["entity_id"]
     state = msg["state"]
 
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Entity {entity_id} not found"
@@ -645,7 +663,7 @@ async def ws_fire_chat_event(
     """
     entity_id = msg["entity_id"]
 
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Entity {entity_id} not found"
@@ -689,7 +707,7 @@ async def ws_question_answered(
     announce_id = msg["announce_id"]
     sentence = msg["sentence"]
 
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Entity {entity_id} not found"
@@ -718,17 +736,200 @@ async def ws_question_answered(
     })
 
 
+# Audio transport settings: per run_pipeline call, or once per streaming
+# session (see stream_session.py).
+_AUDIO_STREAM_SCHEMA = {
+    # Rate of the PCM the card streams; anything other than 16 kHz is
+    # resampled server side (see audio_resample.py).
+    vol.Required("sample_rate"): vol.All(int, vol.Range(min=8000, max=192000)),
+    # Audio backlog bound and overflow policy (see audio_queue.py).
+    # "pause" makes the server send audio-pause / audio-resume events.
+    vol.Optional(
+        "audio_queue_policy", default=DEFAULT_AUDIO_QUEUE_POLICY
+    ): vol.In(AUDIO_QUEUE_POLICIES),
+    vol.Optional(
+        "audio_queue_max_bytes", default=DEFAULT_AUDIO_QUEUE_MAX_BYTES
+    ): vol.All(int, vol.Range(min=3200, max=3_200_000)),
+    # Fixed frame size handed to STT / VAD (see audio_frames.py).
+    vol.Optional("audio_frame_ms", default=DEFAULT_AUDIO_FRAME_MS): vol.In(
+        AUDIO_FRAME_MS_CHOICES
+    ),
+    # Upstream codec of the binary audio payloads (see audio_codecs.py).
+    vol.Optional("audio_codec", default=AUDIO_CODEC_PCM16): vol.In(AUDIO_CODECS),
+}
+
+# Settings of one pipeline run: per run_pipeline call or session turn.
+_RUN_SCHEMA = {
+    vol.Required("start_stage"): str,
+    vol.Required("end_stage"): str,
+    vol.Optional("conversation_id"): str,
+    vol.Optional("extra_system_prompt"): str,
+    vol.Optional("wake_word_phrase"): str,
+    vol.Optional("wake_word_slot"): vol.All(int, vol.In([1, 2])),
+    # Server-side speech gate for stt runs (see audio_vad.py).
+    vol.Optional("vad_gate", default=False): bool,
+    vol.Optional(
+        "vad_gate_hangover_ms", default=DEFAULT_HANGOVER_MS
+    ): vol.All(int, vol.Range(min=100, max=3000)),
+    # Replay this much of the audio the card streamed on its session
+    # before the turn (its wake word pre-roll and the speech after it)
+    # into an stt run, so speech right after the wake word is not lost.
+    vol.Optional("preroll_ms", default=0): vol.All(
+        int, vol.Range(min=0, max=PREROLL_CAPACITY_MS)
+    ),
+    # Re-check a browser wake word detection before STT: the first
+    # verify_preroll_ms of audio is the card's pre-roll (stt runs only,
+    # see wake_word_verify.py).
+    vol.Optional("verify_wake_word"): str,
+    vol.Optional(
+        "verify_preroll_ms", default=DEFAULT_VERIFY_PREROLL_MS
+    ): vol.All(int, vol.Range(min=500, max=VERIFY_MAX_PREROLL_MS)),
+    # The card's detection score and speech level, compared against
+    # other satellites of the same group that heard the same wake word
+    # (see wake_arbitration.py).  Scores are only compared between runs
+    # of the same wake word engine and model.
+    vol.Optional("wake_word_score"): vol.All(
+        vol.Coerce(float), vol.Range(min=0.0)
+    ),
+    vol.Optional("wake_word_energy"): vol.All(
+        vol.Coerce(float), vol.Range(min=0.0)
+    ),
+    vol.Optional("wake_word_engine"): str,
+    vol.Optional("wake_word_model"): str,
+}
+
+
+@callback
+def _displace_current_run(
+    hass: HomeAssistant, entity, connection: websocket_api.ActiveConnection
+) -> bool:
+    """Stop the satellite's current run; return True if one was still running.
+
+    Stop the old pipeline's audio stream so internal HA tasks (wake word,
+    STT) unblock naturally.  We must NOT cancel immediately - the stop
+    signal and CancelledError would race on `await audio_queue.get()`,
+    and CancelledError always wins, leaving orphaned PipelineInput tasks.
+    Instead: send stop signal -> let it exit in the background while the
+    new run starts -> cancel only on timeout (see pipeline_handoff.py).
+    """
+    if entity.pipeline_audio_queue is not None:
+        old_conn = entity.pipeline_connection
+        old_msg_id = entity.pipeline_msg_id
+        # A session turn's connection is wrapped (stream_session.py).
+        if isinstance(old_conn, TurnConnection):
+            old_conn = old_conn.connection
+        if old_conn is not None and old_conn is not connection:
+            _LOGGER.warning(
+                "Pipeline for '%s' displaced by a different browser connection "
+                " -  the previous browser will stop receiving wake word events. "
+                "Each browser must use its own satellite entity.",
+                entity.satellite_name,
+            )
+            try:
+                entity.pipeline_connection.send_event(
+                    old_msg_id, {"type": "displaced"}
+                )
+            except Exception:
+                pass  # old connection may already be dead
+        entity.pipeline_audio_queue.put_nowait(b"")
+
+    old_task = entity.bridge_task
+    if old_task is None or old_task.done():
+        return False
+    async_start_drain(hass, old_task, entity.satellite_name, entity.handoff_stats)
+    return True
+
+
+def _new_audio_queue(
+    entity, connection, msg_id: int, max_bytes: int, policy: str
+) -> AudioFrameQueue:
+    """Create a run's bounded audio queue.
+
+    Bounded so a stalled consumer (STT / wake word provider) cannot grow
+    memory without limit while the tablet keeps streaming.
+    """
+
+    def _on_pause(paused: bool) -> None:
+        try:
+            connection.send_event(
+                msg_id, {"type": "audio-pause" if paused else "audio-resume"}
+            )
+        except Exception:
+            pass  # connection may already be dead
+
+    return AudioFrameQueue(
+        entity.audio_queue_stats,
+        max_bytes=max_bytes,
+        policy=policy,
+        on_pause=_on_pause if policy == AUDIO_QUEUE_PAUSE else None,
+    )
+
+
+@callback
+def _async_start_audio_run(
+    hass: HomeAssistant,
+    entity,
+    connection,
+    msg_id: int,
+    msg: dict,
+    audio_queue: AudioFrameQueue,
+    frame_ms: int,
+) -> asyncio.Task:
+    """Start an audio pipeline run as the satellite's current task."""
+    start_stage = msg["start_stage"]
+    # Grab the pre-roll before the run starts, then forget it, whatever
+    # the run: what is buffered now arrived between runs.  Only stt runs
+    # replay it: a wake_word run would just re-detect the wake word.  A
+    # verified run gets the card's own pre-roll in-band instead.
+    verify_wake_word = msg.get("verify_wake_word") if start_stage == "stt" else None
+    if msg["preroll_ms"] and start_stage == "stt" and verify_wake_word is None:
+        preroll = entity.preroll.snapshot(msg["preroll_ms"])
+        if preroll:
+            _LOGGER.debug(
+                "Replaying %d ms of pre-roll audio for '%s'",
+                len(preroll) // 32,
+                entity.satellite_name,
+            )
+            audio_queue.put_nowait(preroll)
+    entity.preroll.clear()
+
+    # Run the pipeline as a background task so it doesn't block HA bootstrap.
+    # Pipeline tasks are long-running (wake word detection) and must not
+    # prevent HA from completing startup.
+    task = hass.async_create_background_task(
+        entity.async_run_pipeline(
+            audio_queue,
+            connection,
+            msg_id,
+            start_stage,
+            msg["end_stage"],
+            conversation_id=msg.get("conversation_id"),
+            extra_system_prompt=msg.get("extra_system_prompt"),
+            wake_word_phrase=msg.get("wake_word_phrase"),
+            wake_word_slot=msg.get("wake_word_slot"),
+            frame_ms=frame_ms,
+            vad_gate_hangover_ms=(
+                msg["vad_gate_hangover_ms"] if msg["vad_gate"] else None
+            ),
+            verify_wake_word=verify_wake_word,
+            verify_preroll_ms=msg["verify_preroll_ms"],
+            wake_word_score=msg.get("wake_word_score"),
+            wake_word_energy=msg.get("wake_word_energy"),
+            wake_word_engine=msg.get("wake_word_engine"),
+            wake_word_model=msg.get("wake_word_model"),
+        ),
+        name=f"voice_satellite.{entity.satellite_name}_pipeline",
+    )
+    entity.bridge_task = task
+    return task
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_satellite/run_pipeline",
         vol.Required("entity_id"): str,
-        vol.Required("start_stage"): str,
-        vol.Required("end_stage"): str,
-        vol.Required("sample_rate"): int,
-        vol.Optional("conversation_id"): str,
-        vol.Optional("extra_system_prompt"): str,
-        vol.Optional("wake_word_phrase"): str,
-        vol.Optional("wake_word_slot"): vol.All(int, vol.In([1, 2])),
+        **_AUDIO_STREAM_SCHEMA,
+        **_RUN_SCHEMA,
         # Text-input variant: when intent_input is set the run skips the
         # audio queue / binary handler entirely and executes a PipelineInput
         # directly with start_stage=intent. pipeline_id picks a specific
@@ -748,60 +949,42 @@ async def ws_run_pipeline(
 
     Follows the same binary handler pattern as HA core's assist_pipeline/run.
     """
+    requested_at = time.monotonic()
     entity_id = msg["entity_id"]
     start_stage = msg["start_stage"]
-    end_stage = msg["end_stage"]
-    conversation_id = msg.get("conversation_id")
-    extra_system_prompt = msg.get("extra_system_prompt")
-    wake_word_phrase = msg.get("wake_word_phrase")
-    wake_word_slot = msg.get("wake_word_slot")
     intent_input = msg.get("intent_input")
-    pipeline_id_override = msg.get("pipeline_id")
 
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Entity {entity_id} not found"
         )
         return
 
-    # Stop the old pipeline's audio stream so internal HA tasks (wake word,
-    # STT) unblock naturally.  We must NOT cancel immediately - the stop
-    # signal and CancelledError would race on `await audio_queue.get()`,
-    # and CancelledError always wins, leaving orphaned PipelineInput tasks.
-    # Instead: send stop signal -> wait for natural exit -> cancel only on timeout.
-    if entity.pipeline_audio_queue is not None:
-        old_conn = entity.pipeline_connection
-        old_msg_id = entity.pipeline_msg_id
-        if old_conn is not None and old_conn is not connection:
-            _LOGGER.warning(
-                "Pipeline for '%s' displaced by a different browser connection "
-                " -  the previous browser will stop receiving wake word events. "
-                "Each browser must use its own satellite entity.",
-                entity.satellite_name,
+    ingest = None
+    if intent_input is None:
+        # Only audio runs stream PCM; intent/tts runs ignore sample_rate.
+        try:
+            ingest = AudioIngest(
+                hass,
+                entity,
+                msg["audio_codec"],
+                msg["sample_rate"]
+                if start_stage in ("wake_word", "stt")
+                else PIPELINE_SAMPLE_RATE,
             )
-            try:
-                old_conn.send_event(old_msg_id, {"type": "displaced"})
-            except Exception:
-                pass  # old connection may already be dead
-        entity.pipeline_audio_queue.put_nowait(b"")
+        except RuntimeError as err:
+            connection.send_error(msg["id"], "not_supported", str(err))
+            return
 
-    old_task = entity.pipeline_task
-    if old_task and not old_task.done():
-        done, _ = await asyncio.wait({old_task}, timeout=3.0)
-        if not done:
-            old_task.cancel()
-            try:
-                await old_task
-            except (asyncio.CancelledError, Exception):
-                pass
+    displaced = _displace_current_run(hass, entity, connection)
 
     # Text-input variant: no audio queue, no binary handler, no audio stream.
     # Used by voice_satellite.show - pipeline runs from start_stage=intent
     # with the prompt as intent_input. Pipeline events flow back through the
     # same subscription via on_pipeline_event so the frontend renders bubbles,
     # tool-call rich media, and TTS exactly like a wake-word turn.
-    if intent_input is not None:
+    if ingest is None:
         try:
             connection.send_result(msg["id"])
             # No binary handler - signal that to the card with handler_id=null.
@@ -814,15 +997,18 @@ async def ws_run_pipeline(
                     connection,
                     msg["id"],
                     start_stage=start_stage,
-                    end_stage=end_stage,
+                    end_stage=msg["end_stage"],
                     intent_input=intent_input,
-                    pipeline_id_override=pipeline_id_override,
-                    conversation_id=conversation_id,
-                    extra_system_prompt=extra_system_prompt,
+                    pipeline_id_override=msg.get("pipeline_id"),
+                    conversation_id=msg.get("conversation_id"),
+                    extra_system_prompt=msg.get("extra_system_prompt"),
                 ),
                 name=f"voice_satellite.{entity.satellite_name}_pipeline_text",
             )
-            entity.pipeline_task = task
+            entity.bridge_task = task
+            entity.handoff_stats.record_handoff(
+                time.monotonic() - requested_at, displaced
+            )
 
             def unsub_text() -> None:
                 if not task.done():
@@ -833,20 +1019,23 @@ async def ws_run_pipeline(
             raise
         return
 
-    # Audio queue - card sends binary audio frames, empty bytes = stop
-    audio_queue: asyncio.Queue[bytes] = asyncio.Queue()
+    # Audio queue - card sends binary audio frames, empty bytes = stop.
+    audio_queue = _new_audio_queue(
+        entity,
+        connection,
+        msg["id"],
+        msg["audio_queue_max_bytes"],
+        msg["audio_queue_policy"],
+    )
+    ingest.sink = audio_queue
 
     # Register binary handler for incoming audio.
     # HA calls binary handlers with (hass, connection, payload).
-    def _on_binary(
-        _hass: HomeAssistant,
-        _connection: websocket_api.ActiveConnection,
-        data: bytes,
-    ) -> None:
-        audio_queue.put_nowait(data)
-
+    # Payloads are decoded to PCM on arrival so everything downstream
+    # (queue, pre-roll, audio_stream) is codec-agnostic.  Decoding and
+    # resampling run in order on an inference pool lane, off the loop.
     handler_id, unregister = connection.async_register_binary_handler(
-        _on_binary
+        ingest.on_binary
     )
 
     try:
@@ -856,46 +1045,239 @@ async def ws_run_pipeline(
         # Send synthetic init event with the handler_id the card needs
         connection.send_event(
             msg["id"],
-            {"type": "init", "handler_id": handler_id},
+            {
+                "type": "init",
+                "handler_id": handler_id,
+                "audio_codec": msg["audio_codec"],
+            },
         )
 
-        # Run the pipeline as a background task so it doesn't block HA bootstrap.
-        # Pipeline tasks are long-running (wake word detection) and must not
-        # prevent HA from completing startup.
-        task = hass.async_create_background_task(
-            entity.async_run_pipeline(
-                audio_queue,
-                connection,
-                msg["id"],
-                start_stage,
-                end_stage,
-                conversation_id=conversation_id,
-                extra_system_prompt=extra_system_prompt,
-                wake_word_phrase=wake_word_phrase,
-                wake_word_slot=wake_word_slot,
-            ),
-            name=f"voice_satellite.{entity.satellite_name}_pipeline",
+        _async_start_audio_run(
+            hass, entity, connection, msg["id"], msg, audio_queue, msg["audio_frame_ms"]
+        )
+        entity.handoff_stats.record_handoff(
+            time.monotonic() - requested_at, displaced
         )
-        entity.pipeline_task = task
 
         # Cleanup on unsubscribe - send stop signal to end the audio stream
         # naturally.  Do NOT cancel here; CancelledError races with the stop
         # signal and leaves orphaned HA pipeline tasks.  The next ws_run_pipeline
         # call (or async_will_remove_from_hass) handles forced cancellation.
         def unsub() -> None:
-            audio_queue.put_nowait(b"")
+            ingest.close()
             unregister()
 
         connection.subscriptions[msg["id"]] = unsub
     except Exception:
+        ingest.close()
         unregister()
         raise
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_satellite/stream_session",
+        vol.Required("entity_id"): str,
+        **_AUDIO_STREAM_SCHEMA,
+    }
+)
+@websocket_api.async_response
+async def ws_stream_session(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Open a satellite's persistent audio stream (see stream_session.py).
+
+    Registers one binary handler for every pipeline run started on it
+    with voice_satellite/session_turn; run events arrive on this
+    subscription.  Replaces the satellite's previous session.
+    """
+    entity_id = msg["entity_id"]
+
+    entity = async_get_index(hass).satellite(entity_id)
+    if entity is None:
+        connection.send_error(
+            msg["id"], "not_found", f"Entity {entity_id} not found"
+        )
+        return
+
+    try:
+        ingest = AudioIngest(hass, entity, msg["audio_codec"], msg["sample_rate"])
+    except RuntimeError as err:
+        connection.send_error(msg["id"], "not_supported", str(err))
+        return
+
+    if entity.stream_session is not None:
+        entity.stream_session.close()
+
+    handler_id, unregister = connection.async_register_binary_handler(
+        ingest.on_binary
+    )
+    session = StreamSession(
+        ingest,
+        connection,
+        msg["id"],
+        unregister,
+        frame_ms=msg["audio_frame_ms"],
+        queue_max_bytes=msg["audio_queue_max_bytes"],
+        queue_policy=msg["audio_queue_policy"],
+    )
+    entity.stream_session = session
+
+    connection.send_result(msg["id"])
+    connection.send_event(
+        msg["id"],
+        {
+            "type": "init",
+            "handler_id": handler_id,
+            "audio_codec": msg["audio_codec"],
+        },
+    )
+
+    def unsub() -> None:
+        session.close()
+        if entity.stream_session is session:
+            entity.stream_session = None
+
+    connection.subscriptions[msg["id"]] = unsub
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_satellite/session_turn",
+        vol.Required("entity_id"): str,
+        **_RUN_SCHEMA,
+    }
+)
+@websocket_api.async_response
+async def ws_session_turn(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Start the next pipeline run on the satellite's streaming session.
+
+    Answers with the turn number; the run's events go out on the session
+    subscription carrying that number.
+    """
+    requested_at = time.monotonic()
+    entity_id = msg["entity_id"]
+
+    entity = async_get_index(hass).satellite(entity_id)
+    if entity is None:
+        connection.send_error(
+            msg["id"], "not_found", f"Entity {entity_id} not found"
+        )
+        return
+
+    session = entity.stream_session
+    if session is None or session.connection is not connection:
+        connection.send_error(
+            msg["id"], "no_session", f"No streaming session open for {entity_id}"
+        )
+        return
+
+    displaced = _displace_current_run(hass, entity, connection)
+    turn_connection = session.next_turn()
+    audio_queue = _new_audio_queue(
+        entity,
+        turn_connection,
+        session.msg_id,
+        session.queue_max_bytes,
+        session.queue_policy,
+    )
+    session.ingest.sink = audio_queue
+    _async_start_audio_run(
+        hass, entity, turn_connection, session.msg_id, msg, audio_queue, session.frame_ms
+    )
+    entity.handoff_stats.record_handoff(time.monotonic() - requested_at, displaced)
+    connection.send_result(msg["id"], {"turn": session.turns})
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_satellite/get_metrics",
+        vol.Required("entity_id"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_get_metrics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return runtime metrics (audio queue depth, drops...) for a satellite."""
+    entity_id = msg["entity_id"]
+
+    entity = async_get_index(hass).satellite(entity_id)
+    if entity is None:
+        connection.send_error(
+            msg["id"], "not_found", f"Entity {entity_id} not found"
+        )
+        return
+
+    connection.send_result(msg["id"], entity.get_metrics())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_satellite/get_latency",
+        vol.Required("entity_id"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_get_latency(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return per-stage pipeline latency percentiles and histograms."""
+    entity_id = msg["entity_id"]
+
+    entity = async_get_index(hass).satellite(entity_id)
+    if entity is None:
+        connection.send_error(
+            msg["id"], "not_found", f"Entity {entity_id} not found"
+        )
+        return
+
+    connection.send_result(msg["id"], entity.latency.as_dict())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "voice_satellite/tts_playback_started",
+        vol.Required("entity_id"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_tts_playback_started(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle the card's ACK that a pipeline's TTS audio started playing."""
+    entity_id = msg["entity_id"]
+
+    entity = async_get_index(hass).satellite(entity_id)
+    if entity is None:
+        connection.send_error(
+            msg["id"], "not_found", f"Entity {entity_id} not found"
+        )
+        return
+
+    entity.tts_playback_started()
+    connection.send_result(msg["id"], {"success": True})
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "voice_satellite/subscribe_events",
         vol.Required("entity_id"): str,
+        # Opt into `config` events: a full snapshot right after subscribing,
+        # then only the changed keys, each with a higher `revision`.
+        vol.Optional("config_events", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -908,18 +1290,26 @@ async def ws_subscribe_satellite_events(
 
     The entity pushes events via send_event() when HA commands arrive,
     matching how Voice PE satellites receive commands via their device connection.
+    With config_events the subscription also carries the satellite's config
+    (mute, wake word, TTS output...) as revisioned deltas, so the card does
+    not have to re-read the full entity state on every settings change.
     """
     entity_id = msg["entity_id"]
 
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Entity {entity_id} not found"
         )
         return
 
-    entity.register_satellite_subscription(connection, msg["id"])
+    config_events = msg["config_events"]
+    entity.register_satellite_subscription(
+        connection, msg["id"], config_events=config_events
+    )
     connection.send_result(msg["id"])
+    if config_events:
+        entity.send_config_snapshot(connection, msg["id"])
 
     def unsub() -> None:
         entity.unregister_satellite_subscription(connection, msg["id"])
@@ -945,7 +1335,7 @@ async def ws_subscription_check(
     its back (reconnect storms + reused websocket command ids can kill a
     fresh subscription via a stale unsubscribe) and re-subscribes.
     """
-    entity = _find_entity(hass, msg["entity_id"])
+    entity = async_get_index(hass).satellite(msg["entity_id"])
     connection.send_result(
         msg["id"],
         {
@@ -975,7 +1365,7 @@ async def ws_cancel_timer(
     entity_id = msg["entity_id"]
     timer_id = msg["timer_id"]
 
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Entity {entity_id} not found"
@@ -1020,7 +1410,7 @@ async def ws_media_player_event(
     volume = msg.get("volume")
     media_id = msg.get("media_id")
 
-    entity = _find_entity(hass, entity_id, lambda e: hasattr(e, "update_playback_state"))
+    entity = async_get_index(hass).media_player(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Media player entity {entity_id} not found"
@@ -1049,16 +1439,15 @@ async def ws_screensaver_state(
     active = msg["active"]
 
     # Find the screensaver binary sensor via the satellite entity's config entry
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         connection.send_error(
             msg["id"], "not_found", f"Entity {entity_id} not found"
         )
         return
 
-    entry_id = entity._entry.entry_id
-    sensor = hass.data.get(DOMAIN, {}).get(f"{entry_id}_screensaver_sensor")
-    if sensor is not None:
-        sensor.set_active(active)
+    siblings = async_get_index(hass).get_entry(entity._entry.entry_id)
+    if siblings is not None and siblings.screensaver_sensor is not None:
+        siblings.screensaver_sensor.set_active(active)
 
     connection.send_result(msg["id"], {"success": True})
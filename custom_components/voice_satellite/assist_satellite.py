@@ -14,6 +14,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.components import intent
@@ -46,77 +47,91 @@ except ImportError:
     HAS_HASSIL = False
 
 
+from .audio_frames import (
+    DEFAULT_AUDIO_FRAME_MS,
+    FrameCoalescer,
+    PreRollBuffer,
+    frame_bytes_for,
+)
+from .audio_queue import AudioFrameQueue, AudioQueueStats
+from .audio_vad import SpeechGate, SpeechGateStats
 from .const import DOMAIN, EVENT_TIMER, INTEGRATION_VERSION
+from .entity_index import RUN_ENTRY_ID, async_get_index
+from .event_coalescer import EventCoalescer, EventRelayStats
+from .inference_pool import async_get_inference_metrics, async_get_inference_pool
+from .pipeline_handoff import RUN_GENERATION, HandoffStats
+from .pipeline_latency import STAGE_RESPONSE, LatencyTracker
+from .stream_session import StreamSession
+from .tts_duration import (
+    async_get_tts_duration_metrics,
+    async_get_tts_duration_prober,
+)
+from .wake_arbitration import (
+    WAKE_ARBITRATION_AREA,
+    WAKE_ARBITRATION_DEFAULT,
+    WAKE_ARBITRATION_GROUPS,
+    WakeArbitrationStats,
+    async_get_wake_arbiter,
+)
+from .wake_word_verify import (
+    VERIFY_AUDIO_TIMEOUT_S,
+    VERIFY_REJECTED,
+    VERIFY_UNVERIFIED,
+    WakeVerifyResult,
+    WakeVerifyStats,
+    async_get_verify_models,
+    verify_wake_word,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 # Timeout for waiting for the card to ACK announcement playback
 ANNOUNCE_TIMEOUT = 120  # seconds
 
-# Layer III bitrate tables (kbps), indexed by the frame header's bitrate
-# field. Index 0 (free format) and 15 (bad) are unusable and skipped.
-_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0)
-_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0)
-# Sample rates (Hz) by MPEG version bits: 3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5.
-_MP3_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
-
-
-def _mp3_frame_walk_duration(data: bytes) -> float:
-    """Exact duration of a Layer III MPEG stream, by walking every frame.
-
-    Streaming TTS engines emit the MP3 as they synthesize it, so they can
-    never seek back to write a Xing/VBRI header. On such a headerless VBR
-    stream mutagen estimates length from the FIRST frame's bitrate alone
-    (filesize * 8 / bitrate), and a low-bitrate leading silence frame
-    inflates the result several-fold - measured 22.56s for a 2.76s reply,
-    which stalled remote TTS completion for the difference. Summing the
-    per-frame sample counts costs microseconds on TTS-sized payloads and
-    is exact regardless of bitrate switching.
-
-    Returns 0.0 when the payload is not a plain Layer III stream (caller
-    falls back to mutagen / wave).
-    """
-    n = len(data)
-    i = 0
-    # Skip a leading ID3v2 tag (syncsafe 28-bit size after the 10-byte header).
-    if n >= 10 and data[:3] == b"ID3":
-        i = 10 + (
-            ((data[6] & 0x7F) << 21)
-            | ((data[7] & 0x7F) << 14)
-            | ((data[8] & 0x7F) << 7)
-            | (data[9] & 0x7F)
-        )
-    seconds = 0.0
-    frames = 0
-    while i + 4 <= n:
-        if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
-            i += 1  # resync over junk between frames
-            continue
-        h1, h2 = data[i + 1], data[i + 2]
-        version = (h1 >> 3) & 0x03  # 3=MPEG1, 2=MPEG2, 0=MPEG2.5, 1=reserved
-        layer = (h1 >> 1) & 0x03  # 1 = Layer III
-        if version == 1 or layer != 1:
-            return 0.0  # not a plain Layer III stream - let mutagen decide
-        br_idx = (h2 >> 4) & 0x0F
-        sr_idx = (h2 >> 2) & 0x03
-        if br_idx in (0, 15) or sr_idx == 3:
-            i += 1  # free-format/bad header - treat as junk and resync
-            continue
-        bitrate = (_MP3_BITRATES_V1 if version == 3 else _MP3_BITRATES_V2)[br_idx] * 1000
-        rate = _MP3_RATES[version][sr_idx]
-        padding = (h2 >> 1) & 0x01
-        # MPEG1 Layer III: 1152 samples per frame; MPEG2/2.5: 576.
-        if version == 3:
-            frame_len = 144 * bitrate // rate + padding
-            seconds += 1152 / rate
-        else:
-            frame_len = 72 * bitrate // rate + padding
-            seconds += 576 / rate
-        if frame_len <= 0:
-            return 0.0
-        i += frame_len
-        frames += 1
-    return seconds if frames else 0.0
+# Sibling entities the satellite reads, as (platform, unique_id suffix).
+# Their entity_ids are resolved once per satellite and cached; the cache
+# is dropped when the entity registry reports a create/rename/remove
+# touching this device, so attribute rendering is plain dict reads.
+_CHILD_ENTITIES: tuple[tuple[str, str], ...] = (
+    ("switch", "_mute"),
+    ("switch", "_wake_sound"),
+    ("switch", "_stop_word"),
+    ("switch", "_mute_timers"),
+    ("switch", "_screensaver"),
+    ("select", "_tts_output"),
+    ("select", "_tts_output_mode_remote"),
+    ("select", "_session_duration"),
+    ("select", "_wake_word_detection"),
+    ("select", "_wake_word_model"),
+    ("select", "_wake_word_model_2"),
+    ("select", "_wake_word_sensitivity"),
+    ("select", "_pipeline_2"),
+    ("select", "_wake_arbitration"),
+    # Framework-owned selects use a dash separator.
+    ("select", "-pipeline"),
+    ("select", "-vad_sensitivity"),
+    ("number", "_announcement_display_duration"),
+)
+
+# Siblings that feed the satellite's config keys. A state change on any
+# of them pushes a `config` delta to subscribed cards (and re-writes the
+# satellite state while a card still reads config from the attributes).
+_TRACKED_CHILD_SUFFIXES: tuple[str, ...] = (
+    "_mute",
+    "_wake_sound",
+    "_stop_word",
+    "_mute_timers",
+    "_screensaver",
+    "_tts_output",
+    "_tts_output_mode_remote",
+    "_announcement_display_duration",
+    "_wake_word_detection",
+    "_wake_word_model",
+    "_wake_word_model_2",
+    "_wake_word_sensitivity",
+    "_pipeline_2",
+    "-pipeline",
+)
 
 
 async def async_setup_entry(
@@ -129,8 +144,7 @@ async def async_setup_entry(
     async_add_entities([entity])
 
     # Store entity reference so __init__.py websocket handler can access it
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entity
+    async_get_index(hass).entry(entry.entry_id).satellite = entity
 
 
 class VoiceSatelliteEntity(AssistSatelliteEntity):
@@ -176,8 +190,26 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         # Bridged pipeline state
         self._pipeline_connection: Any = None  # ActiveConnection for event relay
         self._pipeline_msg_id: int | None = None  # WS message ID for send_event
-        self._pipeline_task: asyncio.Task | None = None  # Current pipeline task
-        self._pipeline_audio_queue: asyncio.Queue | None = None
+        # Current bridged run.  Not HA's _pipeline_task: the base class
+        # clears that in its own finally, which would drop a newer run's
+        # task when a displaced run finishes unwinding after it started.
+        self._bridge_task: asyncio.Task | None = None
+        self._pipeline_audio_queue: AudioFrameQueue | None = None
+        # Persistent audio stream the card starts turns on (stream_session.py).
+        self._stream_session: StreamSession | None = None
+        self._audio_queue_stats = AudioQueueStats()  # cumulative across runs
+        self._preroll = PreRollBuffer()  # audio streamed between runs
+        self._speech_gate_stats = SpeechGateStats()
+        self._wake_verify_stats = WakeVerifyStats()
+        self._wake_arbitration_stats = WakeArbitrationStats()
+        self._handoff_stats = HandoffStats()
+        self._latency = LatencyTracker()
+        self._event_relay_stats = EventRelayStats()
+        # Relay of the current bridged run's events (event_coalescer.py).
+        self._event_relay: EventCoalescer | None = None
+        # Set while a verified run is in its STT stage (monotonic start).
+        self._verified_run = False
+        self._stt_started_at: float | None = None
         self._pipeline_gen: int = 0  # Generation counter - filters orphaned events
         self._pipeline_run_started: bool = False  # Gate: block events until run-start
         self._conversation_id: str | None = None
@@ -191,6 +223,21 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         # Satellite event subscription (Phase 2 - direct push to card)
         self._satellite_subscribers: list[tuple[Any, int]] = []
 
+        # Sibling entity_ids keyed by unique_id suffix (see _CHILD_ENTITIES).
+        # None until first use and after an entity registry change.
+        self._child_eids: dict[str, str | None] | None = None
+        self._unsub_child_tracking: Callable[[], None] | None = None
+
+        # Config channel: last config snapshot pushed to cards, its revision
+        # (bumped on every delta), and the subscribers that opted in. While
+        # every subscriber reads config from this channel, sibling changes
+        # skip the satellite state write; _config_state_stale remembers that
+        # the attributes lag behind until the next write.
+        self._config: dict[str, Any] = {}
+        self._config_revision: int = 0
+        self._config_subscribers: list[tuple[Any, int]] = []
+        self._config_state_stale: bool = False
+
     @property
     def available(self) -> bool:
         """Entity is available only when a card is connected via subscribe_events.
@@ -224,11 +271,8 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         entity. This lets HA core's internal pipeline resolution pick the
         right pipeline without us bypassing async_accept_pipeline_from_satellite.
         """
-        registry = er.async_get(self.hass)
         if getattr(self, "_active_wake_word_slot", 1) == 2:
-            slot2_eid = registry.async_get_entity_id(
-                "select", DOMAIN, f"{self._entry.entry_id}_pipeline_2"
-            )
+            slot2_eid = self._child_entity_id("_pipeline_2")
             if slot2_eid:
                 state = self.hass.states.get(slot2_eid)
                 # "Preferred" means fall back to the slot 1 pipeline below.
@@ -238,33 +282,53 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
                     and state.state not in ("unknown", "unavailable", PIPELINE_2_PREFERRED)
                 ):
                     return slot2_eid
-        return registry.async_get_entity_id(
-            "select", DOMAIN, f"{self._entry.entry_id}-pipeline"
-        )
+        return self._child_entity_id("-pipeline")
 
     @property
     def vad_sensitivity_entity_id(self) -> str | None:
         """Entity ID of the VAD sensitivity select entity."""
-        registry = er.async_get(self.hass)
-        return registry.async_get_entity_id(
-            "select", DOMAIN, f"{self._entry.entry_id}-vad_sensitivity"
-        )
+        return self._child_entity_id("-vad_sensitivity")
 
-    def _get_child_state(
-        self, registry: er.EntityRegistry, platform: str, suffix: str
-    ):
-        """Look up a child entity state by platform and unique_id suffix."""
-        eid = registry.async_get_entity_id(
-            platform, DOMAIN, f"{self._entry.entry_id}{suffix}"
-        )
+    def _vad_silence_seconds(self) -> float | None:
+        """HA's end-of-speech silence for this satellite's VAD sensitivity."""
+        try:
+            from homeassistant.components.assist_pipeline.vad import (
+                VadSensitivity,
+            )
+        except ImportError:
+            return None
+        s = self._get_child_state("-vad_sensitivity")
+        try:
+            return VadSensitivity.to_seconds(
+                VadSensitivity(s.state) if s else VadSensitivity.DEFAULT
+            )
+        except ValueError:
+            return None
+
+    def _child_entity_id(self, suffix: str) -> str | None:
+        """Resolve a sibling entity_id by unique_id suffix (cached)."""
+        child_eids = self._child_eids
+        if child_eids is None:
+            registry = er.async_get(self.hass)
+            entry_id = self._entry.entry_id
+            child_eids = self._child_eids = {
+                child_suffix: registry.async_get_entity_id(
+                    platform, DOMAIN, f"{entry_id}{child_suffix}"
+                )
+                for platform, child_suffix in _CHILD_ENTITIES
+            }
+        return child_eids.get(suffix)
+
+    def _get_child_state(self, suffix: str):
+        """Look up a child entity state by unique_id suffix."""
+        eid = self._child_entity_id(suffix)
         return self.hass.states.get(eid) if eid else None
 
     def _get_session_duration_seconds(self) -> int | None:
         """Return the configured session duration in seconds, or None for persistent."""
         from .select import SESSION_DURATION_SECONDS
 
-        registry = er.async_get(self.hass)
-        s = self._get_child_state(registry, "select", "_session_duration")
+        s = self._get_child_state("_session_duration")
         if s is not None and s.state in SESSION_DURATION_SECONDS:
             return SESSION_DURATION_SECONDS[s.state]
         return None  # Default: persistent (never expire)
@@ -272,45 +336,59 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Expose timer and config state for the card to read."""
-        attrs: dict[str, Any] = {
+        return {
             "active_timers": self._active_timers,
             "last_timer_event": self._last_timer_event,
+            **self._config_attributes(),
+            # Expose the server-side integration version. The client reads
+            # this to detect stale bundles (browser cached an older version)
+            # and surface an "update available" notice at runtime.
+            "integration_version": INTEGRATION_VERSION,
         }
 
-        registry = er.async_get(self.hass)
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state; the config attributes are current again."""
+        self._config_state_stale = False
+        super().async_write_ha_state()
+
+    def _config_attributes(self) -> dict[str, Any]:
+        """Config keys mirrored from the sibling switches/selects/numbers.
+
+        Shared by the state attributes and the `config` satellite event.
+        """
+        attrs: dict[str, Any] = {}
 
         # Expose mute and wake sound switch states for the card
-        s = self._get_child_state(registry, "switch", "_mute")
+        s = self._get_child_state("_mute")
         if s is not None:
             attrs["muted"] = s.state == "on"
 
-        s = self._get_child_state(registry, "switch", "_wake_sound")
+        s = self._get_child_state("_wake_sound")
         if s is not None:
             attrs["wake_sound"] = s.state == "on"
 
-        s = self._get_child_state(registry, "switch", "_stop_word")
+        s = self._get_child_state("_stop_word")
         if s is not None:
             attrs["stop_word"] = s.state == "on"
 
-        s = self._get_child_state(registry, "switch", "_mute_timers")
+        s = self._get_child_state("_mute_timers")
         if s is not None:
             attrs["mute_timers"] = s.state == "on"
 
-        s = self._get_child_state(registry, "switch", "_screensaver")
+        s = self._get_child_state("_screensaver")
         if s is not None:
             attrs["screensaver"] = s.state == "on"
 
         # Expose TTS output select entity_id for the card
-        s = self._get_child_state(registry, "select", "_tts_output")
+        s = self._get_child_state("_tts_output")
         if s and s.state not in ("Browser", "unknown", "unavailable"):
             attrs["tts_target"] = s.attributes.get("entity_id", "")
         elif s:
             attrs["tts_target"] = ""
 
         # Expose announcement display duration for the card
-        s = self._get_child_state(
-            registry, "number", "_announcement_display_duration"
-        )
+        s = self._get_child_state("_announcement_display_duration")
         if s and s.state not in ("unknown", "unavailable"):
             try:
                 attrs["announcement_display_duration"] = int(float(s.state))
@@ -326,25 +404,18 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
             ("_pipeline_2", "pipeline_2"),
             ("_tts_output_mode_remote", "tts_output_mode_remote"),
         ):
-            s = self._get_child_state(registry, "select", suffix)
+            s = self._get_child_state(suffix)
             if s and s.state not in ("unknown", "unavailable"):
                 attrs[attr_key] = s.state
 
-        # Expose the active pipeline display name. The pipeline select is
-        # owned by HA core's assist_satellite base class, so we read it
-        # directly by its entity_id rather than via the registry suffix.
-        pid = self.pipeline_entity_id
-        pipeline_name: str | None = None
-        if pid:
-            s = self.hass.states.get(pid)
-            if s and s.state not in ("unknown", "unavailable"):
-                pipeline_name = s.state
-                attrs["pipeline"] = s.state
-
-        # Expose the server-side integration version. The client reads
-        # this to detect stale bundles (browser cached an older version)
-        # and surface an "update available" notice at runtime.
-        attrs["integration_version"] = INTEGRATION_VERSION
+        # Expose the Pipeline 1 display name. The pipeline select is owned
+        # by HA core's assist_satellite base class (dash-separated unique
+        # id). Read slot 1 directly rather than via pipeline_entity_id, which
+        # points at Pipeline 2 during a slot 2 run - config must not flip
+        # with the active run.
+        s = self._get_child_state("-pipeline")
+        if s and s.state not in ("unknown", "unavailable"):
+            attrs["pipeline"] = s.state
 
         return attrs
 
@@ -366,10 +437,87 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         return self._question_match_result
 
     @property
-    def pipeline_audio_queue(self) -> asyncio.Queue | None:
+    def pipeline_audio_queue(self) -> AudioFrameQueue | None:
         """Return the current pipeline audio queue."""
         return self._pipeline_audio_queue
 
+    @property
+    def preroll(self) -> PreRollBuffer:
+        """Return the buffer of audio streamed between runs."""
+        return self._preroll
+
+    @property
+    def audio_queue_stats(self) -> AudioQueueStats:
+        """Return the cumulative audio ingest counters."""
+        return self._audio_queue_stats
+
+    @property
+    def handoff_stats(self) -> HandoffStats:
+        """Return the cumulative pipeline handoff timings."""
+        return self._handoff_stats
+
+    @property
+    def latency(self) -> LatencyTracker:
+        """Return the per-stage pipeline latencies."""
+        return self._latency
+
+    @property
+    def wake_arbitration_stats(self) -> WakeArbitrationStats:
+        """Return the cumulative wake arbitration results."""
+        return self._wake_arbitration_stats
+
+    @property
+    def wake_arbitration_group(self) -> str | None:
+        """Return the wake arbitration group, or None if this never competes."""
+        s = self._get_child_state("_wake_arbitration")
+        option = s.state if s is not None else WAKE_ARBITRATION_DEFAULT
+        if option in WAKE_ARBITRATION_GROUPS:
+            return option
+        if option != WAKE_ARBITRATION_AREA:
+            return None
+        area_id = self.registry_entry.area_id if self.registry_entry else None
+        if area_id is None and self.device_entry is not None:
+            area_id = self.device_entry.area_id
+        return f"area:{area_id}" if area_id is not None else None
+
+    @property
+    def is_live(self) -> bool:
+        """Return True if a card is connected or a pipeline run is going."""
+        if self._satellite_subscribers:
+            return True
+        return self._bridge_task is not None and not self._bridge_task.done()
+
+    @property
+    def stop_word_enabled(self) -> bool:
+        """Return True if the satellite's stop word switch is on."""
+        s = self._get_child_state("_stop_word")
+        return s is not None and s.state == "on"
+
+    @callback
+    def async_stop_word_detected(self) -> None:
+        """Tell the card a server-side detector heard the stop word."""
+        self._push_satellite_event("stop_word", {})
+
+    @callback
+    def get_metrics(self) -> dict[str, Any]:
+        """Return runtime metrics for the voice_satellite/get_metrics command."""
+        queue = self._pipeline_audio_queue
+        return {
+            "audio_queue": {
+                **self._audio_queue_stats.as_dict(),
+                "depth_frames": queue.qsize() if queue is not None else 0,
+                "depth_bytes": queue.depth_bytes if queue is not None else 0,
+            },
+            "vad_gate": self._speech_gate_stats.as_dict(),
+            "wake_verify": self._wake_verify_stats.as_dict(),
+            "wake_arbitration": self._wake_arbitration_stats.as_dict(),
+            "pipeline_handoff": self._handoff_stats.as_dict(),
+            "pipeline_latency": self._latency.summary(),
+            "event_relay": self._event_relay_stats.as_dict(),
+            "inference_pool": async_get_inference_metrics(self.hass),
+            "tts_duration": async_get_tts_duration_metrics(self.hass),
+        }
+
     @property
     def pipeline_connection(self):
         """Return the current pipeline WebSocket connection."""
@@ -381,14 +529,24 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         return self._pipeline_msg_id
 
     @property
-    def pipeline_task(self) -> asyncio.Task | None:
-        """Return the current pipeline background task."""
-        return self._pipeline_task
+    def bridge_task(self) -> asyncio.Task | None:
+        """Return the current bridged pipeline background task."""
+        return self._bridge_task
+
+    @bridge_task.setter
+    def bridge_task(self, task: asyncio.Task | None) -> None:
+        """Set the current bridged pipeline background task."""
+        self._bridge_task = task
+
+    @property
+    def stream_session(self) -> StreamSession | None:
+        """Return the card's persistent streaming session, if one is open."""
+        return self._stream_session
 
-    @pipeline_task.setter
-    def pipeline_task(self, task: asyncio.Task | None) -> None:
-        """Set the current pipeline background task."""
-        self._pipeline_task = task
+    @stream_session.setter
+    def stream_session(self, session: StreamSession | None) -> None:
+        """Set the card's persistent streaming session."""
+        self._stream_session = session
 
     async def async_added_to_hass(self) -> None:
         """Register timer handler when entity is added."""
@@ -399,6 +557,9 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
                 f"device_entry must be set before async_added_to_hass ({self.entity_id})"
             )
 
+        # Index under the (possibly just renamed) entity_id for WS lookups
+        async_get_index(self.hass).add_satellite(self)
+
         # Register this device as a timer handler
         self.async_on_remove(
             intent.async_register_timer_handler(
@@ -410,39 +571,16 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
 
         # When sibling entities change, re-write our state so
         # extra_state_attributes are re-evaluated and the card sees updates.
-        registry = er.async_get(self.hass)
-        tracked_eids = []
-        for suffix in ("_mute", "_wake_sound", "_stop_word", "_mute_timers"):
-            eid = registry.async_get_entity_id(
-                "switch", DOMAIN, f"{self._entry.entry_id}{suffix}"
+        # Registry changes (sibling created, renamed or removed) drop the
+        # cached entity_id map and re-point the state tracking.
+        self._async_track_children()
+        self._config = self._config_attributes()
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._on_entity_registry_updated,
             )
-            if eid:
-                tracked_eids.append(eid)
-        tts_eid = registry.async_get_entity_id(
-            "select", DOMAIN, f"{self._entry.entry_id}_tts_output"
         )
-        if tts_eid:
-            tracked_eids.append(tts_eid)
-        ann_dur_eid = registry.async_get_entity_id(
-            "number", DOMAIN,
-            f"{self._entry.entry_id}_announcement_display_duration"
-        )
-        if ann_dur_eid:
-            tracked_eids.append(ann_dur_eid)
-        for suffix in ("_wake_word_detection", "_wake_word_model", "_wake_word_sensitivity"):
-            eid = registry.async_get_entity_id(
-                "select", DOMAIN, f"{self._entry.entry_id}{suffix}"
-            )
-            if eid:
-                tracked_eids.append(eid)
-        if tracked_eids:
-            self.async_on_remove(
-                async_track_state_change_event(
-                    self.hass,
-                    tracked_eids,
-                    self._on_switch_state_change,
-                )
-            )
 
         _LOGGER.info(
             "Voice Satellite '%s' registered (device_id: %s)",
@@ -452,6 +590,11 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when entity is removed (e.g. integration reload)."""
+        async_get_index(self.hass).remove_satellite(self)
+        if self._unsub_child_tracking is not None:
+            self._unsub_child_tracking()
+            self._unsub_child_tracking = None
+
         # Notify pipeline subscriber that the entity is being torn down
         if self._pipeline_connection and self._pipeline_msg_id:
             try:
@@ -467,14 +610,25 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         if self._pipeline_audio_queue is not None:
             self._pipeline_audio_queue.put_nowait(b"")
 
-        if self._pipeline_task and not self._pipeline_task.done():
+        # The session's binary handler points at this entity: close it and
+        # tell the card to open a new one on the reloaded entity.
+        session = self._stream_session
+        if session is not None:
+            self._stream_session = None
+            session.close()
+            try:
+                session.connection.send_event(session.msg_id, {"type": "reload"})
+            except Exception:
+                pass
+
+        if self._bridge_task and not self._bridge_task.done():
             done, _ = await asyncio.wait(
-                {self._pipeline_task}, timeout=5.0
+                {self._bridge_task}, timeout=5.0
             )
             if not done:
-                self._pipeline_task.cancel()
+                self._bridge_task.cancel()
                 try:
-                    await self._pipeline_task
+                    await self._bridge_task
                 except (asyncio.CancelledError, Exception):
                     pass
 
@@ -492,13 +646,83 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
             except Exception:
                 pass
         self._satellite_subscribers.clear()
+        self._config_subscribers.clear()
 
         await super().async_will_remove_from_hass()
 
     @callback
     def _on_switch_state_change(self, _event) -> None:
-        """Re-write state when mute/wake_sound switches change."""
-        self.async_write_ha_state()
+        """Push changed config keys when a sibling switch/select changes.
+
+        Cards subscribed with config_events receive only the changed keys
+        (removed keys as None) under a new revision. The satellite state is
+        re-written only while some subscriber still reads config from the
+        entity attributes; otherwise the sibling's own state_changed is the
+        only one Home Assistant emits for the edit.
+        """
+        config = self._config_attributes()
+        changes = {
+            key: config.get(key)
+            for key in config.keys() | self._config.keys()
+            if config.get(key) != self._config.get(key)
+        }
+        if not changes:
+            return
+        self._config = config
+        self._config_revision += 1
+        self._push_config_event(changes, full=False)
+
+        if self._has_attribute_config_reader():
+            self.async_write_ha_state()
+        else:
+            self._config_state_stale = True
+
+    @callback
+    def _has_attribute_config_reader(self) -> bool:
+        """Whether config must still reach subscribers via state attributes."""
+        if not self._satellite_subscribers:
+            # Nobody connected: keep the attributes current for templates.
+            return True
+        return any(
+            sub not in self._config_subscribers
+            for sub in self._satellite_subscribers
+        )
+
+    @callback
+    def _async_track_children(self) -> None:
+        """(Re)subscribe to state changes of the tracked sibling entities."""
+        if self._unsub_child_tracking is not None:
+            self._unsub_child_tracking()
+            self._unsub_child_tracking = None
+        tracked_eids = [
+            eid
+            for suffix in _TRACKED_CHILD_SUFFIXES
+            if (eid := self._child_entity_id(suffix))
+        ]
+        if tracked_eids:
+            self._unsub_child_tracking = async_track_state_change_event(
+                self.hass,
+                tracked_eids,
+                self._on_switch_state_change,
+            )
+
+    @callback
+    def _on_entity_registry_updated(self, event) -> None:
+        """Drop the sibling entity_id cache when one of our siblings changes."""
+        data = event.data
+        known = set((self._child_eids or {}).values())
+        if data["action"] == "create":
+            reg_entry = er.async_get(self.hass).async_get(data["entity_id"])
+            if reg_entry is None or reg_entry.config_entry_id != self._entry.entry_id:
+                return
+        elif (
+            data["entity_id"] not in known
+            and data.get("old_entity_id") not in known
+        ):
+            return
+        self._child_eids = None
+        self._async_track_children()
+        self._on_switch_state_change(None)
 
     @callback
     def async_get_configuration(self) -> AssistSatelliteConfiguration:
@@ -719,13 +943,9 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
             )
             return async_get_pipeline(self.hass)
 
-        registry = er.async_get(self.hass)
-
         # Slot 2 — fall through to slot 1 when "Preferred".
         if pipeline_param == 2:
-            slot2_eid = registry.async_get_entity_id(
-                "select", DOMAIN, f"{self._entry.entry_id}_pipeline_2"
-            )
+            slot2_eid = self._child_entity_id("_pipeline_2")
             if slot2_eid:
                 state = self.hass.states.get(slot2_eid)
                 if (
@@ -737,9 +957,7 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
                             return p
 
         # Slot 1 (or fall-through from slot 2 = Preferred).
-        slot1_eid = registry.async_get_entity_id(
-            "select", DOMAIN, f"{self._entry.entry_id}-pipeline"
-        )
+        slot1_eid = self._child_entity_id("-pipeline")
         if slot1_eid:
             state = self.hass.states.get(slot1_eid)
             if state:
@@ -1138,6 +1356,8 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
 
         self._pipeline_gen += 1
         my_gen = self._pipeline_gen
+        # Tags every event this run emits (see on_pipeline_event).
+        RUN_GENERATION.set(my_gen)
         self._pipeline_connection = connection
         self._pipeline_msg_id = msg_id
         self._pipeline_audio_queue = None
@@ -1174,7 +1394,7 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
                 self._satellite_name,
                 exc_info=True,
             )
-            self._send_text_pipeline_error(
+            self._send_pipeline_error(
                 connection,
                 msg_id,
                 "pipeline-not-found",
@@ -1236,7 +1456,7 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
             # the framework's PipelineInput.execute() emits ERROR + run-end
             # itself in its own try/except, so we'd duplicate.
             if not self._pipeline_run_started:
-                self._send_text_pipeline_error(
+                self._send_pipeline_error(
                     connection,
                     msg_id,
                     "pipeline-setup-failed",
@@ -1248,7 +1468,7 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
                 self._pipeline_msg_id = None
                 self._pipeline_audio_queue = None
 
-    def _send_text_pipeline_error(
+    def _send_pipeline_error(
         self,
         connection,
         msg_id: int,
@@ -1261,7 +1481,9 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         emits its own events, the frontend's ShowManager would otherwise
         wait forever (overlay + chime, no further events). The pipeline
         event handlers gate on run-start, so we send a minimal trio that
-        passes the gate and triggers handleError → show.dismiss().
+        passes the gate and triggers handleError → show.dismiss().  Audio
+        runs ended before HA's pipeline starts (a rejected wake word) go
+        through here for the same reason.
         """
         try:
             connection.send_event(
@@ -1279,7 +1501,7 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
 
     async def async_run_pipeline(
         self,
-        audio_queue: asyncio.Queue,
+        audio_queue: AudioFrameQueue,
         connection,
         msg_id: int,
         start_stage: str,
@@ -1288,11 +1510,34 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         extra_system_prompt: str | None = None,
         wake_word_phrase: str | None = None,
         wake_word_slot: int | None = None,
+        frame_ms: int = DEFAULT_AUDIO_FRAME_MS,
+        vad_gate_hangover_ms: int | None = None,
+        verify_wake_word: str | None = None,
+        verify_preroll_ms: int = 0,
+        wake_word_score: float | None = None,
+        wake_word_energy: float | None = None,
+        wake_word_engine: str | None = None,
+        wake_word_model: str | None = None,
     ) -> None:
         """Run a bridged pipeline - relay events back to the card via WS.
 
         Called by the ws_run_pipeline handler. Audio comes in via the queue,
-        pipeline events go back through connection.send_event().
+        pipeline events go back through connection.send_event().  The card's
+        variable-size batches are re-cut into fixed frame_ms frames.
+
+        vad_gate_hangover_ms enables the server-side speech gate (stt runs
+        only): leading silence is dropped and the stream ends after that
+        much trailing silence.
+
+        verify_wake_word re-checks a browser wake word detection (stt runs
+        only): the first verify_preroll_ms of audio is the card's
+        pre-roll, re-scored by wake_word_verify.py before STT starts.
+
+        An stt run opened by a wake word (wake_word_phrase set) then goes
+        through wake_arbitration.py against the other satellites of its
+        group; wake_word_score / wake_word_energy are the card's
+        detection score and speech level, and wake_word_engine /
+        wake_word_model what produced the score.
 
         wake_word_slot (1 or 2) controls which pipeline is used: slot 2
         reroutes the framework's pipeline resolution to the Pipeline 2
@@ -1300,6 +1545,10 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         """
         self._pipeline_gen += 1
         my_gen = self._pipeline_gen
+        # Tags every event this run emits (see on_pipeline_event).
+        RUN_GENERATION.set(my_gen)
+        # Tells the in-process wake word entities whose audio this is.
+        RUN_ENTRY_ID.set(self._entry.entry_id)
         self._pipeline_connection = connection
         self._pipeline_msg_id = msg_id
         self._pipeline_audio_queue = audio_queue
@@ -1352,12 +1601,56 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
             "tts": PipelineStage.TTS,
         }
 
+        coalescer = FrameCoalescer(frame_ms)
+        gate = None
+        if vad_gate_hangover_ms is not None and start_stage == "stt":
+            gate = SpeechGate(
+                frame_ms,
+                self._speech_gate_stats,
+                hangover_ms=vad_gate_hangover_ms,
+                ha_silence_s=self._vad_silence_seconds(),
+            )
+
+        # The gate's per-frame DSP runs on the inference pool, one job
+        # per queued chunk.
+        pool = async_get_inference_pool(self.hass)
+
+        def _gate_frames(frames: list[bytes]) -> list[bytes]:
+            return [gated for frame in frames for gated in gate.process(frame)]
+
+        # Live audio that arrived behind the verification pre-roll.
+        head = b""
+
         async def audio_stream():
-            while True:
-                chunk = await audio_queue.get()
-                if not chunk:  # empty bytes = stop signal
-                    break
-                yield chunk
+            nonlocal head
+            try:
+                while True:
+                    if head:
+                        chunk, head = head, b""
+                    else:
+                        chunk = await audio_queue.get()
+                        if not chunk:  # empty bytes = stop signal
+                            break
+                    frames = coalescer.push(chunk)
+                    if gate is None:
+                        for frame in frames:
+                            yield frame
+                        continue
+                    for gated in await pool.async_run(_gate_frames, list(frames)):
+                        yield gated
+                    if gate.closed:
+                        _LOGGER.debug(
+                            "Speech gate closed the stt stream for '%s'",
+                            self._satellite_name,
+                        )
+                        return
+                tail = coalescer.flush()
+                if tail:
+                    for gated in await pool.async_run(_gate_frames, [tail]) if gate else (tail,):
+                        yield gated
+            finally:
+                if gate is not None:
+                    gate.finish()
 
         _LOGGER.debug(
             "Bridged pipeline starting for '%s' (start=%s, end=%s)",
@@ -1367,6 +1660,28 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
         )
 
         try:
+            self._verified_run = False
+            self._stt_started_at = None
+            if verify_wake_word is not None and start_stage == "stt":
+                verified = await self._async_verify_wake_word(
+                    audio_queue, connection, msg_id, verify_wake_word, verify_preroll_ms
+                )
+                if verified is None:
+                    return
+                head = verified
+                self._verified_run = True
+            if wake_word_phrase is not None and start_stage == "stt":
+                scorer = (
+                    f"{wake_word_engine}:{wake_word_model}"
+                    if wake_word_engine and wake_word_model
+                    else None
+                )
+                won = await async_get_wake_arbiter(self.hass).async_arbitrate(
+                    self, wake_word_score, wake_word_energy, scorer
+                )
+                if not won:
+                    self._send_wake_arbitration_lost(connection, msg_id)
+                    return
             await self.async_accept_pipeline_from_satellite(
                 audio_stream(),
                 start_stage=stage_map.get(
@@ -1383,10 +1698,126 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
                 self._pipeline_msg_id = None
                 self._pipeline_audio_queue = None
                 self._active_wake_word_slot = 1
+                # The run's tail is not the next run's pre-roll.
+                self._preroll.clear()
+
+    async def _async_verify_wake_word(
+        self,
+        audio_queue: AudioFrameQueue,
+        connection,
+        msg_id: int,
+        wake_word: str,
+        preroll_ms: int,
+    ) -> bytes | None:
+        """Re-score the card's pre-roll before an stt run starts.
+
+        Returns the live audio that arrived behind the pre-roll, or None
+        if the run must not go on (wake word rejected, stream stopped).
+        """
+        want = frame_bytes_for(preroll_ms)
+        parts: list[bytes] = []
+        have = 0
+        try:
+            async with asyncio.timeout(VERIFY_AUDIO_TIMEOUT_S):
+                while have < want:
+                    chunk = await audio_queue.get()
+                    if not chunk:  # stopped before the pre-roll arrived
+                        return None
+                    parts.append(chunk)
+                    have += len(chunk)
+        except TimeoutError:
+            _LOGGER.debug(
+                "Wake word pre-roll for '%s' incomplete (%d of %d bytes)",
+                self._satellite_name,
+                have,
+                want,
+            )
+        audio = b"".join(parts)
+
+        if have < want:
+            # A partial pre-roll is still the wake word: keep it out of STT.
+            self._wake_verify_stats.record(wake_word, WakeVerifyResult(VERIFY_UNVERIFIED))
+            return b""
+        models = await async_get_verify_models(self.hass)
+        result = await async_get_inference_pool(self.hass).async_run(
+            verify_wake_word, wake_word, audio[:want], models
+        )
+        self._wake_verify_stats.record(wake_word, result)
+        _LOGGER.debug(
+            "Wake word verification for '%s': %s %s (%s, score=%s)",
+            self._satellite_name,
+            wake_word,
+            result.outcome,
+            result.engine,
+            result.score,
+        )
+        if result.outcome != VERIFY_REJECTED:
+            return audio[want:]
+
+        self._send_pipeline_error(
+            connection,
+            msg_id,
+            "wake_word_rejected",
+            f"Wake word {wake_word} not confirmed by the server",
+        )
+        return None
+
+    def _send_wake_arbitration_lost(self, connection, msg_id: int) -> None:
+        """End a wake run that another satellite of the group won."""
+        stats = self._wake_arbitration_stats.last or {}
+        _LOGGER.debug(
+            "Wake word on '%s' lost arbitration in %s to %s",
+            self._satellite_name,
+            stats.get("group"),
+            stats.get("winner"),
+        )
+        self._send_pipeline_error(
+            connection,
+            msg_id,
+            "wake_arbitration_lost",
+            f"Wake word handled by {stats.get('winner')}",
+        )
+
+    def _is_displaced_event(self, event) -> bool:
+        """Return True for an event of a displaced run that is still unwinding.
+
+        A new run starts without waiting for the one it displaced (see
+        pipeline_handoff.py).  The old run's events carry its generation
+        in their task context and must not reach the new run's card.
+        """
+        gen = RUN_GENERATION.get()
+        if gen is None or gen == self._pipeline_gen:
+            return False
+        _LOGGER.debug(
+            "Dropping event of displaced run %d for '%s': %s",
+            gen,
+            self._satellite_name,
+            getattr(event, "type", event),
+        )
+        return True
+
+    # The base class moves the satellite state on each stage event in
+    # _internal_on_pipeline_event, then calls on_pipeline_event.  It is
+    # private but present in every HA release since the 2025.6.1 minimum
+    # in hacs.json; where it exists, a displaced run's events skip the
+    # state change and go straight to on_pipeline_event, which drops
+    # them.  Should HA rename it, on_pipeline_event still keeps them from
+    # the card and the new run's next stage event restores the state.
+    if hasattr(AssistSatelliteEntity, "_internal_on_pipeline_event"):
+
+        @callback
+        def _internal_on_pipeline_event(self, event) -> None:
+            """Keep a displaced run from moving the satellite state."""
+            if RUN_GENERATION.get() in (None, self._pipeline_gen):
+                super()._internal_on_pipeline_event(event)
+            else:
+                self.on_pipeline_event(event)
 
     @callback
     def on_pipeline_event(self, event) -> None:
         """Handle pipeline events - relay to card if bridged pipeline active."""
+        if self._is_displaced_event(event):
+            return
         event_type = getattr(event, "type", str(event))
         event_type_str = str(event_type)
 
@@ -1409,15 +1840,23 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
             event_type_str,
         )
 
+        stage = self._latency.on_event(event_type_str)
+        if stage is not None:
+            self._async_update_latency_sensors(stage)
+
+        # STT time of verified runs - the cost a rejection saves.
+        if self._verified_run:
+            if event_type_str == "stt-start":
+                self._stt_started_at = time.monotonic()
+            elif event_type_str == "stt-end" and self._stt_started_at is not None:
+                self._wake_verify_stats.record_stt(
+                    time.monotonic() - self._stt_started_at
+                )
+                self._stt_started_at = None
+
         if self._pipeline_connection and self._pipeline_msg_id:
             event_data = getattr(event, "data", None) or {}
-            self._pipeline_connection.send_event(
-                self._pipeline_msg_id,
-                {
-                    "type": event_type_str,
-                    "data": event_data,
-                },
-            )
+            self._relay_for_run().relay(event_type_str, event_data)
 
             # After forwarding tts-end, measure audio duration and send
             # to card.  Capture connection/msg_id now — the pipeline's
@@ -1431,91 +1870,71 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
                         self._send_tts_audio_duration(tts_url)
                     )
 
+    @callback
+    def _relay_for_run(self) -> EventCoalescer:
+        """Return the current run's event relay, replacing a previous run's."""
+        relay = self._event_relay
+        if (
+            relay is None
+            or relay.connection is not self._pipeline_connection
+            or relay.msg_id != self._pipeline_msg_id
+        ):
+            if relay is not None:
+                relay.flush()
+            relay = self._event_relay = EventCoalescer(
+                self.hass.loop,
+                self._pipeline_connection,
+                self._pipeline_msg_id,
+                self._event_relay_stats,
+            )
+        return relay
+
+    @callback
+    def tts_playback_started(self) -> None:
+        """Handle the card's ACK that a run's TTS audio started playing."""
+        if self._latency.on_first_audio():
+            self._async_update_latency_sensors(STAGE_RESPONSE)
+
+    @callback
+    def _async_update_latency_sensors(self, stage: str) -> None:
+        siblings = async_get_index(self.hass).get_entry(self._entry.entry_id)
+        if siblings is None:
+            return
+        for sensor in siblings.latency_sensors:
+            if sensor.stage == stage and sensor.hass is not None:
+                sensor.async_write_ha_state()
+
     async def _send_tts_audio_duration(self, tts_url: str) -> None:
         """Measure TTS audio duration and send to card.
 
-        Fetches the audio from the TTS proxy URL (no auth needed — the
-        token in the URL is the secret) and measures duration with mutagen
-        or the stdlib wave module. The finally block guarantees the event
-        is always sent so the card never hangs.
+        The measurement is shared by every satellite asking about the same
+        URL (see tts_duration.py); while a slow stream is still coming in,
+        interim lower bounds are sent as `final: false` events.  The
+        finally block guarantees the final event is always sent so the
+        card never hangs.
 
         Sends the result via the satellite subscription (always alive),
         not the pipeline subscription (cleaned up after run-end).
         """
-        duration = 0
-        try:
-            import io
-
-            from homeassistant.helpers.aiohttp_client import (
-                async_get_clientsession,
-            )
-            from homeassistant.helpers.network import get_url
 
-            # tts_url may be a relative path (/api/tts_proxy/...)
-            # or a full URL (https://host/api/tts_proxy/...) from announcements.
-            if tts_url.startswith(("http://", "https://")):
-                full_url = tts_url
-            else:
-                try:
-                    base_url = get_url(self.hass, prefer_external=False)
-                except Exception:
-                    base_url = "http://127.0.0.1:8123"
-                full_url = f"{base_url}{tts_url}"
-
-            _LOGGER.debug(
-                "Measuring TTS duration for '%s': %s",
-                self._satellite_name,
-                full_url,
+        @callback
+        def _on_interim(estimate: float) -> None:
+            self._push_satellite_event(
+                "tts-audio-duration",
+                {"duration": estimate, "tts_url": tts_url, "final": False},
             )
 
-            session = async_get_clientsession(self.hass)
-            async with session.get(full_url) as resp:
-                if resp.status == 200:
-                    audio_data = await resp.read()
-
-                    # MP3 first, by exact frame walk. Streaming TTS produces
-                    # VBR MP3 with no Xing header, which mutagen can only
-                    # estimate - several-fold too long when a low-bitrate
-                    # silence frame leads the stream (see the helper).
-                    try:
-                        duration = round(_mp3_frame_walk_duration(audio_data), 2)
-                    except Exception:
-                        duration = 0
-
-                    # mutagen for everything else (FLAC, OGG, framed MP3...)
-                    if not duration:
-                        try:
-                            import mutagen
-
-                            audio_file = mutagen.File(io.BytesIO(audio_data))
-                            if audio_file is not None and audio_file.info and audio_file.info.length:
-                                duration = round(audio_file.info.length, 2)
-                        except Exception:
-                            pass
-
-                    # Fallback: stdlib wave module for WAV/PCM
-                    if not duration:
-                        try:
-                            import wave
-
-                            with wave.open(io.BytesIO(audio_data)) as w:
-                                duration = round(
-                                    w.getnframes() / w.getframerate(), 2
-                                )
-                        except Exception:
-                            pass
-                    if duration:
-                        _LOGGER.debug(
-                            "TTS audio duration for '%s': %.2fs",
-                            self._satellite_name,
-                            duration,
-                        )
-                else:
-                    _LOGGER.warning(
-                        "TTS proxy returned %d for '%s'",
-                        resp.status,
-                        self._satellite_name,
-                    )
+        duration = 0.0
+        try:
+            duration = await async_get_tts_duration_prober(
+                self.hass
+            ).async_get_duration(tts_url, _on_interim)
+            if duration:
+                _LOGGER.debug(
+                    "TTS audio duration for '%s': %.2fs",
+                    self._satellite_name,
+                    duration,
+                )
         except Exception:
             _LOGGER.warning(
                 "Failed to measure TTS audio duration for '%s'",
@@ -1532,22 +1951,48 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
 
     @callback
     def register_satellite_subscription(
-        self, connection, msg_id: int
+        self, connection, msg_id: int, config_events: bool = False
     ) -> None:
-        """Register a WS subscriber for satellite events."""
+        """Register a WS subscriber for satellite events.
+
+        config_events opts the subscriber into the `config` event channel;
+        call send_config_snapshot() once the subscription is confirmed.
+        """
         was_empty = not self._satellite_subscribers
         self._satellite_subscribers.append((connection, msg_id))
+        if config_events:
+            self._config_subscribers.append((connection, msg_id))
         _LOGGER.debug(
             "Satellite subscription registered for '%s' (msg_id=%d, total=%d)",
             self._satellite_name,
             msg_id,
             len(self._satellite_subscribers),
         )
-        # First subscriber -> entity becomes available
-        if was_empty:
+        # First subscriber -> entity becomes available. A subscriber that
+        # reads config from the attributes also needs them brought current.
+        if was_empty or (not config_events and self._config_state_stale):
             self.async_write_ha_state()
+        if was_empty:
             self._update_media_player_availability()
 
+    @callback
+    def send_config_snapshot(self, connection, msg_id: int) -> None:
+        """Send the full config snapshot to one config-channel subscriber."""
+        try:
+            connection.send_event(
+                msg_id,
+                {
+                    "type": "config",
+                    "data": {
+                        "revision": self._config_revision,
+                        "full": True,
+                        "config": dict(self._config),
+                    },
+                },
+            )
+        except Exception:  # noqa: BLE001 - connection may already be dead
+            pass
+
     @callback
     def has_satellite_subscriber(self, connection) -> bool:
         """Whether THIS websocket connection holds a live satellite subscription.
@@ -1573,6 +2018,11 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
             for c, m in self._satellite_subscribers
             if not (c is connection and m == msg_id)
         ]
+        self._config_subscribers = [
+            (c, m)
+            for c, m in self._config_subscribers
+            if not (c is connection and m == msg_id)
+        ]
         _LOGGER.debug(
             "Satellite subscription removed for '%s' (remaining=%d)",
             self._satellite_name,
@@ -1627,15 +2077,45 @@ class VoiceSatelliteEntity(AssistSatelliteEntity):
             self._satellite_subscribers = [
                 s for s in self._satellite_subscribers if s not in dead
             ]
+            self._config_subscribers = [
+                s for s in self._config_subscribers if s not in dead
+            ]
+
+    @callback
+    def _push_config_event(self, config: dict[str, Any], full: bool) -> None:
+        """Push a `config` event to the subscribers that opted in."""
+        if not self._config_subscribers or self.hass.is_stopping:
+            return
+
+        payload = {
+            "type": "config",
+            "data": {
+                "revision": self._config_revision,
+                "full": full,
+                "config": config,
+            },
+        }
+        dead: list[tuple] = []
+        for connection, msg_id in list(self._config_subscribers):
+            try:
+                connection.send_event(msg_id, payload)
+            except Exception:
+                dead.append((connection, msg_id))
+
+        if dead:
+            self._satellite_subscribers = [
+                s for s in self._satellite_subscribers if s not in dead
+            ]
+            self._config_subscribers = [
+                s for s in self._config_subscribers if s not in dead
+            ]
 
     @callback
     def _update_media_player_availability(self) -> None:
         """Notify the media_player entity to re-evaluate its availability."""
-        mp = self.hass.data.get(DOMAIN, {}).get(
-            f"{self._entry.entry_id}_media_player"
-        )
-        if mp is not None:
-            mp.async_write_ha_state()
+        siblings = async_get_index(self.hass).get_entry(self._entry.entry_id)
+        if siblings is not None and siblings.media_player is not None:
+            siblings.media_player.async_write_ha_state()
 
     @callback
     def _handle_timer_event(
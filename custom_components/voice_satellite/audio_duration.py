@@ -0,0 +1,340 @@
+"""Duration probes for TTS audio.
+
+The satellite sends the card the length of every TTS reply and
+announcement (tts-audio-duration), which remote media player playback
+uses as its completion timer.  TTS engines hand back MP3, WAV, FLAC,
+Ogg (Opus/Vorbis) or ADTS AAC, and every one of them states - or lets us
+count - its length from headers alone, without decoding a sample:
+
+  * MP3  - Mp3FrameWalker sums the sample count of every Layer III
+           frame header.  Exact on the headerless VBR streams streaming
+           TTS produces, where mutagen extrapolates from the first
+           frame's bitrate.  Junk between frames is skipped with
+           bytes.find rather than byte by byte.
+  * WAV  - data chunk size / byte rate from the fmt chunk; a streamed
+           WAV's placeholder data size is replaced by the bytes present.
+  * FLAC - total samples / sample rate from STREAMINFO.
+  * Ogg  - granule position of the last page: 48 kHz minus the pre-skip
+           for Opus, the identification header's rate for Vorbis.
+  * ADTS - 1024 samples per raw data block, summed over the frames.
+
+probe_duration() is cheap enough for the event loop.  When it cannot
+tell (an unknown format, a FLAC without a sample count), mutagen_duration()
+is the fallback; it parses the whole file in Python and belongs in the
+executor.
+"""
+
+from __future__ import annotations
+
+import io
+import struct
+
+try:
+    import mutagen
+
+    HAS_MUTAGEN = True
+except ImportError:
+    HAS_MUTAGEN = False
+
+AUDIO_FORMAT_MP3 = "mp3"
+AUDIO_FORMAT_WAV = "wav"
+AUDIO_FORMAT_FLAC = "flac"
+AUDIO_FORMAT_OGG = "ogg"
+AUDIO_FORMAT_ADTS = "adts"
+
+# Layer III bitrate tables (kbps), indexed by the frame header's bitrate
+# field. Index 0 (free format) and 15 (bad) are unusable and skipped.
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0)
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0)
+# Sample rates (Hz) by MPEG version bits: 3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5.
+_MP3_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# ADTS sampling frequency index (indices 12-15 are reserved/explicit).
+_ADTS_RATES = (
+    96000, 88200, 64000, 48000, 44100, 32000, 24000, 22050, 16000, 12000, 11025, 8000,
+)
+_ADTS_HEADER_BYTES = 7
+_AAC_FRAME_SAMPLES = 1024
+
+_OGG_PAGE_HEADER_BYTES = 27
+_OPUS_RATE = 48000
+
+# Streamed WAVs write one of these as the data chunk size.
+_WAV_UNKNOWN_SIZES = (0, 0xFFFFFFFF)
+
+
+def _id3v2_end(data: bytes) -> int:
+    """Offset past a leading ID3v2 tag (syncsafe 28-bit size), else 0."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    return 10 + (
+        ((data[6] & 0x7F) << 21)
+        | ((data[7] & 0x7F) << 14)
+        | ((data[8] & 0x7F) << 7)
+        | (data[9] & 0x7F)
+    )
+
+
+def sniff_format(data: bytes) -> str | None:
+    """Return the container/stream format of an audio payload, if known."""
+    head = data[:12]
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return AUDIO_FORMAT_WAV
+    if head[:4] == b"fLaC":
+        return AUDIO_FORMAT_FLAC
+    if head[:4] == b"OggS":
+        return AUDIO_FORMAT_OGG
+    i = _id3v2_end(data)
+    if i + 2 > len(data) or data[i] != 0xFF:
+        return AUDIO_FORMAT_MP3 if head[:3] == b"ID3" else None
+    b1 = data[i + 1]
+    if b1 & 0xF6 == 0xF0:  # 12-bit sync, layer 00
+        return AUDIO_FORMAT_ADTS
+    if b1 & 0xE0 == 0xE0 and b1 & 0x06:  # 11-bit sync, layer I-III
+        return AUDIO_FORMAT_MP3
+    return None
+
+
+def looks_like_mp3(data: bytes) -> bool:
+    """True if a payload starts like an MP3 stream (ID3v2 tag or frame sync)."""
+    return data[:3] == b"ID3" or (
+        len(data) >= 2
+        and data[0] == 0xFF
+        and (data[1] & 0xE0) == 0xE0
+        and (data[1] & 0x06) != 0
+    )
+
+
+class Mp3FrameWalker:
+    """Exact duration of a Layer III MPEG stream, by walking every frame.
+
+    Streaming TTS engines emit the MP3 as they synthesize it, so they can
+    never seek back to write a Xing/VBRI header. On such a headerless VBR
+    stream mutagen estimates length from the FIRST frame's bitrate alone
+    (filesize * 8 / bitrate), and a low-bitrate leading silence frame
+    inflates the result several-fold - measured 22.56s for a 2.76s reply,
+    which stalled remote TTS completion for the difference. Summing the
+    per-frame sample counts costs microseconds on TTS-sized payloads and
+    is exact regardless of bitrate switching.
+
+    Fed chunk by chunk as the audio arrives: a header split across two
+    chunks is carried over, and the bytes of a frame body (or ID3v2 tag)
+    that runs past the chunk are skipped as the next chunks come in, so
+    the duration so far is known at every point and nothing is buffered
+    beyond a partial header.
+
+    duration is 0.0 when the payload is not a plain Layer III stream
+    (caller falls back to the other probes).
+    """
+
+    def __init__(self) -> None:
+        """Initialize at the start of a stream."""
+        self.seconds = 0.0
+        self.frames = 0
+        self.invalid = False
+        self._pending = b""  # unparsed tail: a partial header
+        self._skip = 0  # bytes of the current frame / tag still to come
+        self._at_start = True
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio in the frames walked so far."""
+        return self.seconds if self.frames and not self.invalid else 0.0
+
+    def feed(self, chunk: bytes) -> None:
+        """Walk the frames of the next chunk of the stream."""
+        if self.invalid:
+            return
+        if self._skip:
+            if len(chunk) <= self._skip:
+                self._skip -= len(chunk)
+                return
+            chunk = chunk[self._skip :]
+            self._skip = 0
+        data = self._pending + chunk if self._pending else chunk
+        n = len(data)
+        i = 0
+        if self._at_start:
+            if n < 10:
+                self._pending = data  # not enough to tell whether it's ID3
+                return
+            self._at_start = False
+            i = _id3v2_end(data)
+        seconds = self.seconds
+        frames = 0
+        while i + 4 <= n:
+            if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+                # Resync over junk between frames.
+                i = data.find(b"\xff", i + 1)
+                if i < 0:
+                    i = n
+                continue
+            h1, h2 = data[i + 1], data[i + 2]
+            version = (h1 >> 3) & 0x03  # 3=MPEG1, 2=MPEG2, 0=MPEG2.5, 1=reserved
+            layer = (h1 >> 1) & 0x03  # 1 = Layer III
+            if version == 1 or layer != 1:
+                self._invalidate()  # not a plain Layer III stream
+                return
+            br_idx = (h2 >> 4) & 0x0F
+            sr_idx = (h2 >> 2) & 0x03
+            if br_idx in (0, 15) or sr_idx == 3:
+                # Free-format/bad header - treat as junk and resync.
+                i = data.find(b"\xff", i + 1)
+                if i < 0:
+                    i = n
+                continue
+            bitrate = (_MP3_BITRATES_V1 if version == 3 else _MP3_BITRATES_V2)[br_idx] * 1000
+            rate = _MP3_RATES[version][sr_idx]
+            padding = (h2 >> 1) & 0x01
+            # MPEG1 Layer III: 1152 samples per frame; MPEG2/2.5: 576.
+            if version == 3:
+                frame_len = 144 * bitrate // rate + padding
+                seconds += 1152 / rate
+            else:
+                frame_len = 72 * bitrate // rate + padding
+                seconds += 576 / rate
+            if frame_len <= 0:
+                self._invalidate()
+                return
+            i += frame_len
+            frames += 1
+        self.seconds = seconds
+        self.frames += frames
+        if i > n:
+            self._skip = i - n
+            self._pending = b""
+        else:
+            self._pending = bytes(data[i:])
+
+    def _invalidate(self) -> None:
+        self.invalid = True
+        self._pending = b""
+
+
+def mp3_duration(data: bytes) -> float:
+    """Exact duration of a complete Layer III MPEG payload (see Mp3FrameWalker)."""
+    walker = Mp3FrameWalker()
+    walker.feed(data)
+    return walker.duration
+
+
+def wav_duration(data: bytes) -> float:
+    """Duration of a RIFF/WAVE payload from its fmt and data chunks."""
+    n = len(data)
+    i = 12
+    byte_rate = 0
+    while i + 8 <= n:
+        chunk_id = data[i : i + 4]
+        size = int.from_bytes(data[i + 4 : i + 8], "little")
+        body = i + 8
+        if chunk_id == b"fmt " and body + 16 <= n:
+            byte_rate = struct.unpack_from("<I", data, body + 8)[0]
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return 0.0
+            available = n - body
+            if size in _WAV_UNKNOWN_SIZES or size > available:
+                size = available
+            return size / byte_rate
+        i = body + size + (size & 1)
+    return 0.0
+
+
+def flac_duration(data: bytes) -> float:
+    """Duration of a native FLAC payload from its STREAMINFO block."""
+    # "fLaC", a 4-byte block header, then STREAMINFO: 10 bytes of block and
+    # frame sizes followed by rate(20) channels(3) bps(5) samples(36).
+    if len(data) < 26 or data[4] & 0x7F != 0:
+        return 0.0
+    packed = int.from_bytes(data[18:26], "big")
+    rate = packed >> 44
+    total_samples = packed & ((1 << 36) - 1)
+    if not rate or not total_samples:
+        return 0.0  # a streamed FLAC may leave the sample count unset
+    return total_samples / rate
+
+
+def ogg_duration(data: bytes) -> float:
+    """Duration of an Ogg Opus/Vorbis payload from its last granule position."""
+    n = len(data)
+    if n < _OGG_PAGE_HEADER_BYTES:
+        return 0.0
+    serial = data[14:18]
+    payload = _OGG_PAGE_HEADER_BYTES + data[26]
+    if data[payload : payload + 8] == b"OpusHead" and payload + 12 <= n:
+        rate = _OPUS_RATE
+        pre_skip = int.from_bytes(data[payload + 10 : payload + 12], "little")
+    elif data[payload : payload + 7] == b"\x01vorbis" and payload + 16 <= n:
+        rate = int.from_bytes(data[payload + 12 : payload + 16], "little")
+        pre_skip = 0
+    else:
+        return 0.0  # FLAC-in-Ogg, Speex...: leave it to mutagen
+    if not rate:
+        return 0.0
+
+    # The last page of the stream with a granule position (-1 = none).
+    end = n
+    while (page := data.rfind(b"OggS", 0, end)) >= 0:
+        end = page
+        if page + _OGG_PAGE_HEADER_BYTES > n or data[page + 14 : page + 18] != serial:
+            continue
+        granule = int.from_bytes(data[page + 6 : page + 14], "little", signed=True)
+        if granule >= 0:
+            return max(0, granule - pre_skip) / rate
+    return 0.0
+
+
+def adts_duration(data: bytes) -> float:
+    """Duration of an ADTS AAC stream, by walking its frame headers."""
+    n = len(data)
+    i = _id3v2_end(data)
+    seconds = 0.0
+    while i + _ADTS_HEADER_BYTES <= n:
+        if data[i] != 0xFF or data[i + 1] & 0xF6 != 0xF0:
+            i = data.find(b"\xff", i + 1)
+            if i < 0:
+                break
+            continue
+        sr_idx = (data[i + 2] >> 2) & 0x0F
+        frame_len = (
+            ((data[i + 3] & 0x03) << 11) | (data[i + 4] << 3) | (data[i + 5] >> 5)
+        )
+        if sr_idx >= len(_ADTS_RATES) or frame_len < _ADTS_HEADER_BYTES:
+            i += 1
+            continue
+        blocks = (data[i + 6] & 0x03) + 1
+        seconds += blocks * _AAC_FRAME_SAMPLES / _ADTS_RATES[sr_idx]
+        i += frame_len
+    return seconds
+
+
+_PROBES = {
+    AUDIO_FORMAT_MP3: mp3_duration,
+    AUDIO_FORMAT_WAV: wav_duration,
+    AUDIO_FORMAT_FLAC: flac_duration,
+    AUDIO_FORMAT_OGG: ogg_duration,
+    AUDIO_FORMAT_ADTS: adts_duration,
+}
+
+
+def probe_duration(data: bytes) -> float:
+    """Duration in seconds of an audio payload from its headers, 0.0 if unknown."""
+    # Unrecognized leading bytes may still be junk ahead of MP3 frames.
+    probe = _PROBES.get(sniff_format(data), mp3_duration)
+    try:
+        return probe(data)
+    except (IndexError, ValueError, struct.error):
+        return 0.0
+
+
+def mutagen_duration(data: bytes) -> float:
+    """Duration in seconds according to mutagen, 0.0 if unknown (blocking)."""
+    if not HAS_MUTAGEN:
+        return 0.0
+    try:
+        audio_file = mutagen.File(io.BytesIO(data))
+    except Exception:  # mutagen raises its own error types per format
+        return 0.0
+    if audio_file is None or not audio_file.info or not audio_file.info.length:
+        return 0.0
+    return float(audio_file.info.length)
@@ -0,0 +1,151 @@
+"""Fixed-size frame coalescing for bridged pipeline audio.
+
+The card posts Int16 PCM in batches whose size follows the browser's
+render quanta (typically ~80 ms, but it varies with the AudioContext).
+STT and VAD providers work best with uniformly sized chunks, so the
+pipeline's audio_stream() pushes every payload through a FrameCoalescer
+that re-cuts it into fixed 10/20/30 ms frames.
+
+The coalescer copies payloads into a ring buffer allocated once per run
+and sliced through a memoryview, so steady-state ingest allocates only
+the outgoing frame objects themselves - no growing bytearrays, no
+concatenation temporaries, no per-payload slices.
+
+PreRollBuffer is the per-satellite counterpart: a fixed circular buffer
+holding the audio a card streamed on its session between runs - after an
+on-device wake word it sends its wake word pre-roll and the live audio
+at once, instead of holding them until the session_turn round trip is
+done - so the new run can start with the speech that arrived before it
+was set up.  It is cleared when a run starts and when it ends, so one
+run's tail is never replayed into the next.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+
+AUDIO_SAMPLE_RATE = 16000
+AUDIO_SAMPLE_WIDTH = 2  # Int16 mono
+AUDIO_FRAME_MS_CHOICES = (10, 20, 30)
+DEFAULT_AUDIO_FRAME_MS = 10  # matches HA's audio processing chunk size
+
+# Rolling pre-roll kept per satellite, and the most a run may replay.
+PREROLL_CAPACITY_MS = 2000
+# Audio older than this (since the last payload arrived) belongs to an
+# earlier utterance and is never replayed.
+PREROLL_MAX_AGE_S = 1.0
+
+# Ring capacity in frames.  Payloads larger than the ring are fed through
+# in pieces, so this only has to cover a typical card batch (~80 ms).
+_RING_FRAMES = 16
+
+
+def frame_bytes_for(frame_ms: int) -> int:
+    """Return the byte length of one frame of frame_ms milliseconds."""
+    return AUDIO_SAMPLE_RATE * AUDIO_SAMPLE_WIDTH * frame_ms // 1000
+
+
+class FrameCoalescer:
+    """Preallocated ring buffer that re-cuts PCM into fixed-size frames."""
+
+    def __init__(self, frame_ms: int = DEFAULT_AUDIO_FRAME_MS) -> None:
+        """Allocate the ring for one pipeline run."""
+        self.frame_bytes = frame_bytes_for(frame_ms)
+        self._capacity = self.frame_bytes * _RING_FRAMES
+        self._ring = bytearray(self._capacity)
+        self._view = memoryview(self._ring)
+        self._read = 0
+        self._fill = 0
+
+    @property
+    def pending(self) -> int:
+        """Bytes buffered that do not yet make up a whole frame."""
+        return self._fill
+
+    def push(self, data: bytes) -> Iterator[bytes]:
+        """Buffer a payload and yield every whole frame now available."""
+        src = memoryview(data)
+        size = self.frame_bytes
+        while src:
+            src = src[self._write(src):]
+            while self._fill >= size:
+                yield self._take(size)
+
+    def flush(self) -> bytes:
+        """Return any buffered partial frame (end of stream) and reset."""
+        tail = self._take(self._fill) if self._fill else b""
+        self._read = 0
+        return tail
+
+    def _write(self, src: memoryview) -> int:
+        """Copy as much of src as fits into the ring; return bytes copied."""
+        cap = self._capacity
+        count = min(len(src), cap - self._fill)
+        start = (self._read + self._fill) % cap
+        first = min(count, cap - start)
+        self._view[start:start + first] = src[:first]
+        if count > first:
+            self._view[:count - first] = src[first:count]
+        self._fill += count
+        return count
+
+    def _take(self, count: int) -> bytes:
+        """Pop count bytes off the ring as a new bytes object."""
+        cap = self._capacity
+        start = self._read
+        end = start + count
+        if end <= cap:
+            out = self._view[start:end].tobytes()
+        else:
+            out = b"".join((self._view[start:], self._view[:end - cap]))
+        self._read = end % cap
+        self._fill -= count
+        return out
+
+
+class PreRollBuffer:
+    """Circular buffer of the most recent audio streamed by one satellite."""
+
+    def __init__(self, capacity_ms: int = PREROLL_CAPACITY_MS) -> None:
+        """Allocate the buffer once for the lifetime of the satellite."""
+        # Whole samples only, so a snapshot never splits an Int16.
+        self._capacity = frame_bytes_for(capacity_ms)
+        self._ring = bytearray(self._capacity)
+        self._view = memoryview(self._ring)
+        self._write = 0
+        self._fill = 0
+        self._last_write = 0.0  # monotonic
+
+    def write(self, data: bytes) -> None:
+        """Append a payload, overwriting the oldest audio when full."""
+        cap = self._capacity
+        src = memoryview(data)[-cap:]
+        count = len(src)
+        start = self._write
+        first = min(count, cap - start)
+        self._view[start:start + first] = src[:first]
+        if count > first:
+            self._view[:count - first] = src[first:]
+        self._write = (start + count) % cap
+        self._fill = min(cap, self._fill + count)
+        self._last_write = time.monotonic()
+
+    def snapshot(self, duration_ms: int) -> bytes:
+        """Return up to duration_ms of the newest audio, oldest first.
+
+        Returns b"" when nothing arrived within PREROLL_MAX_AGE_S.
+        """
+        if time.monotonic() - self._last_write > PREROLL_MAX_AGE_S:
+            return b""
+        count = min(self._fill, frame_bytes_for(duration_ms))
+        end = self._write
+        start = end - count
+        if start >= 0:
+            return self._view[start:end].tobytes()
+        return b"".join((self._view[start:], self._view[:end]))
+
+    def clear(self) -> None:
+        """Forget everything buffered."""
+        self._write = 0
+        self._fill = 0
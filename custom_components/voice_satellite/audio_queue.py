@@ -0,0 +1,155 @@
+"""Bounded audio queue for bridged pipelines.
+
+The binary WebSocket handler pushes every PCM payload the card sends into
+a queue that the pipeline's audio_stream() drains.  When the consumer
+stalls (an STT provider hanging, a slow wake word service) an unbounded
+queue grows for as long as the tablet keeps streaming, on every tablet at
+once.  AudioFrameQueue caps the backlog in bytes and applies one of three
+overflow policies:
+
+  * drop_oldest - discard the oldest queued audio (default; the pipeline
+    catches up on the most recent speech).
+  * drop_newest - discard incoming audio while the queue is full.
+  * pause - ask the card to pause streaming (`audio-pause` pipeline
+    event) at the limit and to resume (`audio-resume`) once the backlog
+    has drained to half.  Frames already in flight are accepted up to
+    twice the limit; anything beyond that is dropped.
+
+The empty-bytes stop signal is never dropped or counted.  Counters go to
+a per-satellite AudioQueueStats that outlives individual runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+AUDIO_QUEUE_DROP_OLDEST = "drop_oldest"
+AUDIO_QUEUE_DROP_NEWEST = "drop_newest"
+AUDIO_QUEUE_PAUSE = "pause"
+AUDIO_QUEUE_POLICIES = (
+    AUDIO_QUEUE_DROP_OLDEST,
+    AUDIO_QUEUE_DROP_NEWEST,
+    AUDIO_QUEUE_PAUSE,
+)
+
+DEFAULT_AUDIO_QUEUE_POLICY = AUDIO_QUEUE_DROP_OLDEST
+# 5 s of 16 kHz 16-bit mono PCM (32,000 bytes/s).
+DEFAULT_AUDIO_QUEUE_MAX_BYTES = 5 * 32000
+
+
+@dataclass(slots=True)
+class AudioQueueStats:
+    """Cumulative audio ingest counters for one satellite."""
+
+    frames_in: int = 0
+    bytes_in: int = 0
+    dropped_frames: int = 0
+    dropped_bytes: int = 0
+    high_water_frames: int = 0
+    high_water_bytes: int = 0
+    pause_signals: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a JSON-serializable dict."""
+        return asdict(self)
+
+
+class AudioFrameQueue:
+    """Byte-bounded single-consumer queue of raw audio payloads."""
+
+    def __init__(
+        self,
+        stats: AudioQueueStats,
+        max_bytes: int = DEFAULT_AUDIO_QUEUE_MAX_BYTES,
+        policy: str = DEFAULT_AUDIO_QUEUE_POLICY,
+        on_pause: Callable[[bool], None] | None = None,
+    ) -> None:
+        """Initialize the queue.
+
+        on_pause is called with True when the card should pause streaming
+        and False when it may resume (pause policy only).
+        """
+        self._stats = stats
+        self._max_bytes = max_bytes
+        self._policy = policy
+        self._on_pause = on_pause
+        self._frames: deque[bytes] = deque()
+        self._bytes = 0
+        self._stopped = False
+        self._paused = False
+        self._ready = asyncio.Event()
+
+    @property
+    def depth_bytes(self) -> int:
+        """Bytes currently queued."""
+        return self._bytes
+
+    def qsize(self) -> int:
+        """Frames currently queued."""
+        return len(self._frames)
+
+    def put_nowait(self, chunk: bytes) -> None:
+        """Queue a payload, applying the overflow policy. b"" = stop."""
+        if not chunk:
+            if not self._stopped:
+                self._stopped = True
+                self._frames.append(b"")
+                self._ready.set()
+            return
+        if self._stopped:
+            return  # stream is ending; nothing after the stop is read
+
+        stats = self._stats
+        size = len(chunk)
+        stats.frames_in += 1
+        stats.bytes_in += size
+
+        if self._bytes + size > self._max_bytes:
+            if self._policy == AUDIO_QUEUE_DROP_OLDEST:
+                while self._frames and self._bytes + size > self._max_bytes:
+                    old = self._frames.popleft()
+                    self._bytes -= len(old)
+                    stats.dropped_frames += 1
+                    stats.dropped_bytes += len(old)
+            elif self._policy == AUDIO_QUEUE_PAUSE:
+                self._set_paused(True)
+                if self._bytes + size > 2 * self._max_bytes:
+                    stats.dropped_frames += 1
+                    stats.dropped_bytes += size
+                    return
+            else:
+                stats.dropped_frames += 1
+                stats.dropped_bytes += size
+                return
+
+        self._frames.append(chunk)
+        self._bytes += size
+        if len(self._frames) > stats.high_water_frames:
+            stats.high_water_frames = len(self._frames)
+        if self._bytes > stats.high_water_bytes:
+            stats.high_water_bytes = self._bytes
+        self._ready.set()
+
+    async def get(self) -> bytes:
+        """Return the next payload, waiting for one if the queue is empty."""
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+        chunk = self._frames.popleft()
+        self._bytes -= len(chunk)
+        if self._paused and self._bytes <= self._max_bytes // 2:
+            self._set_paused(False)
+        return chunk
+
+    def _set_paused(self, paused: bool) -> None:
+        """Flip the pause state and tell the card (pause policy only)."""
+        if self._paused == paused:
+            return
+        self._paused = paused
+        if paused:
+            self._stats.pause_signals += 1
+        if self._on_pause is not None:
+            self._on_pause(paused)
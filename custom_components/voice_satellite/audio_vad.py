@@ -0,0 +1,219 @@
+"""Server-side speech gate for bridged stt runs.
+
+An stt run streams everything the microphone hears to the STT provider:
+the silence before the user starts talking and the silence after they
+finish, until HA's own VAD decides the turn is over.  Every one of those
+frames costs Whisper / cloud STT time.  When a run opts in (`vad_gate`),
+audio_stream() pushes its fixed-size frames through a SpeechGate that
+
+  * drops leading silence, keeping a short pad before the first speech
+    so onsets are not clipped;
+  * ends the stream once speech has been followed by `hangover` of
+    silence, which is shorter than HA's end-of-speech timeout, so the
+    STT result arrives sooner.
+
+Frames are classified by energy above an adaptive noise floor, with the
+zero-crossing rate separating hiss from voiced speech (fricatives still
+pass on energy).  The per-frame features are computed with NumPy when
+available, otherwise in pure Python.
+
+If nothing sounding like speech arrives within MAX_LEADING_MS the gate
+gives up and passes audio through, leaving the timeout to HA.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+from dataclasses import asdict, dataclass
+
+from .audio_codecs import HAS_NUMPY
+
+if HAS_NUMPY:
+    import numpy as np
+
+DEFAULT_HANGOVER_MS = 400
+PRE_SPEECH_PAD_MS = 300
+MIN_SPEECH_MS = 250
+ONSET_MS = 30
+MAX_LEADING_MS = 8000
+
+# Speech threshold above the noise floor, and an absolute floor so a
+# dead-quiet room does not turn breathing into speech.
+_SPEECH_DB = 10.0
+_ABS_MIN_DB = -55.0
+# Frames with more zero crossings than this (per sample) look like hiss
+# and need an extra margin of energy to count as speech.
+_HISS_ZCR = 0.35
+_HISS_EXTRA_DB = 6.0
+_FLOOR_ALPHA = 0.05
+_INITIAL_FLOOR_DB = -50.0
+
+
+@dataclass(slots=True)
+class SpeechGateStats:
+    """Cumulative speech gate results for one satellite."""
+
+    runs: int = 0
+    leading_trimmed_s: float = 0.0
+    tail_saved_s_est: float = 0.0
+    passthrough_runs: int = 0
+    last_run: dict | None = None
+
+    def as_dict(self) -> dict:
+        """Return the counters as a JSON-serializable dict."""
+        data = asdict(self)
+        data["leading_trimmed_s"] = round(self.leading_trimmed_s, 3)
+        data["tail_saved_s_est"] = round(self.tail_saved_s_est, 3)
+        data["saved_s_est"] = round(
+            self.leading_trimmed_s + self.tail_saved_s_est, 3
+        )
+        return data
+
+
+def _frame_features(frame: bytes) -> tuple[float, float]:
+    """Return (energy dBFS, zero-crossing rate) of an Int16 frame."""
+    if HAS_NUMPY:
+        samples = np.frombuffer(frame, dtype="<i2").astype(np.float32)
+        if not samples.size:
+            return -120.0, 0.0
+        power = float(np.dot(samples, samples)) / samples.size
+        signs = np.signbit(samples)
+        crossings = int(np.count_nonzero(signs[1:] != signs[:-1]))
+    else:
+        samples = array("h", frame)
+        if not samples:
+            return -120.0, 0.0
+        power = sum(s * s for s in samples) / len(samples)
+        crossings = sum(
+            (a < 0) != (b < 0) for a, b in zip(samples, samples[1:])
+        )
+    db = 10 * math.log10(power / (32768.0 * 32768.0) + 1e-12)
+    return db, crossings / len(samples)
+
+
+class SpeechGate:
+    """Trim leading silence and cut the trailing silence of one stt run."""
+
+    def __init__(
+        self,
+        frame_ms: int,
+        stats: SpeechGateStats,
+        hangover_ms: int = DEFAULT_HANGOVER_MS,
+        ha_silence_s: float | None = None,
+    ) -> None:
+        """Initialize for one run.
+
+        ha_silence_s is HA's end-of-speech timeout for this satellite, used
+        only to estimate how much tail audio the early close saved.
+        """
+        self._frame_s = frame_ms / 1000
+        self._stats = stats
+        self._hangover = max(1, math.ceil(hangover_ms / frame_ms))
+        self._onset = max(1, math.ceil(ONSET_MS / frame_ms))
+        self._min_speech = max(1, math.ceil(MIN_SPEECH_MS / frame_ms))
+        self._max_leading = math.ceil(MAX_LEADING_MS / frame_ms)
+        self._ha_silence_s = ha_silence_s
+        self._hangover_s = hangover_ms / 1000
+
+        self._pad: deque[bytes] = deque(
+            maxlen=max(1, math.ceil(PRE_SPEECH_PAD_MS / frame_ms))
+        )
+        self._floor: float | None = None
+        self._open = False
+        self._passthrough = False
+        self._closed = False
+        self._run_speech = 0  # consecutive speech frames before opening
+        self._speech_frames = 0
+        self._silence_run = 0
+        self._leading_dropped = 0
+        self._frames_seen = 0
+        self._finished = False
+
+    @property
+    def closed(self) -> bool:
+        """True once the end of speech was detected; stop streaming."""
+        return self._closed
+
+    def process(self, frame: bytes) -> list[bytes]:
+        """Feed one frame; return the frames to forward to the pipeline."""
+        if self._closed:
+            return []
+        if self._passthrough:
+            return [frame]
+
+        self._frames_seen += 1
+        speech = self._classify(frame)
+
+        if not self._open:
+            self._run_speech = self._run_speech + 1 if speech else 0
+            if self._run_speech >= self._onset:
+                self._open = True
+                self._speech_frames = self._run_speech
+                out = [*self._pad, frame]
+                self._pad.clear()
+                return out
+            if len(self._pad) == self._pad.maxlen:
+                self._leading_dropped += 1
+            self._pad.append(frame)
+            if self._frames_seen >= self._max_leading:
+                # No speech: stop gating, let HA's own timeout decide.
+                self._passthrough = True
+                out = list(self._pad)
+                self._pad.clear()
+                return out
+            return []
+
+        if speech:
+            self._speech_frames += 1
+            self._silence_run = 0
+        else:
+            self._silence_run += 1
+            if (
+                self._silence_run >= self._hangover
+                and self._speech_frames >= self._min_speech
+            ):
+                self._closed = True
+        return [frame]
+
+    def finish(self) -> None:
+        """Record this run's savings in the satellite's stats (once)."""
+        if self._finished:
+            return
+        self._finished = True
+        stats = self._stats
+        leading_s = self._leading_dropped * self._frame_s
+        tail_s = 0.0
+        if self._closed and self._ha_silence_s is not None:
+            tail_s = max(0.0, self._ha_silence_s - self._hangover_s)
+        stats.runs += 1
+        stats.leading_trimmed_s += leading_s
+        stats.tail_saved_s_est += tail_s
+        if self._passthrough:
+            stats.passthrough_runs += 1
+        stats.last_run = {
+            "leading_trimmed_s": round(leading_s, 3),
+            "tail_saved_s_est": round(tail_s, 3),
+            "closed_early": self._closed,
+            "passthrough": self._passthrough,
+        }
+
+    def _classify(self, frame: bytes) -> bool:
+        """Classify a frame as speech and track the noise floor."""
+        db, zcr = _frame_features(frame)
+        if self._floor is None:
+            # Capped so a run that starts mid-speech (pre-roll replay) does
+            # not take the speech itself for the noise floor.
+            self._floor = min(db, _INITIAL_FLOOR_DB)
+        threshold = max(self._floor + _SPEECH_DB, _ABS_MIN_DB)
+        if zcr > _HISS_ZCR:
+            threshold += _HISS_EXTRA_DB
+        speech = db > threshold
+        if not speech:
+            # Follow the floor down immediately, up slowly.
+            if db < self._floor:
+                self._floor = db
+            else:
+                self._floor += _FLOOR_ALPHA * (db - self._floor)
+        return speech
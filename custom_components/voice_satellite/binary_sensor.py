@@ -18,6 +18,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
+from .entity_index import async_get_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,8 +31,7 @@ async def async_setup_entry(
     """Set up binary sensor entities from a config entry."""
     entity = VoiceSatelliteScreensaverActiveSensor(entry)
     async_add_entities([entity])
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][f"{entry.entry_id}_screensaver_sensor"] = entity
+    async_get_index(hass).entry(entry.entry_id).screensaver_sensor = entity
 
 
 class VoiceSatelliteScreensaverActiveSensor(BinarySensorEntity):
@@ -32,6 +32,7 @@ from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, INTEGRATION_VERSION, JS_FILENAME, URL_BASE
+from .entity_index import async_get_index
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -291,7 +292,7 @@ async def _check_entity_and_pipeline(
         ))
         return out
 
-    entity = _find_entity(hass, entity_id)
+    entity = async_get_index(hass).satellite(entity_id)
     if entity is None:
         out.append(_result(
             "srv.entity.exists",
@@ -660,13 +661,6 @@ def _entity_available_checks(hass: HomeAssistant, pipeline, slot: int = 1) -> li
     return out
 
 
-def _find_entity(hass: HomeAssistant, entity_id: str):
-    for _, ent in hass.data.get(DOMAIN, {}).items():
-        if getattr(ent, "entity_id", None) == entity_id:
-            return ent
-    return None
-
-
 # ── Frontend resource ───────────────────────────────────────────────
 
 
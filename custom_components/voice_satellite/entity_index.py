@@ -0,0 +1,147 @@
+"""Per-integration index of Voice Satellite entities.
+
+Every WebSocket command and service call resolves its target by
+entity_id, and busy tablets send several state updates per second, so
+the lookup has to be a dict read rather than a scan over every entity
+the integration owns.  The index keeps two views current:
+
+  * entity_id -> satellite / media player entity, maintained from the
+    entities' own add/remove hooks.  An entity_id rename in the entity
+    registry removes and re-adds the entity, so renames are covered by
+    the same hooks.
+  * config entry_id -> the sibling entities of that satellite device,
+    filled in by each platform's async_setup_entry and dropped on unload.
+
+The index is also where the integration-wide helpers live - the
+inference pool, the wake word arbiter and batchers, the TTS duration
+prober, the wake word verification model lists - so the integration
+owns a single hass.data key.  Each helper's module creates it on first
+use through its own async_get_* function; use those and
+async_get_index() rather than touching hass.data.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .assist_satellite import VoiceSatelliteEntity
+    from .binary_sensor import VoiceSatelliteScreensaverActiveSensor
+    from .inference_pool import InferencePool
+    from .media_player import VoiceSatelliteMediaPlayer
+    from .select import VoiceSatelliteWakeWordModel2Select
+    from .sensor import VoiceSatelliteLatencySensor
+    from .tts_duration import TtsDurationProber
+    from .wake_arbitration import WakeArbiter
+    from .wake_word_batch import WakeWordBatcher
+    from .wake_word_verify import WakeVerifyModels
+
+# Config entry of the satellite whose pipeline run owns the current task
+# context; None outside its runs.  HA pipelines are shared between
+# satellites, so a pipeline stage (a wake word entity) reads this to find
+# the satellite it is serving rather than assuming its own entry.
+RUN_ENTRY_ID: ContextVar[str | None] = ContextVar(
+    f"{DOMAIN}_run_entry_id", default=None
+)
+
+
+@dataclass(slots=True)
+class SatelliteEntities:
+    """Entities created for one config entry (one satellite device)."""
+
+    satellite: VoiceSatelliteEntity | None = None
+    media_player: VoiceSatelliteMediaPlayer | None = None
+    screensaver_sensor: VoiceSatelliteScreensaverActiveSensor | None = None
+    wake_word_model_2: VoiceSatelliteWakeWordModel2Select | None = None
+    latency_sensors: list[VoiceSatelliteLatencySensor] = field(default_factory=list)
+
+
+class EntityIndex:
+    """O(1) lookups of Voice Satellite entities by entity_id and entry_id."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: dict[str, SatelliteEntities] = {}
+        self._satellites: dict[str, VoiceSatelliteEntity] = {}
+        self._media_players: dict[str, VoiceSatelliteMediaPlayer] = {}
+        # Integration-wide helpers, set by their modules on first use.
+        self.inference_pool: InferencePool | None = None
+        self.wake_arbiter: WakeArbiter | None = None
+        self.wake_word_batchers: dict[str, WakeWordBatcher] = {}
+        self.tts_duration_prober: TtsDurationProber | None = None
+        self.wake_verify_models: WakeVerifyModels | None = None
+
+    def __len__(self) -> int:
+        """Number of config entries with at least one registered entity."""
+        return len(self._entries)
+
+    # --- entry_id view ---
+
+    def entry(self, entry_id: str) -> SatelliteEntities:
+        """Return (creating if needed) the sibling entities of an entry."""
+        entities = self._entries.get(entry_id)
+        if entities is None:
+            entities = self._entries[entry_id] = SatelliteEntities()
+        return entities
+
+    def get_entry(self, entry_id: str) -> SatelliteEntities | None:
+        """Return the sibling entities of an entry, if it is set up."""
+        return self._entries.get(entry_id)
+
+    def pop_entry(self, entry_id: str) -> None:
+        """Forget an unloaded config entry and all of its entities."""
+        entities = self._entries.pop(entry_id, None)
+        if entities is None:
+            return
+        for eid, ent in list(self._satellites.items()):
+            if ent is entities.satellite:
+                del self._satellites[eid]
+        for eid, ent in list(self._media_players.items()):
+            if ent is entities.media_player:
+                del self._media_players[eid]
+
+    # --- entity_id view ---
+
+    def satellite(self, entity_id: str) -> VoiceSatelliteEntity | None:
+        """Return the satellite entity registered under entity_id."""
+        return self._satellites.get(entity_id)
+
+    def media_player(self, entity_id: str) -> VoiceSatelliteMediaPlayer | None:
+        """Return the media player entity registered under entity_id."""
+        return self._media_players.get(entity_id)
+
+    def satellites(self) -> list[VoiceSatelliteEntity]:
+        """Return every satellite entity currently added to hass."""
+        return list(self._satellites.values())
+
+    def add_satellite(self, entity: VoiceSatelliteEntity) -> None:
+        """Index a satellite under its current entity_id."""
+        self._satellites[entity.entity_id] = entity
+
+    def remove_satellite(self, entity: VoiceSatelliteEntity) -> None:
+        """Drop a satellite's entity_id mapping (if it still points at it)."""
+        if self._satellites.get(entity.entity_id) is entity:
+            del self._satellites[entity.entity_id]
+
+    def add_media_player(self, entity: VoiceSatelliteMediaPlayer) -> None:
+        """Index a media player under its current entity_id."""
+        self._media_players[entity.entity_id] = entity
+
+    def remove_media_player(self, entity: VoiceSatelliteMediaPlayer) -> None:
+        """Drop a media player's entity_id mapping (if it still points at it)."""
+        if self._media_players.get(entity.entity_id) is entity:
+            del self._media_players[entity.entity_id]
+
+
+def async_get_index(hass: HomeAssistant) -> EntityIndex:
+    """Return the integration's entity index, creating it on first use."""
+    index: EntityIndex | None = hass.data.get(DOMAIN)
+    if index is None:
+        index = hass.data[DOMAIN] = EntityIndex()
+    return index
@@ -0,0 +1,123 @@
+"""Coalesced relay of a bridged run's pipeline events to the card.
+
+With a streaming LLM agent the intent stage emits an `intent-progress`
+event for every token or two of the answer, dozens per second, and each
+one used to be serialized and written to the tablet as its own
+WebSocket message.  An EventCoalescer sits between the satellite's
+on_pipeline_event and the run's connection:
+
+  * Text deltas - `intent-progress` events carrying only a
+    `chat_log_delta` with string `content` (and the same role, if any) -
+    are held for at most FLUSH_WINDOW_S and merged into one
+    `intent-progress` whose content is their concatenation.  The card
+    appends streamed content, so the merged event renders exactly like
+    its parts did.
+  * Every other event (stage boundaries such as tts-start, run-end and
+    error, tool calls and results, `tts_start_streaming`) flushes the
+    held deltas first and is sent at once, so event order is kept and
+    nothing that drives the card's state machine is delayed.
+
+HA emits stt-vad-start/stt-vad-end once per utterance, so they pass
+through like the other stage events.  Counts of events in and messages
+out go to a per-satellite EventRelayStats.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# How long text deltas may be held before they are sent.
+FLUSH_WINDOW_S = 0.04
+
+
+@dataclass(slots=True)
+class EventRelayStats:
+    """Cumulative pipeline event relay counters for one satellite."""
+
+    events_in: int = 0
+    messages_out: int = 0
+    deltas_merged: int = 0
+    timer_flushes: int = 0
+    largest_batch: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a JSON-serializable dict."""
+        return asdict(self)
+
+
+def _text_delta(event_type: str, data: dict) -> dict | None:
+    """Return the chat_log_delta of a mergeable text delta event."""
+    if event_type != "intent-progress" or data.keys() != {"chat_log_delta"}:
+        return None
+    delta = data["chat_log_delta"]
+    if (
+        not isinstance(delta, dict)
+        or not isinstance(delta.get("content"), str)
+        or not delta.keys() <= {"role", "content"}
+    ):
+        return None
+    return delta
+
+
+class EventCoalescer:
+    """Relays one bridged run's events, merging bursts of text deltas."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        connection: Any,
+        msg_id: int,
+        stats: EventRelayStats,
+    ) -> None:
+        """Initialize for the run's connection and subscription id."""
+        self._loop = loop
+        self.connection = connection
+        self.msg_id = msg_id
+        self._stats = stats
+        self._pending: dict | None = None  # merged chat_log_delta
+        self._pending_count = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    def relay(self, event_type: str, data: dict) -> None:
+        """Send an event, or hold it if it is a text delta."""
+        self._stats.events_in += 1
+        delta = _text_delta(event_type, data)
+        if delta is not None:
+            pending = self._pending
+            # A delta without a role continues the held message.
+            role = pending.get("role") if pending is not None else None
+            if pending is not None and delta.get("role", role) == role:
+                pending["content"] += delta["content"]
+                self._pending_count += 1
+                self._stats.deltas_merged += 1
+                return
+            self.flush()
+            self._pending = dict(delta)
+            self._pending_count = 1
+            self._timer = self._loop.call_later(FLUSH_WINDOW_S, self._on_timer)
+            return
+        self.flush()
+        self._send(event_type, data)
+
+    def flush(self) -> None:
+        """Send the held text deltas, if any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        self._stats.largest_batch = max(self._stats.largest_batch, self._pending_count)
+        self._send("intent-progress", {"chat_log_delta": pending})
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._stats.timer_flushes += 1
+        self.flush()
+
+    def _send(self, event_type: str, data: dict) -> None:
+        self._stats.messages_out += 1
+        self.connection.send_event(self.msg_id, {"type": event_type, "data": data})
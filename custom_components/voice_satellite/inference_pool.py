@@ -0,0 +1,293 @@
+"""Dedicated worker pool for audio decoding, DSP and wake word inference.
+
+Everything heavier than shuffling bytes used to run either on the event
+loop (payload decoding, resampling, the speech gate) or on HA's shared
+default executor (wake word inference), where it competes with every
+other integration's blocking I/O.  The loop also serves every WebSocket,
+so a few milliseconds of NumPy per payload times 40 tablets shows up as
+UI lag.  InferencePool is a small fixed set of threads used only by this
+integration:
+
+  * async_run(fn, *args, deadline=...) runs one task.  A task whose
+    deadline passed while it waited for a worker is not run at all;
+    it raises StaleTaskError instead, so an overloaded pool sheds stale
+    wake word windows rather than falling further behind.
+  * lane() returns an InferenceLane: a serial queue for one stateful
+    stream (a payload decoder and its resampler).  Tasks run in order,
+    whatever is queued is taken as one job, and results are delivered
+    back on the event loop in submission order.  A task that raises is
+    logged and skipped; the rest of its job is still delivered.
+
+NumPy, onnxruntime and the TFLite interpreter release the GIL while they
+compute, so the threads run in parallel.  Queue latency (submit until a
+worker starts the task), run time and worker utilization are kept for
+the voice_satellite/get_metrics command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .entity_index import async_get_index
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Two workers keep wake word batches and audio decoding from queueing
+# behind each other; more than four only adds contention on small hosts.
+DEFAULT_INFERENCE_WORKERS = max(2, min(4, os.cpu_count() or 1))
+
+# Tasks kept for the latency percentiles, and the utilization window.
+_LATENCY_SAMPLES = 512
+_UTILIZATION_WINDOW_S = 60.0
+
+
+class StaleTaskError(Exception):
+    """A task's deadline passed before a worker picked it up."""
+
+
+class _TaskFailed:
+    """A lane task's result slot when the task raised."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class InferencePool:
+    """Bounded thread pool with deadlines and latency/utilization metrics."""
+
+    def __init__(self, hass: HomeAssistant, workers: int = DEFAULT_INFERENCE_WORKERS) -> None:
+        """Start the worker threads lazily, on the first task."""
+        self._hass = hass
+        self._workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"{DOMAIN}_inference"
+        )
+        self._started = time.monotonic()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._dropped_stale = 0
+        self._busy_s = 0.0
+        self._queue_latency: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._run_time: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._recent_busy: deque[tuple[float, float]] = deque()
+
+    async def async_run(
+        self, fn: Callable[..., Any], *args: Any, deadline: float | None = None
+    ) -> Any:
+        """Run fn(*args) on a worker; deadline is a time.monotonic() value."""
+        submitted = time.monotonic()
+
+        def _task() -> tuple[float, float, bool, Any]:
+            started = time.monotonic()
+            if deadline is not None and started > deadline:
+                return started, started, False, None
+            try:
+                result = fn(*args)
+            except Exception as err:  # noqa: BLE001 - re-raised on the loop
+                return started, time.monotonic(), True, err
+            return started, time.monotonic(), True, result
+
+        self._in_flight += 1
+        try:
+            started, finished, ran, result = await self._hass.loop.run_in_executor(
+                self._executor, _task
+            )
+        finally:
+            self._in_flight -= 1
+        self._queue_latency.append(started - submitted)
+        if not ran:
+            self._dropped_stale += 1
+            raise StaleTaskError
+        busy = finished - started
+        self._busy_s += busy
+        self._run_time.append(busy)
+        self._recent_busy.append((finished, busy))
+        if isinstance(result, Exception):
+            self._failed += 1
+            raise result
+        self._completed += 1
+        return result
+
+    @callback
+    def record_task_failure(self) -> None:
+        """Count a lane task that raised inside an otherwise good job."""
+        self._failed += 1
+
+    @callback
+    def lane(self, name: str) -> InferenceLane:
+        """Return a new serial lane for one stateful stream."""
+        return InferenceLane(self._hass, self, name)
+
+    @callback
+    def metrics(self) -> dict[str, Any]:
+        """Return the pool counters and latency/utilization figures."""
+        now = time.monotonic()
+        recent = self._recent_busy
+        while recent and recent[0][0] < now - _UTILIZATION_WINDOW_S:
+            recent.popleft()
+        window = min(_UTILIZATION_WINDOW_S, now - self._started) or 1.0
+        latency = list(self._queue_latency)
+        run_time = list(self._run_time)
+        return {
+            "workers": self._workers,
+            "in_flight": self._in_flight,
+            "completed": self._completed,
+            "failed": self._failed,
+            "dropped_stale": self._dropped_stale,
+            "busy_s": round(self._busy_s, 3),
+            "utilization_pct": round(
+                sum(busy for _, busy in recent) / (window * self._workers) * 100, 1
+            ),
+            "queue_latency_ms": {
+                "p50": round(_percentile(latency, 50) * 1000, 2) if latency else 0.0,
+                "p95": round(_percentile(latency, 95) * 1000, 2) if latency else 0.0,
+                "max": round(max(latency) * 1000, 2) if latency else 0.0,
+            },
+            "run_time_ms": {
+                "p50": round(_percentile(run_time, 50) * 1000, 2) if run_time else 0.0,
+                "p95": round(_percentile(run_time, 95) * 1000, 2) if run_time else 0.0,
+            },
+        }
+
+    def shutdown(self) -> None:
+        """Stop the workers; queued tasks are cancelled."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class InferenceLane:
+    """Serial task queue on the pool for one stateful stream.
+
+    submit() queues fn(arg) and hands its result to on_result on the
+    event loop; post() queues a plain loop callback behind everything
+    submitted so far (e.g. the end-of-stream marker).  Order is kept
+    across both.
+    """
+
+    def __init__(self, hass: HomeAssistant, pool: InferencePool, name: str) -> None:
+        """Initialize an empty lane."""
+        self._hass = hass
+        self._pool = pool
+        self._name = name
+        self._queue: deque[tuple[Callable[[Any], Any] | None, Any, Callable]] = deque()
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    @callback
+    def submit(
+        self, fn: Callable[[Any], Any], arg: Any, on_result: Callable[[Any], None]
+    ) -> None:
+        """Queue fn(arg) to run on the pool; on_result(result) runs on the loop."""
+        if self._closed:
+            return
+        self._queue.append((fn, arg, on_result))
+        self._ensure_running()
+
+    @callback
+    def post(self, on_done: Callable[[], None]) -> None:
+        """Run on_done on the loop once everything queued before it is done."""
+        if self._closed:
+            return
+        self._queue.append((None, None, on_done))
+        self._ensure_running()
+
+    @callback
+    def close(self) -> None:
+        """Drop queued work; results still in flight are discarded."""
+        self._closed = True
+        self._queue.clear()
+
+    @callback
+    def _ensure_running(self) -> None:
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_drain(), f"{DOMAIN} {self._name} inference lane"
+            )
+
+    async def _async_drain(self) -> None:
+        try:
+            while self._queue and not self._closed:
+                fn, arg, on_done = self._queue[0]
+                if fn is None:
+                    self._queue.popleft()
+                    on_done()
+                    continue
+                # Everything queued up to the next marker goes as one job.
+                batch = []
+                while self._queue and self._queue[0][0] is not None:
+                    batch.append(self._queue.popleft())
+                try:
+                    results = await self._pool.async_run(
+                        _run_serial, [(fn, arg) for fn, arg, _ in batch]
+                    )
+                except Exception:
+                    _LOGGER.exception("Inference lane %s task failed", self._name)
+                    continue
+                if self._closed:
+                    return
+                for (_, _, on_result), result in zip(batch, results):
+                    if isinstance(result, _TaskFailed):
+                        self._pool.record_task_failure()
+                        _LOGGER.warning(
+                            "Inference lane %s task failed: %r",
+                            self._name,
+                            result.error,
+                            exc_info=result.error,
+                        )
+                        continue
+                    on_result(result)
+        finally:
+            self._task = None
+
+
+def _run_serial(tasks: list[tuple[Callable[[Any], Any], Any]]) -> list[Any]:
+    results: list[Any] = []
+    for fn, arg in tasks:
+        try:
+            results.append(fn(arg))
+        except Exception as err:  # noqa: BLE001 - reported per task on the loop
+            results.append(_TaskFailed(err))
+    return results
+
+
+@callback
+def async_get_inference_pool(hass: HomeAssistant) -> InferencePool:
+    """Return the integration's pool, creating it on first use."""
+    index = async_get_index(hass)
+    if index.inference_pool is None:
+        index.inference_pool = InferencePool(hass)
+    return index.inference_pool
+
+
+@callback
+def async_get_inference_metrics(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return the pool metrics, or None if nothing has used it yet."""
+    pool = async_get_index(hass).inference_pool
+    return pool.metrics() if pool is not None else None
+
+
+@callback
+def async_shutdown_inference_pool(hass: HomeAssistant) -> None:
+    """Stop the pool (last config entry unloaded)."""
+    index = async_get_index(hass)
+    pool, index.inference_pool = index.inference_pool, None
+    if pool is not None:
+        pool.shutdown()
@@ -31,6 +31,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 
 from .const import DOMAIN
+from .entity_index import async_get_index
 from .media_proxy import register_proxied_url
 
 _LOGGER = logging.getLogger(__name__)
@@ -70,8 +71,7 @@ async def async_setup_entry(
     async_add_entities([entity])
 
     # Store for WS handler lookup
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][f"{entry.entry_id}_media_player"] = entity
+    async_get_index(hass).entry(entry.entry_id).media_player = entity
 
 
 class VoiceSatelliteMediaPlayer(MediaPlayerEntity, RestoreEntity):
@@ -114,12 +114,18 @@ class VoiceSatelliteMediaPlayer(MediaPlayerEntity, RestoreEntity):
     async def async_added_to_hass(self) -> None:
         """Restore volume and mute state on startup."""
         await super().async_added_to_hass()
+        async_get_index(self.hass).add_media_player(self)
         extra_data = await self.async_get_last_extra_data()
         if extra_data:
             data = MediaPlayerExtraData.from_dict(extra_data.as_dict())
             self._attr_volume_level = data.volume_level
             self._attr_is_volume_muted = data.is_volume_muted
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop the entity_id mapping (unload, or rename before re-add)."""
+        async_get_index(self.hass).remove_media_player(self)
+        await super().async_will_remove_from_hass()
+
     @property
     def available(self) -> bool:
         """Available when the satellite has an active card connection."""
@@ -137,7 +143,8 @@ class VoiceSatelliteMediaPlayer(MediaPlayerEntity, RestoreEntity):
 
     def _get_satellite_entity(self):
         """Lazy-lookup the satellite entity for pushing events."""
-        return self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id)
+        siblings = async_get_index(self.hass).get_entry(self._entry.entry_id)
+        return siblings.satellite if siblings is not None else None
 
     def _push_command(self, command: str, **kwargs: Any) -> None:
         """Push a media_player command to the card via satellite subscription."""
@@ -0,0 +1,565 @@
+"""In-process microWakeWord inference (server side).
+
+Python port of the card's microWakeWord path (src/wake-word/micro-frontend-js
+and micro-inference.js), with the TFLite interpreter on the CPU:
+
+    16 kHz int16 audio -> micro frontend (30 ms window, 10 ms step)
+                       -> 40 log-PCAN features per step -> int8 quantize
+                       -> keyword model -> sliding-window mean > cutoff
+
+The frontend is the TFLite Micro feature generator the models were
+trained on: Hann window, fixed-point kiss FFT, mel filterbank, noise
+reduction, PCAN gain control and log scale.  The card's JS port is
+bit-exact with the C reference and so is this one - every integer wrap
+and float32 rounding is reproduced, vectorized with NumPy across the
+windows of one audio batch (tools/compare-wakeword-port.py checks the
+two against each other).  Tables are built once and shared; each
+MicroFrontend only holds its input tail and noise estimate.
+
+The keyword models are stateful (ring buffers in resource variables),
+so every MwwStream owns its own interpreter; the model bytes, manifest
+and quantization parameters are loaded once per model and shared.
+
+Detection follows the card: the first 100 feature frames are ignored,
+then the mean of the last `sliding_window_size` probabilities must
+exceed `probability_cutoff`.  Means within 0.03 of the cutoff are only
+accepted when the next inference (within 750 ms of audio) confirms them.
+Not ported: the browser's standby energy gate and trigger cooldown - a
+wake word run ends at its first detection.
+
+The TFLite runtime (ai-edge-litert or tflite-runtime) and NumPy are
+optional: callers check HAS_MWW first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+from collections import deque
+from pathlib import Path
+
+from .audio_codecs import HAS_NUMPY
+
+try:
+    from ai_edge_litert.interpreter import Interpreter
+
+    HAS_TFLITE = True
+except ImportError:
+    try:
+        from tflite_runtime.interpreter import Interpreter
+
+        HAS_TFLITE = True
+    except ImportError:
+        HAS_TFLITE = False
+
+if HAS_NUMPY:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+_LOGGER = logging.getLogger(__name__)
+
+HAS_MWW = HAS_NUMPY and HAS_TFLITE
+
+MWW_MODELS_DIR = Path(__file__).parent / "models"
+
+# Detection margin (1 - cutoff) factor per wake word sensitivity option
+# (SENSITIVITY_MARGIN_FACTORS in src/wake-word/index.js).
+MWW_SENSITIVITY_MARGIN_FACTORS = {
+    "Slightly sensitive": 0.5,
+    "Moderately sensitive": 1.0,
+    "Very sensitive": 2.0,
+}
+
+# Manifest fallbacks (micro-models.js).
+_DEFAULT_CUTOFF = 0.90
+_DEFAULT_SLIDING_WINDOW = 3
+_DEFAULT_STEP_SIZE = 10
+
+_WARMUP_FRAMES = 100
+_BORDERLINE_CONFIRM_MARGIN = 0.03
+_BORDERLINE_CONFIRM_WINDOW_MS = 750
+
+# ─── Micro frontend constants (micro-frontend-js/index.js) ───────────
+
+SAMPLE_RATE = 16000
+WINDOW_SIZE = 480  # 30 ms
+STEP_SIZE = 160  # 10 ms
+STEP_MS = 10
+FEATURE_SIZE = 40
+_FFT_SIZE = 512
+_NCFFT = _FFT_SIZE // 2
+_SPECTRUM_SIZE = _FFT_SIZE // 2 + 1
+_FILTERBANK_LOW_HZ = 125.0
+_FILTERBANK_HIGH_HZ = 7500.0
+_WINDOW_BITS = 12
+_NR_BITS = 14
+_NR_SMOOTHING_BITS = 10
+# C casts (truncates) these to int: 409, 983, 819.
+_NR_EVEN_SMOOTHING = int(0.025 * (1 << _NR_BITS))
+_NR_ODD_SMOOTHING = int(0.06 * (1 << _NR_BITS))
+_NR_MIN_SIGNAL = int(0.05 * (1 << _NR_BITS))
+_PCAN_SNR_BITS = 12
+_PCAN_OUTPUT_BITS = 6
+_PCAN_GAIN_BITS = 21
+_PCAN_STRENGTH = 0.95
+_PCAN_OFFSET = 80.0
+_WIDE_DYNAMIC_BITS = 32
+_LOG_SEGMENTS_LOG2 = 7
+_LOG_SCALE_LOG2 = 16
+_LOG_COEFF = 45426
+_FLOAT32_SCALE = 0.0390625
+_INPUT_CORRECTION_BITS = _FFT_SIZE.bit_length() - 1 - _WINDOW_BITS // 2
+_SNR_SHIFT = _PCAN_GAIN_BITS - _INPUT_CORRECTION_BITS - _PCAN_SNR_BITS
+_LOG_LUT = [
+    0, 224, 442, 654, 861, 1063, 1259, 1450, 1636, 1817, 1992, 2163, 2329, 2490,
+    2646, 2797, 2944, 3087, 3224, 3358, 3487, 3611, 3732, 3848, 3960, 4068, 4172,
+    4272, 4368, 4460, 4549, 4633, 4714, 4791, 4864, 4934, 5001, 5063, 5123, 5178,
+    5231, 5280, 5326, 5368, 5408, 5444, 5477, 5507, 5533, 5557, 5578, 5595, 5610,
+    5622, 5631, 5637, 5640, 5641, 5638, 5633, 5626, 5615, 5602, 5586, 5568, 5547,
+    5524, 5498, 5470, 5439, 5406, 5370, 5332, 5291, 5249, 5203, 5156, 5106, 5054,
+    5000, 4944, 4885, 4825, 4762, 4697, 4630, 4561, 4490, 4416, 4341, 4264, 4184,
+    4103, 4020, 3935, 3848, 3759, 3668, 3575, 3481, 3384, 3286, 3186, 3084, 2981,
+    2875, 2768, 2659, 2549, 2437, 2323, 2207, 2090, 1971, 1851, 1729, 1605, 1480,
+    1353, 1224, 1094, 963, 830, 695, 559, 421, 282, 142, 0, 0,
+]
+
+
+def _f32(value: float) -> float:
+    """Round a double to float32 (Math.fround)."""
+    return float(np.float32(value))
+
+
+def _wrap16(x: np.ndarray) -> np.ndarray:
+    """Int16 store: wrap to [-32768, 32767]."""
+    return ((x + 0x8000) & 0xFFFF) - 0x8000
+
+
+def _sround(x: np.ndarray) -> np.ndarray:
+    """kiss_fft sround on an int32 product: (x + 2^14) >> 15."""
+    return ((((x + 0x4000) + 0x80000000) & 0xFFFFFFFF) - 0x80000000) >> 15
+
+
+def _bit_length(x: np.ndarray) -> np.ndarray:
+    """Vectorized int.bit_length (exact below 2^53)."""
+    return np.frexp(x.astype(np.float64))[1].astype(np.int64)
+
+
+def _freq_to_mel(freq: float) -> float:
+    return _f32(1127.0 * _f32(math.log1p(_f32(freq / 700.0))))
+
+
+def _window_coefficients() -> np.ndarray:
+    arg = _f32(math.pi * 2.0 / WINDOW_SIZE)
+    coefficients = np.empty(WINDOW_SIZE, dtype=np.int64)
+    for i in range(WINDOW_SIZE):
+        phase = _f32(arg * _f32(i + 0.5))
+        v = _f32(0.5 - _f32(0.5 * _f32(math.cos(phase))))
+        coefficients[i] = math.floor(_f32(v * (1 << _WINDOW_BITS)) + 0.5)
+    return coefficients
+
+
+def _filterbank_matrix() -> np.ndarray:
+    """(spectrum bins, 41) int64 matrix of the C filterbank accumulation.
+
+    The C loop accumulates channel c's weights plus channel c-1's
+    unweights into work[c]; column c of the matrix holds exactly those
+    coefficients, so work = magnitudes @ matrix.  The C layout's aligned
+    starts and padded widths only add zero weights, so they are dropped.
+    """
+    channels = FEATURE_SIZE + 1
+    mel_low = _freq_to_mel(_FILTERBANK_LOW_HZ)
+    mel_high = _freq_to_mel(_FILTERBANK_HIGH_HZ)
+    mel_spacing = _f32(_f32(mel_high - mel_low) / channels)
+    centers = [_f32(mel_low + _f32(mel_spacing * (i + 1))) for i in range(channels)]
+    hz_per_sbin = _f32(0.5 * SAMPLE_RATE / (_SPECTRUM_SIZE - 1))
+
+    matrix = np.zeros((_SPECTRUM_SIZE, channels), dtype=np.int64)
+    frequency = int(_f32(1.5 + _FILTERBANK_LOW_HZ / hz_per_sbin))
+    for chan in range(channels):
+        center = centers[chan]
+        den = _f32(center - (mel_low if chan == 0 else centers[chan - 1]))
+        while (mel := _freq_to_mel(_f32(frequency * hz_per_sbin))) <= center:
+            weight = _f32(_f32(center - mel) / den)
+            matrix[frequency, chan] += math.floor(_f32(weight * (1 << _WINDOW_BITS)) + 0.5)
+            if chan + 1 < channels:
+                matrix[frequency, chan + 1] += math.floor(
+                    _f32(_f32(1.0 - weight) * (1 << _WINDOW_BITS)) + 0.5
+                )
+            frequency += 1
+    return matrix
+
+
+def _fft_plan() -> dict:
+    """Twiddles, super-twiddles and input order of the 256-point kiss FFT."""
+    k = np.arange(_NCFFT)
+    phase = -2.0 * np.pi * k / _NCFFT
+    tw_cos = np.floor(0.5 + 32767 * np.cos(phase)).astype(np.int64)
+    tw_sin = np.floor(0.5 + 32767 * np.sin(phase)).astype(np.int64)
+    k = np.arange(_NCFFT // 2)
+    phase = -np.pi * ((k + 1) / _NCFFT + 0.5)
+    st_cos = np.floor(0.5 + 32767 * np.cos(phase)).astype(np.int64)
+    st_sin = np.floor(0.5 + 32767 * np.sin(phase)).astype(np.int64)
+
+    # kf_factor: 256 = 4 * 4 * 4 * 4, all radix-4 butterflies.
+    stages = []
+    n, fstride = _NCFFT, 1
+    while n > 1:
+        n //= 4
+        stages.append((fstride, n))
+        fstride *= 4
+
+    # kf_work's leaf copies read the input in this (digit-reversed) order.
+    order: list[int] = []
+
+    def _leaves(src: int, stage: int) -> None:
+        fstride, m = stages[stage]
+        for j in range(4):
+            if m == 1:
+                order.append(src + j * fstride)
+            else:
+                _leaves(src + j * fstride, stage + 1)
+
+    _leaves(0, 0)
+    # Per stage (leaves first): m and the (3, m) twiddles of Fout[m..3m].
+    butterflies = []
+    for fstride, m in stages[::-1]:
+        k = np.arange(1, 4)[:, None] * fstride * np.arange(m)
+        butterflies.append((m, tw_cos[k], tw_sin[k]))
+    return {
+        "butterflies": butterflies,
+        "st_cos": st_cos,
+        "st_sin": st_sin,
+        "order": np.array(order),
+    }
+
+
+def _pcan_gain_lookup(input_bits: int, x: int) -> int:
+    x_as_float = _f32(x / (1 << input_bits))
+    gain = _f32((1 << _PCAN_GAIN_BITS) * _f32(_f32(x_as_float + _PCAN_OFFSET) ** -_PCAN_STRENGTH))
+    if gain > 0x7FFF:
+        return 0x7FFF
+    return math.floor(gain + 0.5)
+
+
+def _gain_lut() -> np.ndarray:
+    """PCAN gain table in the C layout (interval i at 4*i - 6)."""
+    lut = np.zeros(4 * _WIDE_DYNAMIC_BITS + 4, dtype=np.int64)
+    input_bits = _NR_SMOOTHING_BITS - _INPUT_CORRECTION_BITS
+    lut[0] = _pcan_gain_lookup(input_bits, 0)
+    lut[1] = _pcan_gain_lookup(input_bits, 1)
+    for interval in range(2, _WIDE_DYNAMIC_BITS + 1):
+        x0 = 1 << (interval - 1)
+        x1 = x0 + (x0 >> 1)
+        x2 = x0 + (x0 - 1) if interval == _WIDE_DYNAMIC_BITS else 2 * x0
+        y0 = _pcan_gain_lookup(input_bits, x0)
+        y1 = _pcan_gain_lookup(input_bits, x1)
+        y2 = _pcan_gain_lookup(input_bits, x2)
+        a1 = 4 * (y1 - y0) - (y2 - y0)
+        offset = 4 * interval - 6
+        lut[offset:offset + 3] = (y0, a1, (y2 - y0) - a1)
+    return _wrap16(lut)
+
+
+class _FrontendTables:
+    """Constant tables shared by every MicroFrontend."""
+
+    def __init__(self) -> None:
+        self.window = _window_coefficients()
+        self.filterbank = _filterbank_matrix()
+        self.fft = _fft_plan()
+        self.gain_lut = _gain_lut()
+        self.log_lut = np.array(_LOG_LUT, dtype=np.int64)
+        self.smoothing = np.where(
+            np.arange(FEATURE_SIZE) % 2 == 0, _NR_EVEN_SMOOTHING, _NR_ODD_SMOOTHING
+        ).astype(np.int64)
+
+
+_tables: _FrontendTables | None = None
+_tables_lock = threading.Lock()
+
+
+def _get_tables() -> _FrontendTables:
+    global _tables  # noqa: PLW0603
+    with _tables_lock:
+        if _tables is None:
+            _tables = _FrontendTables()
+        return _tables
+
+
+def _kiss_fftr(time: np.ndarray, plan: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Fixed-point real FFT of (B, 512) int16 rows -> (B, 257) int16 bins."""
+    batch = time.shape[0]
+    order = plan["order"]
+    # Pack real pairs as complex, in kf_work leaf order.
+    re = time[:, 0::2][:, order]
+    im = time[:, 1::2][:, order]
+    for m, w_r, w_i in plan["butterflies"]:
+        # kf_bfly4: C_FIXDIV(x, 4) on all four inputs, twiddle the last three.
+        r = _sround(re.reshape(batch, -1, 4, m) * 8191)
+        i = _sround(im.reshape(batch, -1, 4, m) * 8191)
+        r0, i0 = r[:, :, 0], i[:, :, 0]
+        t_r = _sround(r[:, :, 1:] * w_r - i[:, :, 1:] * w_i)
+        t_i = _sround(r[:, :, 1:] * w_i + i[:, :, 1:] * w_r)
+        s0r, s1r, s2r = t_r[:, :, 0], t_r[:, :, 1], t_r[:, :, 2]
+        s0i, s1i, s2i = t_i[:, :, 0], t_i[:, :, 1], t_i[:, :, 2]
+        s5r, s5i = r0 - s1r, i0 - s1i
+        f0r, f0i = _wrap16(r0 + s1r), _wrap16(i0 + s1i)
+        s3r, s3i = s0r + s2r, s0i + s2i
+        s4r, s4i = s0r - s2r, s0i - s2i
+        re = _wrap16(np.stack((f0r + s3r, s5r + s4i, f0r - s3r, s5r - s4i), axis=2))
+        im = _wrap16(np.stack((f0i + s3i, s5i - s4r, f0i - s3i, s5i + s4r), axis=2))
+        re = re.reshape(batch, _NCFFT)
+        im = im.reshape(batch, _NCFFT)
+
+    out_r = np.empty((batch, _SPECTRUM_SIZE), dtype=np.int64)
+    out_i = np.empty((batch, _SPECTRUM_SIZE), dtype=np.int64)
+    tdc_r = _sround(re[:, 0] * 16383)
+    tdc_i = _sround(im[:, 0] * 16383)
+    out_r[:, 0] = _wrap16(tdc_r + tdc_i)
+    out_r[:, _NCFFT] = _wrap16(tdc_r - tdc_i)
+    out_i[:, 0] = 0
+    out_i[:, _NCFFT] = 0
+
+    k = np.arange(1, _NCFFT // 2 + 1)
+    fpk_r = _sround(re[:, k] * 16383)
+    fpk_i = _sround(im[:, k] * 16383)
+    fpnk_r = _sround(re[:, _NCFFT - k] * 16383)
+    fpnk_i = _sround(_wrap16(-im[:, _NCFFT - k]) * 16383)
+    f1k_r, f1k_i = fpk_r + fpnk_r, fpk_i + fpnk_i
+    f2k_r, f2k_i = fpk_r - fpnk_r, fpk_i - fpnk_i
+    st_r, st_i = plan["st_cos"][k - 1], plan["st_sin"][k - 1]
+    tw_r = _sround(f2k_r * st_r - f2k_i * st_i)
+    tw_i = _sround(f2k_r * st_i + f2k_i * st_r)
+    out_r[:, k] = _wrap16((f1k_r + tw_r) >> 1)
+    out_i[:, k] = _wrap16((f1k_i + tw_i) >> 1)
+    # k == ncfft/2 writes the same bin twice; the mirrored store wins, as in C.
+    out_r[:, _NCFFT - k] = _wrap16((f1k_r - tw_r) >> 1)
+    out_i[:, _NCFFT - k] = _wrap16((tw_i - f1k_i) >> 1)
+    return out_r, out_i
+
+
+def _wide_dynamic(x: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """PCAN gain for noise estimates x (WideDynamicFunction)."""
+    interval = _bit_length(x)
+    offset = np.maximum(4 * interval - 6, 0)
+    frac = np.where(
+        interval < 11,
+        x << np.maximum(11 - interval, 0),
+        x >> np.maximum(interval - 11, 0),
+    ) & 0x3FF
+    result = (lut[offset + 2] * frac) // 32
+    result += lut[offset + 1] << 5
+    result *= frac
+    result = (result + (1 << 14)) // (1 << 15)
+    result += lut[offset]
+    return np.where(x <= 2, lut[np.minimum(x, 2)], result)
+
+
+def _log_scale(x: np.ndarray, log_lut: np.ndarray) -> np.ndarray:
+    """Fixed-point log of x > 1 (LogScale with the 128-segment LUT)."""
+    integer = _bit_length(x) - 1
+    frac = x - (np.int64(1) << integer)
+    frac = np.where(
+        integer < _LOG_SCALE_LOG2,
+        frac << np.maximum(_LOG_SCALE_LOG2 - integer, 0),
+        frac >> np.maximum(integer - _LOG_SCALE_LOG2, 0),
+    )
+    base_seg = frac >> (_LOG_SCALE_LOG2 - _LOG_SEGMENTS_LOG2)
+    c0 = log_lut[base_seg]
+    c1 = log_lut[base_seg + 1]
+    seg_base = (1 << (_LOG_SCALE_LOG2 - _LOG_SEGMENTS_LOG2)) * base_seg
+    rel_pos = ((c1 - c0) * (frac - seg_base)) // (1 << _LOG_SCALE_LOG2)
+    log2 = (integer << _LOG_SCALE_LOG2) + frac + c0 + rel_pos
+    round_ = 1 << (_LOG_SCALE_LOG2 - 1)
+    loge = (_LOG_COEFF * log2 + round_) // (1 << _LOG_SCALE_LOG2)
+    return ((loge << 6) + round_) // (1 << _LOG_SCALE_LOG2)
+
+
+class MicroFrontend:
+    """TFLite Micro feature generator for one audio stream."""
+
+    def __init__(self) -> None:
+        """Start with an empty window and a zero noise estimate."""
+        self._tables = _get_tables()
+        self._input = np.empty(0, dtype=np.int64)
+        self._noise_estimate = np.zeros(FEATURE_SIZE, dtype=np.int64)
+
+    def feed(self, samples: np.ndarray) -> np.ndarray:
+        """Feed int16 samples; return the (n, 40) float32 feature frames.
+
+        One frame per 10 ms step once 30 ms of audio is buffered; the
+        tail that does not complete a window is kept for the next call.
+        """
+        audio = np.concatenate((self._input, samples.astype(np.int64)))
+        count = (audio.size - WINDOW_SIZE) // STEP_SIZE + 1 if audio.size >= WINDOW_SIZE else 0
+        if count <= 0:
+            self._input = audio
+            return np.empty((0, FEATURE_SIZE), dtype=np.float32)
+        self._input = audio[count * STEP_SIZE:]
+        windows = sliding_window_view(audio, WINDOW_SIZE)[::STEP_SIZE][:count]
+        return self._process(windows)
+
+    def _process(self, windows: np.ndarray) -> np.ndarray:
+        tables = self._tables
+        windowed = (windows * tables.window) >> _WINDOW_BITS
+        # maxAbs can reach 2^15, which makes the JS shift count -1 (= 31).
+        shift = ((15 - _bit_length(np.abs(windowed).max(axis=1))) & 31)[:, None]
+        time = np.zeros((windows.shape[0], _FFT_SIZE), dtype=np.int64)
+        time[:, :WINDOW_SIZE] = _wrap16(((windowed & 0xFFFF) << shift) & 0xFFFF)
+
+        real, imag = _kiss_fftr(time, tables.fft)
+        magnitude = real * real + imag * imag
+        work = magnitude @ tables.filterbank
+        root = np.floor(np.sqrt(work[:, 1:].astype(np.float64)) + 0.5).astype(np.int64)
+        signal = (root & 0xFFFFFFFF) >> shift
+
+        # Noise reduction: the estimate is the only state carried between
+        # windows; everything after it is elementwise.
+        smoothing = tables.smoothing
+        scaled = (signal << _NR_SMOOTHING_BITS) & 0xFFFFFFFF
+        estimates = np.empty_like(signal)
+        estimate = self._noise_estimate
+        for n in range(signal.shape[0]):
+            estimate = (
+                (scaled[n] * smoothing + estimate * ((1 << _NR_BITS) - smoothing))
+                >> _NR_BITS
+            ) & 0xFFFFFFFF
+            estimates[n] = estimate
+        self._noise_estimate = estimate
+        floor = ((signal * _NR_MIN_SIGNAL) >> _NR_BITS) & 0xFFFFFFFF
+        reduced = (scaled - np.minimum(estimates, scaled)) >> _NR_SMOOTHING_BITS
+        signal = np.maximum(reduced, floor)
+
+        # PCAN auto gain control, then the log scale.
+        snr = (signal * _wide_dynamic(estimates, tables.gain_lut)) >> _SNR_SHIFT
+        signal = np.where(
+            snr < (2 << _PCAN_SNR_BITS),
+            (snr * snr) >> (2 + 2 * _PCAN_SNR_BITS - _PCAN_OUTPUT_BITS),
+            (snr >> (_PCAN_SNR_BITS - _PCAN_OUTPUT_BITS)) - (1 << _PCAN_OUTPUT_BITS),
+        )
+        corrected = signal << _INPUT_CORRECTION_BITS
+        logged = np.where(
+            corrected > 1,
+            _log_scale(np.maximum(corrected & 0xFFFFFFFF, 2), tables.log_lut),
+            0,
+        )
+        return (np.minimum(logged, 0xFFFF) * _FLOAT32_SCALE).astype(np.float32)
+
+
+class MwwModel:
+    """One microWakeWord model: manifest, flatbuffer and input quantization."""
+
+    def __init__(self, name: str, models_dir: Path = MWW_MODELS_DIR) -> None:
+        """Load the model (blocking; run in an executor)."""
+        self.name = name
+        manifest_path = models_dir / f"{name}.json"
+        manifest: dict = {}
+        if manifest_path.is_file():
+            with manifest_path.open(encoding="utf-8") as f:
+                manifest = json.load(f)
+        micro = manifest.get("micro") or {}
+        self.manifest = manifest
+        self.cutoff = float(micro.get("probability_cutoff", _DEFAULT_CUTOFF))
+        self.sliding_window = int(micro.get("sliding_window_size", _DEFAULT_SLIDING_WINDOW))
+        self.step_size = int(micro.get("feature_step_size", _DEFAULT_STEP_SIZE))
+        self.content = (models_dir / f"{name}.tflite").read_bytes()
+
+        interpreter = self.interpreter()
+        details = interpreter.get_input_details()[0]
+        scale, zero_point = details["quantization"]
+        self.input_scale = float(np.float32(scale)) if scale > 0 else 0.10196078568696976
+        self.input_zero_point = float(np.float32(zero_point))
+        self.frames_per_infer = max(1, int(np.prod(details["shape"])) // FEATURE_SIZE)
+
+    def interpreter(self) -> Interpreter:
+        """Create an interpreter with its own streaming state."""
+        interpreter = Interpreter(model_content=self.content, num_threads=1)
+        interpreter.allocate_tensors()
+        return interpreter
+
+
+class MwwStream:
+    """Streaming detection state for one keyword on one audio stream."""
+
+    def __init__(self, model: MwwModel, margin_factor: float = 1.0) -> None:
+        """Start a stream; margin_factor applies the sensitivity setting."""
+        self.model = model
+        self.cutoff = max(0.1, min(1 - (1 - model.cutoff) * margin_factor, 0.99))
+        self.frontend = MicroFrontend()
+        self._interpreter = model.interpreter()
+        input_details = self._interpreter.get_input_details()[0]
+        self._input_index = input_details["index"]
+        self._input_shape = input_details["shape"]
+        self._output_index = self._interpreter.get_output_details()[0]["index"]
+        self._accum: list[np.ndarray] = []
+        self._frames = 0
+        self._probabilities: deque[float] = deque(maxlen=model.sliding_window)
+        self._pending_at: int | None = None
+        self.last_mean = 0.0
+
+    def feed(self, pcm: bytes) -> str | None:
+        """Feed Int16 PCM; return the trigger type once the wake word fires.
+
+        The trigger type is "immediate" (mean clears the cutoff by the
+        borderline margin) or "confirmed" (borderline mean confirmed by
+        the next inference).
+        """
+        features = self.frontend.feed(np.frombuffer(pcm, dtype="<i2"))
+        for frame in features:
+            self._frames += 1
+            self._accum.append(frame)
+            if len(self._accum) < self.model.frames_per_infer:
+                continue
+            probability = self._infer(np.stack(self._accum))
+            self._accum.clear()
+            if self._frames < _WARMUP_FRAMES:
+                continue
+            self._probabilities.append(probability)
+            if len(self._probabilities) < self.model.sliding_window:
+                continue
+            self.last_mean = sum(self._probabilities) / self.model.sliding_window
+            trigger = self._check(self.last_mean)
+            if trigger:
+                return trigger
+        return None
+
+    def _infer(self, frames: np.ndarray) -> float:
+        model = self.model
+        # Same float32 steps and half-to-even rounding as the card.
+        divided = (frames.astype(np.float64) / model.input_scale).astype(np.float32)
+        shifted = (divided.astype(np.float64) + model.input_zero_point).astype(np.float32)
+        quantized = np.clip(np.round(shifted), -128, 127).astype(np.int8)
+        interpreter = self._interpreter
+        interpreter.set_tensor(self._input_index, quantized.reshape(self._input_shape))
+        interpreter.invoke()
+        return int(interpreter.get_tensor(self._output_index).reshape(-1)[0]) / 255.0
+
+    def _check(self, mean: float) -> str | None:
+        """Cutoff with borderline confirmation (_shouldTriggerKeyword)."""
+        pending_at, self._pending_at = self._pending_at, None
+        if mean <= self.cutoff:
+            return None
+        if mean >= self.cutoff + _BORDERLINE_CONFIRM_MARGIN:
+            return "immediate"
+        if pending_at is not None:
+            if (self._frames - pending_at) * STEP_MS <= _BORDERLINE_CONFIRM_WINDOW_MS:
+                return "confirmed"
+            return None
+        self._pending_at = self._frames
+        return None
+
+
+_models: dict[str, MwwModel] = {}
+_models_lock = threading.Lock()
+
+
+def get_mww_model(name: str) -> MwwModel:
+    """Return the shared model for `name` (blocking on first use)."""
+    with _models_lock:
+        model = _models.get(name)
+        if model is None:
+            _LOGGER.debug("Loading microWakeWord model %s", name)
+            model = _models[name] = MwwModel(name)
+        return model
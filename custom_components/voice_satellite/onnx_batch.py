@@ -0,0 +1,181 @@
+"""Free batch dimension for the bundled ONNX wake word models.
+
+The openWakeWord classifiers and the vsWakeWord CTC models are exported
+with a fixed batch of one, so onnxruntime rejects a stacked input even
+though nothing in most of the graphs depends on it.  free_batch_dim()
+rewrites the serialized model so the leading dimension of every graph
+input (initializers listed as inputs by old exporters excepted) and
+output is symbolic, and drops the graph's intermediate shape
+annotations (value_info) that still pin it; onnxruntime re-infers them
+when the session loads.
+
+The rewrite walks the protobuf wire format directly - only the few
+messages on the path to a dimension are decoded, every other field
+(initializers included) is copied through as bytes - so the onnx package
+is not needed.  A graph whose operators bake in the batch of one (a
+Reshape to a constant shape, say) still fails at load or at the first
+batched run; callers probe for that and keep running such a model once
+per stream.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+
+BATCH_DIM_PARAM = "batch"
+
+# ModelProto.graph, GraphProto.initializer/input/output/value_info,
+# TensorProto.name, ValueInfoProto.name/type, TypeProto.tensor_type,
+# TypeProto.Tensor.shape, TensorShapeProto.dim,
+# TensorShapeProto.Dimension.dim_value/dim_param.
+_MODEL_GRAPH = 7
+_GRAPH_INITIALIZER = 5
+_GRAPH_INPUT = 11
+_GRAPH_OUTPUT = 12
+_GRAPH_VALUE_INFO = 13
+_TENSOR_NAME = 8
+_VALUE_INFO_NAME = 1
+_VALUE_INFO_TYPE = 2
+_TYPE_TENSOR = 1
+_TENSOR_SHAPE = 2
+_SHAPE_DIM = 1
+_DIM_VALUE = 1
+_DIM_PARAM = 2
+
+_VARINT = 0
+_FIXED64 = 1
+_BYTES = 2
+_FIXED32 = 5
+
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _fields(buf: bytes) -> Iterator[tuple[int, int, bytes, bytes]]:
+    """Yield (field number, wire type, raw field bytes, payload) of a message.
+
+    The payload is the contents of a length-delimited field and empty
+    for the others.
+    """
+    pos = 0
+    while pos < len(buf):
+        start = pos
+        key, pos = _read_varint(buf, pos)
+        field, wire = key >> 3, key & 7
+        payload = b""
+        if wire == _VARINT:
+            _, pos = _read_varint(buf, pos)
+        elif wire == _FIXED64:
+            pos += 8
+        elif wire == _FIXED32:
+            pos += 4
+        elif wire == _BYTES:
+            length, pos = _read_varint(buf, pos)
+            payload = buf[pos:pos + length]
+            pos += length
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire}")
+        if pos > len(buf):
+            raise ValueError("Truncated protobuf message")
+        yield field, wire, buf[start:pos], payload
+
+
+def _message_field(field: int, payload: bytes) -> bytes:
+    return _varint(field << 3 | _BYTES) + _varint(len(payload)) + payload
+
+
+def _rewrite(
+    buf: bytes, rewriters: dict[int, Callable[[bytes], bytes | None]]
+) -> bytes:
+    """Copy a message, passing the listed message fields through a rewriter.
+
+    A rewriter returning None drops the field.
+    """
+    out = bytearray()
+    for field, wire, raw, payload in _fields(buf):
+        rewriter = rewriters.get(field) if wire == _BYTES else None
+        if rewriter is None:
+            out += raw
+            continue
+        rewritten = rewriter(payload)
+        if rewritten is not None:
+            out += _message_field(field, rewritten)
+    return bytes(out)
+
+
+def _batch_dim(dim: bytes) -> bytes:
+    return _message_field(_DIM_PARAM, BATCH_DIM_PARAM.encode()) + b"".join(
+        raw
+        for field, _, raw, _ in _fields(dim)
+        if field not in (_DIM_VALUE, _DIM_PARAM)
+    )
+
+
+def _free_shape(shape: bytes) -> bytes:
+    out = bytearray()
+    first = True
+    for field, wire, raw, payload in _fields(shape):
+        if first and field == _SHAPE_DIM and wire == _BYTES:
+            out += _message_field(field, _batch_dim(payload))
+            first = False
+        else:
+            out += raw
+    return bytes(out)
+
+
+def _free_value_info(value_info: bytes) -> bytes:
+    tensor = {_TENSOR_SHAPE: _free_shape}
+    type_ = {_TYPE_TENSOR: lambda payload: _rewrite(payload, tensor)}
+    return _rewrite(value_info, {_VALUE_INFO_TYPE: lambda payload: _rewrite(payload, type_)})
+
+
+def _name(message: bytes, field_number: int) -> bytes | None:
+    for field, wire, _, payload in _fields(message):
+        if field == field_number and wire == _BYTES:
+            return payload
+    return None
+
+
+def _free_graph(graph: bytes) -> bytes:
+    weights = {
+        _name(payload, _TENSOR_NAME)
+        for field, wire, _, payload in _fields(graph)
+        if field == _GRAPH_INITIALIZER and wire == _BYTES
+    }
+
+    def _free_input(value_info: bytes) -> bytes:
+        if _name(value_info, _VALUE_INFO_NAME) in weights:
+            return value_info
+        return _free_value_info(value_info)
+
+    return _rewrite(
+        graph,
+        {
+            _GRAPH_INPUT: _free_input,
+            _GRAPH_OUTPUT: _free_value_info,
+            _GRAPH_VALUE_INFO: lambda payload: None,
+        },
+    )
+
+
+def free_batch_dim(model: bytes) -> bytes:
+    """Return a serialized ONNX model with a symbolic leading batch dimension."""
+    return _rewrite(model, {_MODEL_GRAPH: _free_graph})
+
@@ -0,0 +1,350 @@
+"""In-process openWakeWord inference (server side).
+
+Runs the same three ONNX stages the card runs in the browser
+(src/wake-word/oww/inference.js), with onnxruntime on the CPU:
+
+    16 kHz int16 audio -> melspectrogram -> embedding -> classifier(s)
+
+Per 1280-sample (80 ms) chunk:
+  1. Prepend the last 480 samples of audio history -> 1760 samples -> mel.
+  2. Scale the mel frames (x / 10 + 2) and append them to the mel buffer.
+  3. Embed the latest 76 mel frames -> one 96-dim vector.
+  4. Append it to the rolling 16-embedding window and run each classifier.
+
+As upstream openWakeWord does, the mel buffer starts filled with ones and
+the embedding window with embeddings of pseudo-random noise, and the
+first few predictions of a stream are ignored while real audio replaces
+that padding.
+
+The ONNX sessions are shared by every stream and loaded once; each
+OwwStream only holds its own NumPy buffers.  feed_streams() runs every
+stage once per chunk step for all the streams it is given: mel and
+embedding natively batched, each classifier on the stacked windows of
+the streams scoring it (see onnx_batch.py).  onnxruntime and NumPy are
+optional: callers check HAS_OWW before using anything here.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+from .audio_codecs import HAS_NUMPY
+from .onnx_batch import free_batch_dim
+
+try:
+    import onnxruntime as ort
+
+    HAS_ONNXRUNTIME = True
+except ImportError:
+    HAS_ONNXRUNTIME = False
+
+if HAS_NUMPY:
+    import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+HAS_OWW = HAS_NUMPY and HAS_ONNXRUNTIME
+
+OWW_MODELS_DIR = Path(__file__).parent / "models" / "openwakeword"
+
+CHUNK_SAMPLES = 1280
+MEL_BINS = 32
+MEL_WINDOW = 76
+EMBEDDING_DIM = 96
+EMBEDDING_WINDOW = 16
+_MEL_PREFIX_SAMPLES = 160 * 3
+_MEL_BUFFER_MAX = 970
+# Predictions ignored at the start of a stream (openWakeWord upstream).
+_WARMUP_PREDICTIONS = 5
+_WARMUP_CHUNKS = EMBEDDING_WINDOW
+
+OWW_WAKE_THRESHOLD = 0.5  # matches the card and the HA openWakeWord add-on
+# The stop classifier is noisier on quiet speech; the card uses 0.65 too.
+OWW_STOP_MODEL = "stop"
+OWW_STOP_THRESHOLD = 0.65
+
+
+def onnx_session(path: Path, model: bytes | None = None) -> ort.InferenceSession:
+    """Open a CPU inference session for a bundled wake word model.
+
+    model, if given, is loaded in place of the file (a rewritten copy).
+    """
+    options = ort.SessionOptions()
+    # Many satellites share one HA core: keep each inference on one
+    # thread instead of fanning out across every core.
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+    return ort.InferenceSession(
+        model if model is not None else str(path),
+        sess_options=options,
+        providers=["CPUExecutionProvider"],
+    )
+
+
+class StackedSession:
+    """A bundled model run on stacked inputs from several streams.
+
+    The model is loaded with a free batch dimension and probed with a
+    batch of two; a graph that still needs a batch of one is loaded as
+    shipped and run once per input instead.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load the model (blocking; run in an executor)."""
+        self.batched = False
+        try:
+            session = onnx_session(path, free_batch_dim(path.read_bytes()))
+            model_input = session.get_inputs()[0]
+            probe = np.zeros((2, *model_input.shape[1:]), dtype=np.float32)
+            run_options = ort.RunOptions()
+            run_options.log_severity_level = 4  # a failed probe is expected
+            out = session.run(None, {model_input.name: probe}, run_options)[0]
+            self.batched = out.shape[0] == 2
+        except Exception as err:  # noqa: BLE001 - any failure means per-input runs
+            _LOGGER.debug("%s does not take a batch: %s", path.name, err)
+        if not self.batched:
+            session = onnx_session(path)
+        self._session = session
+        self.input_name = session.get_inputs()[0].name
+
+    def run(self, inputs: np.ndarray) -> np.ndarray:
+        """Return the first output for (b, ...) inputs, batch first."""
+        if self.batched or inputs.shape[0] == 1:
+            return self._session.run(None, {self.input_name: inputs})[0]
+        return np.concatenate(
+            [self._session.run(None, {self.input_name: x[None]})[0] for x in inputs]
+        )
+
+
+class OwwModels:
+    """Shared ONNX sessions: mel + embedding, plus classifiers by name."""
+
+    def __init__(self, models_dir: Path = OWW_MODELS_DIR) -> None:
+        """Load the shared front-end models (blocking; run in an executor)."""
+        self._dir = models_dir
+        self._mel = self._session("melspectrogram")
+        self._embedding = self._session("embedding_model")
+        self._mel_input = self._mel.get_inputs()[0].name
+        self._embedding_input = self._embedding.get_inputs()[0].name
+        self._classifiers: dict[str, StackedSession] = {}
+        self._lock = threading.Lock()
+        self.warm_window = self._noise_window()
+
+    def _session(self, name: str) -> ort.InferenceSession:
+        return onnx_session(self._dir / f"{name}.onnx")
+
+    def load_classifier(self, name: str) -> None:
+        """Load a classifier by model name (blocking; cached)."""
+        with self._lock:
+            if name not in self._classifiers:
+                self._classifiers[name] = StackedSession(self._dir / f"{name}.onnx")
+
+    def melspectrogram(self, samples: np.ndarray) -> np.ndarray:
+        """Return scaled mel frames (n, 32) for 1760 float32 samples."""
+        return self.melspectrogram_batch(samples[None, :])[0]
+
+    def melspectrogram_batch(self, samples: np.ndarray) -> np.ndarray:
+        """Return scaled mel frames (b, n, 32) for (b, 1760) samples."""
+        out = self._mel.run(None, {self._mel_input: samples})[0]
+        return out.reshape(samples.shape[0], -1, MEL_BINS) / 10.0 + 2.0
+
+    def embed(self, mel_window: np.ndarray) -> np.ndarray:
+        """Return the 96-dim embedding of a (76, 32) mel window."""
+        return self.embed_batch(mel_window[None])[0]
+
+    def embed_batch(self, mel_windows: np.ndarray) -> np.ndarray:
+        """Return (b, 96) embeddings of (b, 76, 32) mel windows."""
+        feed = mel_windows.reshape(-1, MEL_WINDOW, MEL_BINS, 1)
+        out = self._embedding.run(None, {self._embedding_input: feed})[0]
+        return out.reshape(-1, EMBEDDING_DIM)
+
+    def classify(self, name: str, window: np.ndarray) -> float:
+        """Return the wake word probability for a (16, 96) window."""
+        return float(self.classify_batch(name, window[None])[0])
+
+    def classify_batch(self, name: str, windows: np.ndarray) -> np.ndarray:
+        """Return the (b,) wake word probabilities for (b, 16, 96) windows."""
+        out = self._classifiers[name].run(windows)
+        return out.reshape(windows.shape[0], -1)[:, 0]
+
+    def _noise_window(self) -> np.ndarray:
+        """Embeddings of deterministic noise, as in OwwInference warmup."""
+        state = 0x9E3779B1
+        noise = np.empty(_WARMUP_CHUNKS * CHUNK_SAMPLES, dtype=np.float32)
+        for i in range(noise.size):
+            state = (state + 0x9E3779B1) & 0xFFFFFFFF
+            noise[i] = int(state / 0x100000000 * 2000) - 1000
+        stream = OwwStream(self, [], _warm=False)
+        for c in range(_WARMUP_CHUNKS):
+            stream.feed_chunk(noise[c * CHUNK_SAMPLES:(c + 1) * CHUNK_SAMPLES])
+        return stream.embeddings.copy()
+
+
+class OwwStream:
+    """Streaming detection state for one audio stream."""
+
+    def __init__(
+        self, models: OwwModels, classifiers: list[str], *, _warm: bool = True
+    ) -> None:
+        """Start a stream scoring the given (already loaded) classifiers."""
+        self._models = models
+        self._classifiers = list(classifiers)
+        self._history = np.zeros(_MEL_PREFIX_SAMPLES, dtype=np.float32)
+        self._mel_input = np.empty(
+            CHUNK_SAMPLES + _MEL_PREFIX_SAMPLES, dtype=np.float32
+        )
+        self._mel = np.empty((_MEL_BUFFER_MAX, MEL_BINS), dtype=np.float32)
+        self._mel[:MEL_WINDOW] = 1.0
+        self._mel_len = MEL_WINDOW
+        self.embeddings = (
+            models.warm_window.copy()
+            if _warm
+            else np.zeros((EMBEDDING_WINDOW, EMBEDDING_DIM), dtype=np.float32)
+        )
+        self._pending = np.empty(0, dtype=np.float32)
+        self._chunks = 0
+
+    @property
+    def classifiers(self) -> list[str]:
+        """Names of the classifiers scored on each embedding window."""
+        return list(self._classifiers)
+
+    def set_classifiers(self, classifiers: list[str]) -> None:
+        """Change the (already loaded) classifiers scored from now on.
+
+        The mel and embedding state is shared by every classifier, so a
+        classifier added mid-stream scores the current window right away.
+        """
+        self._classifiers = list(classifiers)
+
+    def feed(self, pcm: bytes) -> dict[str, float]:
+        """Feed Int16 PCM; return the best score per classifier this call.
+
+        Audio that does not fill a whole chunk is kept for the next call.
+        Returns an empty dict if no chunk completed.
+        """
+        return feed_streams(self._models, [(self, pcm)])[0]
+
+    def feed_chunk(self, chunk: np.ndarray) -> None:
+        """Run the mel + embedding stages on one 1280-sample chunk."""
+        models = self._models
+        self.push_mel(models.melspectrogram(self.mel_samples(chunk)))
+        self.push_embedding(models.embed(self.mel_window()))
+
+    def split_chunks(self, pcm: bytes) -> list[np.ndarray]:
+        """Whole chunks of Int16 PCM plus the pending tail; keep the rest."""
+        samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32)
+        if self._pending.size:
+            samples = np.concatenate((self._pending, samples))
+        whole = samples.size - samples.size % CHUNK_SAMPLES
+        self._pending = samples[whole:].copy()
+        return [samples[start:start + CHUNK_SAMPLES] for start in range(0, whole, CHUNK_SAMPLES)]
+
+    def mel_samples(self, chunk: np.ndarray) -> np.ndarray:
+        """Mel input for a chunk: the last 480 samples of history + chunk."""
+        mel_input = self._mel_input
+        mel_input[:_MEL_PREFIX_SAMPLES] = self._history
+        mel_input[_MEL_PREFIX_SAMPLES:] = chunk
+        self._history[:] = chunk[-_MEL_PREFIX_SAMPLES:]
+        return mel_input
+
+    def push_mel(self, frames: np.ndarray) -> None:
+        """Append a chunk's mel frames to the mel buffer."""
+        count = frames.shape[0]
+        if self._mel_len + count > _MEL_BUFFER_MAX:
+            keep = _MEL_BUFFER_MAX - count
+            self._mel[:keep] = self._mel[self._mel_len - keep:self._mel_len]
+            self._mel_len = keep
+        self._mel[self._mel_len:self._mel_len + count] = frames
+        self._mel_len += count
+
+    def mel_window(self) -> np.ndarray:
+        """The latest 76 mel frames - the embedding model's input."""
+        return self._mel[self._mel_len - MEL_WINDOW:self._mel_len]
+
+    def push_embedding(self, embedding: np.ndarray) -> None:
+        """Roll a chunk's embedding into the classifier window."""
+        self.embeddings[:-1] = self.embeddings[1:]
+        self.embeddings[-1] = embedding
+        self._chunks += 1
+
+    @property
+    def warming_up(self) -> bool:
+        """True while the window still holds warmup padding."""
+        return self._chunks <= _WARMUP_PREDICTIONS
+
+    def score(self) -> dict[str, float]:
+        """Classify the current embedding window with every classifier.
+
+        The mel and embedding stages ran once for the window; adding a
+        classifier only adds its own (small) inference.
+        """
+        return score_streams(self._models, [self])[0]
+
+
+def score_streams(
+    models: OwwModels, streams: list[OwwStream]
+) -> list[dict[str, float]]:
+    """Classify the current embedding window of several streams.
+
+    Streams still warming up score 0.0; the windows of the others are
+    stacked into one inference per classifier.
+    """
+    scores: list[dict[str, float]] = [
+        dict.fromkeys(stream.classifiers, 0.0) for stream in streams
+    ]
+    scoring: dict[str, list[int]] = {}
+    for n, stream in enumerate(streams):
+        if not stream.warming_up:
+            for name in stream.classifiers:
+                scoring.setdefault(name, []).append(n)
+    for name, indices in scoring.items():
+        windows = np.stack([streams[n].embeddings for n in indices])
+        for n, prob in zip(indices, models.classify_batch(name, windows)):
+            scores[n][name] = float(prob)
+    return scores
+
+
+def feed_streams(
+    models: OwwModels, jobs: list[tuple[OwwStream, bytes]]
+) -> list[dict[str, float]]:
+    """Feed several streams at once; return each one's best scores.
+
+    Chunk by chunk, the mel, embedding and classifier stages of every
+    stream with audio left run as one inference each (per classifier
+    for the last).
+    """
+    chunks = [stream.split_chunks(pcm) for stream, pcm in jobs]
+    best: list[dict[str, float]] = [{} for _ in jobs]
+    for step in range(max((len(c) for c in chunks), default=0)):
+        active = [n for n, c in enumerate(chunks) if step < len(c)]
+        streams = [jobs[n][0] for n in active]
+        frames = models.melspectrogram_batch(
+            np.stack([s.mel_samples(chunks[n][step]) for s, n in zip(streams, active)])
+        )
+        for stream, stream_frames in zip(streams, frames):
+            stream.push_mel(stream_frames)
+        embeddings = models.embed_batch(np.stack([s.mel_window() for s in streams]))
+        for stream, embedding in zip(streams, embeddings):
+            stream.push_embedding(embedding)
+        for n, scores in zip(active, score_streams(models, streams)):
+            for name, prob in scores.items():
+                if prob > best[n].get(name, -1.0):
+                    best[n][name] = prob
+    return best
+
+
+_models: OwwModels | None = None
+_models_lock = threading.Lock()
+
+
+def get_oww_models() -> OwwModels:
+    """Return the process-wide shared models (blocking on first use)."""
+    global _models  # noqa: PLW0603
+    with _models_lock:
+        if _models is None:
+            _LOGGER.debug("Loading openWakeWord models from %s", OWW_MODELS_DIR)
+            _models = OwwModels()
+        return _models
@@ -0,0 +1,129 @@
+"""Hand a satellite over from a displaced pipeline run to the next one.
+
+A new voice_satellite/run_pipeline call ends the satellite's current run
+by putting the stop marker on its audio queue: the stream ends, HA's
+wake word / STT tasks unblock and the run unwinds on its own.  Cancelling
+it outright instead makes the CancelledError race the stop marker on
+`await audio_queue.get()`, and the cancellation wins, leaving orphaned
+PipelineInput tasks behind.
+
+The handler used to wait for that unwind (up to 3 s) before starting the
+new run, so wake-to-listening latency spiked whenever the old run was
+slow to let go.  Now the new run starts at once, and
+async_drain_displaced_run() waits for the old task in the background and
+cancels it only after DRAIN_TIMEOUT_S.  Until then both runs are alive:
+every run tags its task context with its generation (RUN_GENERATION), and
+the satellite's on_pipeline_event drops events whose generation is no
+longer current, so the old run cannot reach the new run's card (nor,
+where HA's stage-state hook exists, change the satellite state).
+
+HandoffStats records the handoff gap (request received until the new
+run's task is started) and how long displaced runs took to drain, for the
+voice_satellite/get_metrics command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Generation of the pipeline run that owns the current task context; None
+# outside bridged runs (announcements, conversations started by HA).
+RUN_GENERATION: ContextVar[int | None] = ContextVar(
+    f"{DOMAIN}_run_generation", default=None
+)
+
+# How long a displaced run may take to unwind before it is cancelled.
+DRAIN_TIMEOUT_S = 3.0
+
+
+@dataclass(slots=True)
+class HandoffStats:
+    """Cumulative pipeline handoff timings for one satellite."""
+
+    runs: int = 0
+    displaced: int = 0
+    forced_cancels: int = 0
+    handoff_gap_ms_last: float = 0.0
+    handoff_gap_ms_max: float = 0.0
+    handoff_gap_ms_total: float = 0.0
+    drain_ms_last: float = 0.0
+    drain_ms_max: float = 0.0
+
+    def record_handoff(self, gap_s: float, displaced: bool) -> None:
+        """Count a run start and the gap since its request arrived."""
+        gap_ms = gap_s * 1000
+        self.runs += 1
+        if displaced:
+            self.displaced += 1
+        self.handoff_gap_ms_last = gap_ms
+        self.handoff_gap_ms_max = max(self.handoff_gap_ms_max, gap_ms)
+        self.handoff_gap_ms_total += gap_ms
+
+    def record_drain(self, drain_s: float, forced: bool) -> None:
+        """Count a displaced run that finished unwinding."""
+        drain_ms = drain_s * 1000
+        if forced:
+            self.forced_cancels += 1
+        self.drain_ms_last = drain_ms
+        self.drain_ms_max = max(self.drain_ms_max, drain_ms)
+
+    def as_dict(self) -> dict:
+        """Return the counters as a JSON-serializable dict."""
+        return {
+            "runs": self.runs,
+            "displaced": self.displaced,
+            "forced_cancels": self.forced_cancels,
+            "handoff_gap_ms": {
+                "last": round(self.handoff_gap_ms_last, 2),
+                "mean": round(self.handoff_gap_ms_total / self.runs, 2)
+                if self.runs
+                else 0.0,
+                "max": round(self.handoff_gap_ms_max, 2),
+            },
+            "drain_ms": {
+                "last": round(self.drain_ms_last, 1),
+                "max": round(self.drain_ms_max, 1),
+            },
+        }
+
+
+async def async_drain_displaced_run(
+    task: asyncio.Task, name: str, stats: HandoffStats
+) -> None:
+    """Wait for a displaced run to unwind; cancel it after DRAIN_TIMEOUT_S."""
+    started = time.monotonic()
+    done, _ = await asyncio.wait({task}, timeout=DRAIN_TIMEOUT_S)
+    forced = not done
+    if forced:
+        _LOGGER.debug(
+            "Displaced pipeline for '%s' did not stop within %.0f s, cancelling",
+            name,
+            DRAIN_TIMEOUT_S,
+        )
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+    stats.record_drain(time.monotonic() - started, forced)
+
+
+@callback
+def async_start_drain(
+    hass: HomeAssistant, task: asyncio.Task, name: str, stats: HandoffStats
+) -> None:
+    """Drain a displaced run in the background."""
+    hass.async_create_background_task(
+        async_drain_displaced_run(task, name, stats),
+        f"{DOMAIN} {name} displaced pipeline drain",
+    )
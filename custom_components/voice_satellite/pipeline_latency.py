@@ -0,0 +1,178 @@
+"""Per-stage latency of a satellite's pipeline runs.
+
+A slow answer can come from any stage: the hop from the wake word into
+STT, the STT engine finalizing the transcript, the conversation agent,
+the TTS engine, or the card getting the audio playing.  The satellite
+feeds every pipeline event of its current run into a LatencyTracker,
+and the card acknowledges the start of TTS playback with
+voice_satellite/tts_playback_started.  From those timestamps each run
+yields up to five stage durations:
+
+  * wake     - wake word detected (wake_word-end, or run-start for a run
+               that starts at STT) until stt-start
+  * stt      - end of speech (stt-vad-end) until the transcript (stt-end)
+  * intent   - intent-start until intent-end
+  * tts      - tts-start until tts-end
+  * response - end of speech (stt-vad-end, else stt-end) until the card
+               reports the first audio playing; what the user waits for
+
+A stage that did not happen in a run (text input, a run that ended with
+an error, speech ended by the card rather than VAD) is simply not
+recorded.  Each stage keeps the last LATENCY_WINDOW samples for its
+rolling p50/p95 - the satellite's latency sensors - and a cumulative
+histogram over LATENCY_BUCKETS_MS for the voice_satellite/get_latency
+command.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+STAGE_WAKE = "wake"
+STAGE_STT = "stt"
+STAGE_INTENT = "intent"
+STAGE_TTS = "tts"
+STAGE_RESPONSE = "response"
+LATENCY_STAGES = (STAGE_WAKE, STAGE_STT, STAGE_INTENT, STAGE_TTS, STAGE_RESPONSE)
+
+# Samples per stage behind the rolling percentiles.
+LATENCY_WINDOW = 100
+# Histogram upper bounds (ms); a final bucket catches everything above.
+LATENCY_BUCKETS_MS = (
+    50, 100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000,
+)
+# A playback ACK later than this after the end of speech belongs to
+# something else (a retry after a stall, a stale tab) and is ignored.
+FIRST_AUDIO_TIMEOUT_S = 60.0
+
+# (stage, start events in order of preference, end event).
+_EVENT_STAGES: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    (STAGE_WAKE, ("wake_word-end", "run-start"), "stt-start"),
+    (STAGE_STT, ("stt-vad-end",), "stt-end"),
+    (STAGE_INTENT, ("intent-start",), "intent-end"),
+    (STAGE_TTS, ("tts-start",), "tts-end"),
+)
+_SPEECH_END_EVENTS = ("stt-vad-end", "stt-end")
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass(slots=True)
+class StageLatency:
+    """Samples and histogram of one stage."""
+
+    window: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_WINDOW)
+    )
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, ms: float) -> None:
+        """Add one sample."""
+        self.window.append(ms)
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Rolling percentile over the window, None before the first sample."""
+        if not self.window:
+            return None
+        return round(_percentile(sorted(self.window), q), 1)
+
+    def summary(self) -> dict:
+        """Return count and rolling percentiles as a JSON-serializable dict."""
+        ordered = sorted(self.window)
+        return {
+            "count": self.count,
+            "p50": round(_percentile(ordered, 50), 1) if ordered else None,
+            "p95": round(_percentile(ordered, 95), 1) if ordered else None,
+            "last": round(self.window[-1], 1) if ordered else None,
+        }
+
+    def as_dict(self) -> dict:
+        """Return the summary plus the cumulative histogram."""
+        return {
+            **self.summary(),
+            "mean": round(self.total_ms / self.count, 1) if self.count else None,
+            "max": round(self.max_ms, 1),
+            "buckets": [
+                {"le": bound, "count": n}
+                for bound, n in zip(
+                    (*LATENCY_BUCKETS_MS, None), self.buckets, strict=True
+                )
+            ],
+        }
+
+
+class LatencyTracker:
+    """Timestamps one satellite's pipeline runs into per-stage latencies."""
+
+    def __init__(self) -> None:
+        """Initialize with no samples."""
+        self.stages: dict[str, StageLatency] = {
+            stage: StageLatency() for stage in LATENCY_STAGES
+        }
+        self._marks: dict[str, float] = {}
+        self._speech_end: float | None = None
+
+    def on_event(self, event_type: str) -> str | None:
+        """Timestamp a pipeline event; return the stage it completed, if any."""
+        now = time.monotonic()
+        if event_type == "run-start":
+            self._marks = {}
+            self._speech_end = None
+        self._marks.setdefault(event_type, now)
+        if event_type in _SPEECH_END_EVENTS and self._speech_end is None:
+            self._speech_end = now
+
+        for stage, starts, end in _EVENT_STAGES:
+            if event_type != end:
+                continue
+            start = next(
+                (self._marks[s] for s in starts if s in self._marks), None
+            )
+            if start is None:
+                return None
+            self.stages[stage].record((now - start) * 1000)
+            return stage
+        return None
+
+    def on_first_audio(self) -> bool:
+        """Record the card's playback ACK; False if no run is waiting for one."""
+        speech_end = self._speech_end
+        if speech_end is None:
+            return False
+        self._speech_end = None  # one sample per run, retries excluded
+        elapsed = time.monotonic() - speech_end
+        if elapsed > FIRST_AUDIO_TIMEOUT_S:
+            return False
+        self.stages[STAGE_RESPONSE].record(elapsed * 1000)
+        return True
+
+    def summary(self) -> dict:
+        """Rolling percentiles of every stage, for get_metrics."""
+        return {stage: s.summary() for stage, s in self.stages.items()}
+
+    def as_dict(self) -> dict:
+        """Percentiles and histograms of every stage, for get_latency."""
+        return {
+            "window": LATENCY_WINDOW,
+            "stages": {stage: s.as_dict() for stage, s in self.stages.items()},
+        }
@@ -38,6 +38,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
+from .entity_index import async_get_index
+from .wake_arbitration import WAKE_ARBITRATION_DEFAULT, WAKE_ARBITRATION_OPTIONS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,8 +85,10 @@ async def async_setup_entry(
         VoiceSatelliteWakeWordModelSelect(hass, entry, mww_models, oww_models, vww_models, detection_select),
         wake_word_2_select,
         VoiceSatelliteWakeWordSensitivitySelect(hass, entry, detection_select),
+        VoiceSatelliteWakeArbitrationSelect(hass, entry),
     ]
     async_add_entities(entities)
+    async_get_index(hass).entry(entry.entry_id).wake_word_model_2 = wake_word_2_select
 
     # Clean up stale select entities from older integration versions
     expected_uids = {e.unique_id for e in entities}
@@ -423,6 +427,57 @@ class VoiceSatelliteSessionDurationSelect(SelectEntity, RestoreEntity):
             self.async_write_ha_state()
 
 
+class VoiceSatelliteWakeArbitrationSelect(SelectEntity, RestoreEntity):
+    """Select entity for the wake word arbitration group.
+
+    Satellites of the same group that hear the same wake word compete for
+    it on the server (see wake_arbitration.py): only the best candidate
+    runs STT.  "Same area" groups by the device's area; the numbered
+    groups span areas (e.g. an open-plan kitchen and living room).
+    """
+
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_has_entity_name = True
+    _attr_translation_key = "wake_arbitration"
+    _attr_icon = "mdi:account-voice"
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the wake arbitration select entity."""
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_wake_arbitration"
+        self._selected_option: str = WAKE_ARBITRATION_DEFAULT
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device info - same identifiers as the satellite entity."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+        }
+
+    @property
+    def options(self) -> list[str]:
+        """Return available options."""
+        return list(WAKE_ARBITRATION_OPTIONS)
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the currently selected option."""
+        return self._selected_option
+
+    async def async_added_to_hass(self) -> None:
+        """Restore previous selection on startup."""
+        await super().async_added_to_hass()
+        last_state = await self.async_get_last_state()
+        if last_state and last_state.state in WAKE_ARBITRATION_OPTIONS:
+            self._selected_option = last_state.state
+
+    async def async_select_option(self, option: str) -> None:
+        """Handle option selection."""
+        if option in WAKE_ARBITRATION_OPTIONS:
+            self._selected_option = option
+            self.async_write_ha_state()
+
+
 WAKE_WORD_DETECTION_HA = "Home Assistant"
 # microWakeWord remains the default (smaller, faster).  openWakeWord is
 # offered as a higher-end alternative for more capable browsers.
@@ -956,6 +1011,17 @@ class VoiceSatelliteWakeWordModel2Select(SelectEntity, RestoreEntity):
         """True when slot 2 (for the active engine) is configured to a real model."""
         return self.current_option != WAKE_WORD_2_DISABLED
 
+    @property
+    def oww_selection(self) -> str | None:
+        """Slot 2 openWakeWord model, whichever engine is active.
+
+        Read by the in-process openWakeWord entity, which scores it
+        alongside the pipeline's wake word when detection runs in HA.
+        """
+        if self._selected_oww in self._oww_models:
+            return self._selected_oww
+        return None
+
     async def async_added_to_hass(self) -> None:
         """Restore per-engine selections on startup."""
         await super().async_added_to_hass()
@@ -0,0 +1,88 @@
+"""Sensor entities for Voice Satellite integration.
+
+Pipeline latency - rolling p50 and p95 of each pipeline stage of the
+satellite's runs (see pipeline_latency.py), in milliseconds.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity_index import async_get_index
+from .pipeline_latency import LATENCY_STAGES
+
+_LOGGER = logging.getLogger(__name__)
+
+_PERCENTILES = (50, 95)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up sensor entities from a config entry."""
+    sensors = [
+        VoiceSatelliteLatencySensor(entry, stage, q)
+        for stage in LATENCY_STAGES
+        for q in _PERCENTILES
+    ]
+    async_add_entities(sensors)
+    async_get_index(hass).entry(entry.entry_id).latency_sensors = sensors
+
+
+class VoiceSatelliteLatencySensor(SensorEntity):
+    """Rolling percentile of one pipeline stage's latency."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:timer-sand"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, entry: ConfigEntry, stage: str, percentile: int) -> None:
+        """Initialize the latency sensor."""
+        self._entry = entry
+        self.stage = stage
+        self._percentile = percentile
+        self._attr_translation_key = f"{stage}_latency_p{percentile}"
+        self._attr_unique_id = f"{entry.entry_id}_{stage}_latency_p{percentile}"
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device info - same identifiers as the satellite entity."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the stage's rolling percentile, None before any run."""
+        siblings = async_get_index(self.hass).get_entry(self._entry.entry_id)
+        if siblings is None or siblings.satellite is None:
+            return None
+        return siblings.satellite.latency.stages[self.stage].percentile(
+            self._percentile
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of samples behind the value."""
+        siblings = async_get_index(self.hass).get_entry(self._entry.entry_id)
+        if siblings is None or siblings.satellite is None:
+            return {"samples": 0}
+        return {"samples": len(siblings.satellite.latency.stages[self.stage].window)}
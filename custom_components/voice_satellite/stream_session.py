@@ -0,0 +1,165 @@
+"""Binary audio ingest and the long-lived streaming session.
+
+Every voice_satellite/run_pipeline call registers its own binary handler,
+decode lane and audio queue, and the card opens a new subscription for
+each wake and each continue-conversation turn: one more round trip and
+setup per turn.  A streaming session keeps the transport instead:
+
+  * voice_satellite/stream_session subscribes once per satellite and
+    card.  It registers one binary handler (AudioIngest) and answers
+    with an `init` event carrying its handler_id, like run_pipeline.
+  * voice_satellite/session_turn starts a pipeline run on that stream.
+    The ingest's sink is switched to the new run's audio queue, the
+    previous run is displaced like a run_pipeline call would displace it,
+    and the run's events go out on the session subscription tagged with
+    the turn number (TurnConnection), so the card can tell a late event
+    of the previous turn from the current one.
+  * An empty binary payload ends the current turn's audio stream; the
+    session stays up until the subscription is closed.
+
+AudioIngest is shared with run_pipeline: payloads are decoded (and
+resampled) in order on an inference pool lane, written to the satellite's
+pre-roll buffer, and handed to whichever queue is the current sink.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .audio_codecs import AUDIO_CODEC_PCM16, get_decoder
+from .audio_queue import AudioFrameQueue
+from .audio_resample import PIPELINE_SAMPLE_RATE, StreamingResampler
+from .inference_pool import async_get_inference_pool
+
+if TYPE_CHECKING:
+    from .assist_satellite import VoiceSatelliteEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AudioIngest:
+    """Decodes one connection's binary audio payloads for a satellite.
+
+    Raises RuntimeError if the sample rate needs a resampler that is not
+    available.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity: VoiceSatelliteEntity,
+        codec: str,
+        sample_rate: int,
+    ) -> None:
+        """Set up the decoder, resampler and decode lane."""
+        self.sink: AudioFrameQueue | None = None
+        self._entity = entity
+        self._codec = codec
+        self._decode = get_decoder(codec)
+        self._resampler = (
+            StreamingResampler(sample_rate)
+            if sample_rate != PIPELINE_SAMPLE_RATE
+            else None
+        )
+        self._lane = async_get_inference_pool(hass).lane(
+            f"{entity.satellite_name} audio"
+        )
+        # Raw 16 kHz PCM has nothing to decode: skip the pool hop.
+        self._passthrough = codec == AUDIO_CODEC_PCM16 and self._resampler is None
+
+    def _decode_payload(self, data: bytes) -> bytes:
+        try:
+            data = self._decode(data)
+        except ValueError:
+            _LOGGER.debug("Dropping malformed %s audio payload", self._codec)
+            return b""
+        if self._resampler is not None:
+            data = self._resampler.process(data)
+        return data
+
+    @callback
+    def _on_decoded(self, data: bytes) -> None:
+        if not data:
+            return  # nothing decoded/resampled yet; b"" would mean stop
+        self._entity.preroll.write(data)
+        if self.sink is not None:
+            self.sink.put_nowait(data)
+
+    @callback
+    def on_binary(self, _hass: HomeAssistant, _connection: Any, data: bytes) -> None:
+        """Binary handler: decode a payload, or stop the sink on b""."""
+        if data:
+            if self._passthrough:
+                self._on_decoded(data)
+            else:
+                self._lane.submit(self._decode_payload, data, self._on_decoded)
+            return
+        sink = self.sink
+        if sink is None:
+            return
+        if self._passthrough:
+            sink.put_nowait(b"")
+        else:
+            # Behind the payloads still decoding, into the queue current now.
+            self._lane.post(lambda: sink.put_nowait(b""))
+
+    @callback
+    def close(self) -> None:
+        """Drop queued payloads and stop the current sink."""
+        self._lane.close()
+        if self.sink is not None:
+            self.sink.put_nowait(b"")
+
+
+class TurnConnection:
+    """A session subscription as seen by one turn: events carry the turn."""
+
+    def __init__(self, connection: Any, turn: int) -> None:
+        """Wrap the session's WebSocket connection for one turn."""
+        self.connection = connection
+        self._turn = turn
+
+    def send_event(self, msg_id: int, event: dict) -> None:
+        """Send an event on the session subscription, tagged with the turn."""
+        self.connection.send_event(msg_id, {**event, "turn": self._turn})
+
+
+class StreamSession:
+    """One satellite's persistent audio stream and its turn counter."""
+
+    def __init__(
+        self,
+        ingest: AudioIngest,
+        connection: Any,
+        msg_id: int,
+        unregister: Callable[[], None],
+        *,
+        frame_ms: int,
+        queue_max_bytes: int,
+        queue_policy: str,
+    ) -> None:
+        """Initialize a session around a registered binary handler."""
+        self.ingest = ingest
+        self.connection = connection
+        self.msg_id = msg_id
+        self.frame_ms = frame_ms
+        self.queue_max_bytes = queue_max_bytes
+        self.queue_policy = queue_policy
+        self.turns = 0
+        self._unregister = unregister
+
+    @callback
+    def next_turn(self) -> TurnConnection:
+        """Number the next turn and return its tagged connection."""
+        self.turns += 1
+        return TurnConnection(self.connection, self.turns)
+
+    @callback
+    def close(self) -> None:
+        """Stop the current turn's stream and release the binary handler."""
+        self.ingest.close()
+        self._unregister()
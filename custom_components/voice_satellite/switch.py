@@ -4,6 +4,9 @@ Wake sound switch - enable/disable the wake word chime.
 Mute switch - mute/unmute the satellite microphone.
 Mute timers switch - silence the timer alert sounds.
 Screensaver switch - enable/disable the built-in screensaver.
+Wake word verification switch - re-check browser wake word detections
+on the server before STT.
+Speech gate switch - trim silence from stt runs on the server.
 """
 
 from __future__ import annotations
@@ -42,6 +45,8 @@ async def async_setup_entry(
         VoiceSatelliteNoiseGateSwitch(entry),
         VoiceSatelliteStopWordSwitch(entry),
         VoiceSatelliteScreensaverSwitch(entry),
+        VoiceSatelliteWakeWordVerifySwitch(entry),
+        VoiceSatelliteVadGateSwitch(entry),
     ]
     async_add_entities(entities)
 
@@ -324,3 +329,88 @@ class VoiceSatelliteScreensaverSwitch(SwitchEntity, RestoreEntity):
         self.async_write_ha_state()
 
 
+class VoiceSatelliteWakeWordVerifySwitch(SwitchEntity, RestoreEntity):
+    """Switch entity for server-side verification of browser wake words.
+
+    When on, the card sends its pre-roll with every On Device detection
+    and the run re-scores it before the STT stage (see wake_word_verify.py).
+    """
+
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_has_entity_name = True
+    _attr_translation_key = "wake_word_verify"
+    _attr_icon = "mdi:shield-check-outline"
+
+    def __init__(self, entry: ConfigEntry) -> None:
+        """Initialize the wake word verification switch."""
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_wake_word_verify"
+        self._attr_is_on = False  # Default: disabled, adds a round trip per wake
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device info - same identifiers as the satellite entity."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Restore previous state on startup."""
+        await super().async_added_to_hass()
+        last_state = await self.async_get_last_state()
+        if last_state is not None:
+            self._attr_is_on = last_state.state == "on"
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Enable server-side wake word verification."""
+        self._attr_is_on = True
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Disable server-side wake word verification."""
+        self._attr_is_on = False
+        self.async_write_ha_state()
+
+
+class VoiceSatelliteVadGateSwitch(SwitchEntity, RestoreEntity):
+    """Switch entity for the server-side speech gate on stt runs.
+
+    When on, the card asks for `vad_gate` on every run, and the server
+    drops leading silence and ends the stream shortly after speech stops
+    (see audio_vad.py).
+    """
+
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_has_entity_name = True
+    _attr_translation_key = "vad_gate"
+    _attr_icon = "mdi:waveform"
+
+    def __init__(self, entry: ConfigEntry) -> None:
+        """Initialize the speech gate switch."""
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_vad_gate"
+        self._attr_is_on = False  # Default: disabled, HA's own VAD ends the turn
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device info - same identifiers as the satellite entity."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Restore previous state on startup."""
+        await super().async_added_to_hass()
+        last_state = await self.async_get_last_state()
+        if last_state is not None:
+            self._attr_is_on = last_state.state == "on"
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Enable the server-side speech gate."""
+        self._attr_is_on = True
+        self.async_write_ha_state()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Disable the server-side speech gate."""
+        self._attr_is_on = False
+        self.async_write_ha_state()
@@ -0,0 +1,264 @@
+"""Shared measurement of TTS audio durations.
+
+Every satellite tells its card how long the TTS reply or announcement it
+is about to play is (tts-audio-duration).  When assist_satellite.announce
+targets 30 satellites, each one's async_announce asks for the same
+/api/tts_proxy/ URL, and each used to read and parse the audio itself.
+The TtsDurationProber measures a URL once:
+
+  * Probes are single-flight per URL (the TTS manager token when the URL
+    carries one, so relative and absolute forms of it match): a request
+    for a URL that is already being measured waits on the same future,
+    shielded, so one satellite going away does not cancel it for the
+    others.  Interim estimates of a still-streaming MP3 go to every
+    waiter's callback.
+  * Measured durations are kept in an LRU of CACHE_MAX_ENTRIES for
+    CACHE_TTL_S, so a satellite asking late (a replayed announcement) is
+    answered without touching the audio.  Failed measurements (0.0) are
+    not cached.
+
+A measurement reads the audio straight from HA's TTS manager when the URL
+is one of its tokens, and downloads it over HTTP only when it is not
+(another instance's URL, an expired token, an HA without
+tts.async_get_stream).  Chunks are walked by Mp3FrameWalker as they
+arrive, so an MP3's duration is final the moment the stream ends.  Only a
+body that has not shown itself to be MP3 is kept whole, for the header
+probes of audio_duration.py and, failing those, mutagen in the executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass, field
+from urllib.parse import urlsplit
+
+from homeassistant.core import HomeAssistant, callback
+
+from .audio_duration import (
+    Mp3FrameWalker,
+    looks_like_mp3,
+    mutagen_duration,
+    probe_duration,
+)
+from .const import DOMAIN
+from .entity_index import async_get_index
+
+# Conditional import for in-process TTS audio reads (tts result streams)
+try:
+    from homeassistant.components.tts import async_get_stream as async_get_tts_stream
+
+    HAS_TTS_STREAM = True
+except ImportError:
+    HAS_TTS_STREAM = False
+
+_LOGGER = logging.getLogger(__name__)
+
+# Path of HA's TTS proxy view; the last segment is the TTS manager token.
+TTS_PROXY_PATH = "/api/tts_proxy/"
+_TTS_CHUNK_BYTES = 16384
+
+# Interim estimates while a TTS stream is still coming in: one per this
+# much more audio walked, and none for a stream that arrives within the
+# delay (a cached result is final almost at once).
+TTS_DURATION_INTERIM_STEP_S = 2.0
+TTS_DURATION_INTERIM_DELAY_S = 0.5
+
+# Measured durations kept, and for how long.  HA's TTS manager drops an
+# unused result stream after a few minutes, so a token is not asked
+# about much later than that.
+CACHE_MAX_ENTRIES = 64
+CACHE_TTL_S = 600.0
+
+
+@dataclass(slots=True)
+class TtsDurationStats:
+    """Cumulative TTS duration probe counters for the integration."""
+
+    requests: int = 0
+    probes: int = 0
+    shared: int = 0
+    cache_hits: int = 0
+    failures: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a JSON-serializable dict."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class _Probe:
+    future: asyncio.Future
+    listeners: list[Callable[[float], None]] = field(default_factory=list)
+
+
+def tts_proxy_token(tts_url: str) -> str | None:
+    """Return the TTS manager token of an /api/tts_proxy/ URL, if it is one."""
+    path = urlsplit(tts_url).path
+    prefix, sep, token = path.rpartition(TTS_PROXY_PATH)
+    if not sep or prefix or "/" in token:
+        return None
+    return token or None
+
+
+class TtsDurationProber:
+    """Measures TTS URLs once, however many satellites ask."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize with an empty cache."""
+        self._hass = hass
+        self._cache: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._inflight: dict[str, _Probe] = {}
+        self.stats = TtsDurationStats()
+
+    async def async_get_duration(
+        self,
+        tts_url: str,
+        on_interim: Callable[[float], None] | None = None,
+    ) -> float:
+        """Return the duration of the audio behind a TTS URL (0.0 if unknown).
+
+        on_interim is called with growing lower bounds while a streamed
+        MP3 is still coming in.
+        """
+        self.stats.requests += 1
+        key = tts_proxy_token(tts_url) or tts_url
+        cached = self._cache.get(key)
+        if cached is not None:
+            expires, duration = cached
+            if time.monotonic() < expires:
+                self._cache.move_to_end(key)
+                self.stats.cache_hits += 1
+                return duration
+            del self._cache[key]
+
+        probe = self._inflight.get(key)
+        if probe is None:
+            probe = self._inflight[key] = _Probe(self._hass.loop.create_future())
+            self.stats.probes += 1
+            self._hass.async_create_background_task(
+                self._async_probe(key, tts_url, probe),
+                f"{DOMAIN} TTS duration probe",
+            )
+        else:
+            self.stats.shared += 1
+        if on_interim is not None:
+            probe.listeners.append(on_interim)
+        try:
+            return await asyncio.shield(probe.future)
+        finally:
+            if on_interim is not None and on_interim in probe.listeners:
+                probe.listeners.remove(on_interim)
+
+    async def _async_probe(self, key: str, tts_url: str, probe: _Probe) -> None:
+        duration = 0.0
+        try:
+            duration = await self._async_measure(tts_url, probe)
+        except Exception:
+            _LOGGER.warning(
+                "Failed to measure TTS audio duration: %s", tts_url, exc_info=True
+            )
+        finally:
+            del self._inflight[key]
+            if duration:
+                self._cache[key] = (time.monotonic() + CACHE_TTL_S, duration)
+                self._cache.move_to_end(key)
+                while len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+            else:
+                self.stats.failures += 1
+            probe.future.set_result(duration)
+
+    async def _async_measure(self, tts_url: str, probe: _Probe) -> float:
+        walker = Mp3FrameWalker()
+        body: bytearray | None = bytearray()  # None once it is MP3
+        started = time.monotonic()
+        next_interim_s = TTS_DURATION_INTERIM_STEP_S
+        async for chunk in self._async_iter_audio(tts_url):
+            walker.feed(chunk)
+            if body is None:
+                if (
+                    walker.duration >= next_interim_s
+                    and time.monotonic() - started >= TTS_DURATION_INTERIM_DELAY_S
+                ):
+                    next_interim_s = walker.duration + TTS_DURATION_INTERIM_STEP_S
+                    estimate = round(walker.duration, 2)
+                    for listener in list(probe.listeners):
+                        listener(estimate)
+                continue
+            body += chunk
+            if walker.frames and looks_like_mp3(body):
+                body = None  # the walker has all it needs
+        duration = round(walker.duration, 2)
+        if not duration and body:
+            audio_data = bytes(body)
+            duration = round(probe_duration(audio_data), 2)
+            if not duration:
+                duration = round(
+                    await self._hass.async_add_executor_job(
+                        mutagen_duration, audio_data
+                    ),
+                    2,
+                )
+        if duration:
+            _LOGGER.debug("TTS audio duration %.2fs: %s", duration, tts_url)
+        return duration
+
+    async def _async_iter_audio(self, tts_url: str) -> AsyncIterator[bytes]:
+        """Yield the audio behind a TTS URL as it becomes available.
+
+        From the TTS manager when the URL carries a token this instance
+        knows about (waiting for a result still being synthesized, like
+        the proxy view does), otherwise over HTTP (no auth - the token is
+        the secret).
+        """
+        token = tts_proxy_token(tts_url) if HAS_TTS_STREAM else None
+        stream = async_get_tts_stream(self._hass, token) if token else None
+        if stream is not None:
+            _LOGGER.debug("Measuring TTS duration from the TTS manager: %s", token)
+            async for chunk in stream.async_stream_result():
+                yield chunk
+            return
+
+        from homeassistant.helpers.aiohttp_client import async_get_clientsession
+        from homeassistant.helpers.network import get_url
+
+        # tts_url may be a relative path (/api/tts_proxy/...)
+        # or a full URL (https://host/api/tts_proxy/...) from announcements.
+        if tts_url.startswith(("http://", "https://")):
+            full_url = tts_url
+        else:
+            try:
+                base_url = get_url(self._hass, prefer_external=False)
+            except Exception:
+                base_url = "http://127.0.0.1:8123"
+            full_url = f"{base_url}{tts_url}"
+
+        _LOGGER.debug("Measuring TTS duration over HTTP: %s", full_url)
+
+        session = async_get_clientsession(self._hass)
+        async with session.get(full_url) as resp:
+            if resp.status != 200:
+                _LOGGER.warning("TTS proxy returned %d for %s", resp.status, full_url)
+                return
+            async for chunk in resp.content.iter_chunked(_TTS_CHUNK_BYTES):
+                yield chunk
+
+
+@callback
+def async_get_tts_duration_prober(hass: HomeAssistant) -> TtsDurationProber:
+    """Return the integration's prober, creating it on first use."""
+    index = async_get_index(hass)
+    if index.tts_duration_prober is None:
+        index.tts_duration_prober = TtsDurationProber(hass)
+    return index.tts_duration_prober
+
+
+@callback
+def async_get_tts_duration_metrics(hass: HomeAssistant) -> dict[str, int] | None:
+    """Return the prober counters, or None if nothing has used it yet."""
+    prober = async_get_index(hass).tts_duration_prober
+    return prober.stats.as_dict() if prober is not None else None
@@ -0,0 +1,905 @@
+"""In-process vsWakeWord inference (server side).
+
+Python port of the card's CTC path (src/wake-word/vww/inference.js,
+ctc-decoder.js and the counter gate in backend.js), run with onnxruntime
+on the CPU:
+
+    16 kHz int16 audio -> log-mel window -> CTC model -> phoneme decode
+                       -> wake word target match -> hit counter
+
+Each model ships a JSON manifest next to its .onnx file.  Everything the
+detector needs comes from it:
+
+  * feature_config - the log-mel frontend (window, hop, FFT size, mel
+    bands, log floor).  The window slides by one 80 ms chunk at a time;
+    only the frames entering the window are computed, as in the card.
+  * ctc - vocabulary, wake word phoneme targets, edit-distance limits,
+    anchors, trail tolerance and matched-confidence gates.
+  * runtime - required hits, high-confidence bypass and cross-window
+    stream matching.
+
+The matcher mirrors the JS one decision for decision, so a phrase that
+wakes the browser engine wakes this one (tools/compare-vww-port.py
+checks the two against each other).  Not ported: the browser's standby
+energy gate and trigger cooldown - a wake word run ends at its first
+detection, and HA only streams audio while a run is active.
+
+The ONNX session of a model is shared by its streams, and feed_streams()
+runs the windows of every stream on one model as a single stacked
+inference (see onnx_batch.py).  onnxruntime and NumPy are optional:
+callers check HAS_VWW first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+from pathlib import Path
+from typing import Any
+
+from .audio_codecs import HAS_NUMPY
+from .oww_engine import HAS_ONNXRUNTIME, StackedSession
+
+if HAS_NUMPY:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+_LOGGER = logging.getLogger(__name__)
+
+HAS_VWW = HAS_NUMPY and HAS_ONNXRUNTIME
+
+VWW_MODELS_DIR = Path(__file__).parent / "models" / "vswakeword"
+
+CHUNK_SAMPLES = 1280  # 80 ms @ 16 kHz, as in the card
+
+# Matched-confidence gate factor per wake word sensitivity option
+# (src/wake-word/vww/sensitivity.js).
+VWW_SENSITIVITY_CONF_FACTORS = {
+    "Slightly sensitive": 1.10,
+    "Moderately sensitive": 1.00,
+    "Very sensitive": 0.90,
+}
+
+_DEFAULT_FEATURE_CONFIG = {
+    "sample_rate": 16000,
+    "window_ms": 1000,
+    "frame_ms": 25,
+    "hop_ms": 10,
+    "n_fft": 512,
+    "n_mels": 40,
+    "f_min": 80,
+    "f_max": 7600,
+    "log_floor": 1e-6,
+}
+_DEFAULT_CUTOFF = 0.5
+# Full-window RMS below which no score counts (backend.js).
+_HARD_SILENCE_VETO_RMS = 0.002
+# Consecutive stream matches after which the stream buffer is consumed.
+_STREAM_CONSUME_STREAK = 4
+
+
+def _js_round(value: float) -> int:
+    """Math.round: halves round up, unlike Python's round()."""
+    return math.floor(value + 0.5)
+
+
+def _finite(value: Any) -> float | None:
+    """Number(value) if it is finite, else None."""
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+# ---------------------------------------------------------------------------
+# Log-mel frontend
+# ---------------------------------------------------------------------------
+
+
+def _hz_to_mel(hz: float) -> float:
+    return 2595 * math.log10(1 + hz / 700)
+
+
+def _mel_to_hz(mel: float) -> float:
+    return 700 * (10 ** (mel / 2595) - 1)
+
+
+def _mel_filterbank(cfg: dict) -> np.ndarray:
+    """Triangular mel filters (n_mels, n_fft/2 + 1), as makeMelFilterbank."""
+    n_fft = cfg["n_fft"]
+    n_mels = cfg["n_mels"]
+    mel_min = _hz_to_mel(cfg["f_min"])
+    mel_max = _hz_to_mel(cfg["f_max"])
+    hz = []
+    bins = []
+    for i in range(n_mels + 2):
+        hz.append(_mel_to_hz(mel_min + (i / (n_mels + 1)) * (mel_max - mel_min)))
+        bins.append(
+            max(0, min(n_fft // 2, math.floor((n_fft + 1) * hz[i] / cfg["sample_rate"])))
+        )
+    width = n_fft // 2 + 1
+    bank = np.zeros((n_mels, width), dtype=np.float32)
+    for m in range(1, n_mels + 1):
+        left, center, right = bins[m - 1], bins[m], bins[m + 1]
+        if center <= left:
+            center = left + 1
+        if right <= center:
+            right = center + 1
+        row = np.zeros(width, dtype=np.float64)
+        for k in range(left, min(center, width)):
+            row[k] = (k - left) / max(1, center - left)
+        for k in range(center, min(right, width)):
+            row[k] = (right - k) / max(1, right - center)
+        # The card stores the raw triangle in a Float32Array, then scales.
+        row = row.astype(np.float32).astype(np.float64)
+        enorm = 2 / max(1e-6, hz[m + 1] - hz[m - 1])
+        bank[m - 1] = row * enorm
+    return bank
+
+
+class LogMelFrontend:
+    """Sliding log-mel window over the latest `window_ms` of audio."""
+
+    def __init__(self, feature_config: dict | None) -> None:
+        """Build the window, filterbank and ring from a manifest config."""
+        cfg = {**_DEFAULT_FEATURE_CONFIG, **(feature_config or {})}
+        rate = cfg["sample_rate"]
+        self.window_samples = _js_round(rate * cfg["window_ms"] / 1000)
+        self._frame_samples = _js_round(rate * cfg["frame_ms"] / 1000)
+        self._hop = _js_round(rate * cfg["hop_ms"] / 1000)
+        self._n_fft = int(cfg["n_fft"])
+        self._log_floor = float(cfg["log_floor"])
+        self.frames = 1 + (self.window_samples - self._frame_samples) // self._hop
+        self.n_mels = int(cfg["n_mels"])
+
+        n = self._frame_samples
+        self._hann = (
+            0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n) / (n - 1))
+        ).astype(np.float32)
+        self._mel_t = np.ascontiguousarray(_mel_filterbank(cfg).T, dtype=np.float64)
+
+        self._ring = np.zeros(self.window_samples, dtype=np.float32)
+        self._filled = 0
+        self._features = np.zeros((self.frames, self.n_mels), dtype=np.float32)
+        self._initialized = False
+        # Frames entering the window per chunk, when the hop divides it.
+        self._shift = (
+            min(self.frames, CHUNK_SAMPLES // self._hop)
+            if CHUNK_SAMPLES % self._hop == 0 and CHUNK_SAMPLES < self.window_samples
+            else 0
+        )
+
+    @property
+    def window_rms(self) -> float:
+        """RMS of the audio in the window so far."""
+        if not self._filled:
+            return 0.0
+        tail = self._ring[self.window_samples - self._filled:].astype(np.float64)
+        return math.sqrt(float(np.dot(tail, tail)) / self._filled)
+
+    def push(self, chunk: np.ndarray) -> np.ndarray | None:
+        """Slide one chunk (float32, ±1) in; return (frames, n_mels) or None.
+
+        None until the first full window.  The returned array is reused
+        by the next call.
+        """
+        n = chunk.size
+        ring = self._ring
+        ring[:-n] = ring[n:]
+        ring[-n:] = chunk
+        self._filled = min(self.window_samples, self._filled + n)
+        if self._filled < self.window_samples:
+            return None
+
+        first = 0
+        if self._initialized and self._shift and self._shift < self.frames:
+            self._features[:-self._shift] = self._features[self._shift:]
+            first = self.frames - self._shift
+        frames = sliding_window_view(ring, self._frame_samples)[
+            first * self._hop:(self.frames - 1) * self._hop + 1:self._hop
+        ]
+        spectrum = np.fft.rfft(frames * self._hann, n=self._n_fft)
+        power = spectrum.real**2 + spectrum.imag**2
+        energy = power @ self._mel_t
+        self._features[first:] = np.log(np.maximum(energy, self._log_floor))
+        self._initialized = True
+        return self._features
+
+
+# ---------------------------------------------------------------------------
+# CTC decoding and target matching
+# ---------------------------------------------------------------------------
+
+
+def _token_cost(token: int, word_sep: int) -> int:
+    return 2 if word_sep >= 0 and token == word_sep else 1
+
+
+def _edit_distance(
+    hay: list[int], start: int, length: int, target: list[int], word_sep: int
+) -> int:
+    """Levenshtein where every edit involving the word separator costs 2."""
+    n = len(target)
+    if length == 0:
+        return sum(_token_cost(t, word_sep) for t in target)
+    if n == 0:
+        return sum(_token_cost(hay[start + i], word_sep) for i in range(length))
+    prev = [0] * (n + 1)
+    for j in range(1, n + 1):
+        prev[j] = prev[j - 1] + _token_cost(target[j - 1], word_sep)
+    for i in range(1, length + 1):
+        h = hay[start + i - 1]
+        del_h = _token_cost(h, word_sep)
+        curr = [prev[0] + del_h] + [0] * n
+        for j in range(1, n + 1):
+            t = target[j - 1]
+            if h == t:
+                sub = 0
+            elif word_sep >= 0 and (h == word_sep or t == word_sep):
+                sub = 2
+            else:
+                sub = 1
+            curr[j] = min(
+                curr[j - 1] + _token_cost(t, word_sep),
+                prev[j] + del_h,
+                prev[j - 1] + sub,
+            )
+        prev = curr
+    return prev[n]
+
+
+def _edit_distance_anchored(
+    hay: list[int],
+    start: int,
+    length: int,
+    target: list[int],
+    anchors: list[int],
+    word_sep: int,
+) -> float:
+    """Edit distance with the anchored target phonemes required verbatim."""
+    if not anchors:
+        return _edit_distance(hay, start, length, target, word_sep)
+    end = start + length
+    positions = []
+    search = start
+    for anchor in anchors:
+        want = target[anchor]
+        for k in range(search, end):
+            if hay[k] == want:
+                positions.append(k)
+                search = k + 1
+                break
+        else:
+            return math.inf
+    total = 0
+    prev_target = 0
+    prev_hay = start
+    for anchor, pos in zip(anchors, positions):
+        total += _edit_distance(
+            hay, prev_hay, pos - prev_hay, target[prev_target:anchor], word_sep
+        )
+        prev_target = anchor + 1
+        prev_hay = pos + 1
+    return total + _edit_distance(
+        hay, prev_hay, end - prev_hay, target[prev_target:], word_sep
+    )
+
+
+def _target_groups(
+    ctc: dict, targets: list[list[int]], word_sep: int
+) -> tuple[list[int], dict[int, int]]:
+    """Group ids per target (spellings of one phrase share a group)."""
+    raw = ctc.get("wake_word_target_groups")
+    labels: dict[str, int] = {}
+
+    def group_for(label: Any) -> int:
+        return labels.setdefault(str(label), len(labels))
+
+    ids = []
+    if isinstance(raw, list) and len(raw) >= len(targets):
+        for i in range(len(targets)):
+            ids.append(i if raw[i] is None else group_for(raw[i]))
+    else:
+        for i, target in enumerate(targets):
+            normalized = ",".join(str(t) for t in target if t != word_sep)
+            ids.append(group_for(normalized or f"target:{i}"))
+    sizes: dict[int, int] = {}
+    for group in ids:
+        sizes[group] = sizes.get(group, 0) + 1
+    return ids, sizes
+
+
+class CtcDecoder:
+    """Greedy CTC decode + wake word target matcher for one keyword."""
+
+    def __init__(self, ctc: dict, t_out: int) -> None:
+        """Initialize from a manifest `ctc` block and the model's T_out."""
+        self.vocab_size = int(ctc["vocab_size"])
+        self.blank_id = ctc.get("blank_id", 1)
+        self.pad_id = ctc.get("pad_id", 0)
+        self.word_sep_id = ctc.get("word_sep_id", 2)
+        max_ed = ctc.get("max_edit_distance")
+        self.max_edit_distance = 1 if max_ed is None else max_ed
+        trail = ctc.get("wake_word_trail_tolerance")
+        self.trail_tolerance = -1 if trail is None else int(trail)
+        min_conf = ctc.get("min_matched_confidence")
+        self._base_min_conf = -math.inf if min_conf is None else float(min_conf)
+        self.targets = [list(t) for t in ctc.get("wake_word_targets") or []]
+
+        target_ed = ctc.get("target_max_edit_distance")
+        target_ed = target_ed if isinstance(target_ed, list) else []
+        self.target_max_edit_distance = []
+        for ti in range(len(self.targets)):
+            value = _finite(target_ed[ti]) if ti < len(target_ed) else None
+            self.target_max_edit_distance.append(
+                math.floor(value)
+                if value is not None and value >= 0
+                else int(self.max_edit_distance)
+            )
+        target_conf = ctc.get("target_min_matched_confidence")
+        target_conf = target_conf if isinstance(target_conf, list) else []
+        self._base_target_min_conf = []
+        for ti in range(len(self.targets)):
+            value = _finite(target_conf[ti]) if ti < len(target_conf) else None
+            self._base_target_min_conf.append(
+                self._base_min_conf if value is None else value
+            )
+        self.min_matched_confidence = self._base_min_conf
+        self.target_min_matched_confidence = list(self._base_target_min_conf)
+
+        raw_anchors = ctc.get("wake_word_target_anchors") or []
+        self.target_anchors = [
+            sorted(raw_anchors[ti])
+            if ti < len(raw_anchors) and isinstance(raw_anchors[ti], list)
+            else []
+            for ti in range(len(self.targets))
+        ]
+        self.target_group_ids, self.target_group_sizes = _target_groups(
+            ctc, self.targets, self.word_sep_id
+        )
+        self.inventory = ctc.get("inventory")
+        self.t_out = t_out
+        self._stream: dict[str, Any] | None = None
+
+    def set_confidence_scale(self, scale: float) -> None:
+        """Scale every matched-confidence gate (1 = manifest values)."""
+        k = scale if math.isfinite(scale) and scale > 0 else 1
+
+        def scaled(value: float) -> float:
+            return value * k if math.isfinite(value) else value
+
+        self.min_matched_confidence = scaled(self._base_min_conf)
+        self.target_min_matched_confidence = [
+            scaled(v) for v in self._base_target_min_conf
+        ]
+
+    # -- Per-window decode --------------------------------------------------
+
+    def greedy_decode(
+        self, logits: np.ndarray
+    ) -> tuple[list[int], list[float], np.ndarray, np.ndarray]:
+        """Decode (T_out, V) logits.
+
+        Returns (ids, confidence, frame_ids, frame_logits): the emitted
+        phonemes, the mean argmax logit over each phoneme's frames, and
+        the per-frame argmax the stream matcher reuses.
+        """
+        frame_ids = logits.argmax(axis=1)
+        frame_logits = logits.max(axis=1)
+        starts = np.flatnonzero(np.diff(frame_ids)) + 1
+        starts = np.concatenate(([0], starts))
+        sums = np.add.reduceat(frame_logits.astype(np.float64), starts)
+        counts = np.diff(np.concatenate((starts, [frame_ids.size])))
+        tokens = frame_ids[starts]
+        keep = (tokens != self.blank_id) & (tokens != self.pad_id)
+        return (
+            tokens[keep].tolist(),
+            (sums / counts)[keep].tolist(),
+            frame_ids,
+            frame_logits,
+        )
+
+    def analyze(self, logits: np.ndarray) -> dict[str, Any]:
+        """Decode one window and match it (analyzeWithConfidence)."""
+        ids, confidence, frame_ids, frame_logits = self.greedy_decode(logits)
+        out: dict[str, Any] = {
+            "decoded": ids,
+            "matched": False,
+            "min_edit_distance": math.inf,
+            "matched_confidence": 0.0,
+            "total_confidence": 0.0,
+            "gate_threshold": self.min_matched_confidence,
+            "matched_target_index": -1,
+            "matched_target_group_index": -1,
+            "matched_target_group_size": 1,
+            "frame_ids": frame_ids,
+            "frame_logits": frame_logits,
+        }
+        if not ids:
+            return out
+        out["total_confidence"] = sum(confidence) / len(confidence)
+
+        # Closest window the matcher would consider, gate or not.
+        best_ed: float = math.inf
+        best_start = -1
+        best_len = 0
+        best_target = -1
+        for ti, target in enumerate(self.targets):
+            for win_len, start in self._windows(ti, len(ids)):
+                ed = self._distance(ids, start, win_len, ti)
+                if ed < best_ed:
+                    best_ed, best_start, best_len, best_target = ed, start, win_len, ti
+                    if ed == 0:
+                        break
+            if best_ed == 0:
+                break
+        out["min_edit_distance"] = best_ed
+        if best_start >= 0 and best_len > 0:
+            out["matched_confidence"] = (
+                sum(confidence[best_start:best_start + best_len]) / best_len
+            )
+            out["gate_threshold"] = self.target_min_matched_confidence[best_target]
+
+        match = self.accepted_match(ids, confidence)
+        out["matched_target_index"] = match["target_index"]
+        out["matched_target_group_index"] = match["target_group_index"]
+        out["matched_target_group_size"] = match["target_group_size"]
+        if match["matched"]:
+            out["matched"] = True
+            out["min_edit_distance"] = match["edit_distance"]
+            out["matched_confidence"] = match["confidence"]
+            out["gate_threshold"] = match["gate_threshold"]
+        elif not math.isfinite(out["min_edit_distance"]):
+            out["min_edit_distance"] = self.min_edit_distance_to_targets(ids)
+        return out
+
+    def _windows(self, ti: int, length: int):
+        """(window length, start) pairs the loose matcher scans for a target."""
+        tlen = len(self.targets[ti])
+        for win_len in range(tlen, tlen + self.target_max_edit_distance[ti] + 1):
+            if win_len > length:
+                continue
+            start_min = (
+                max(0, length - win_len - self.trail_tolerance)
+                if self.trail_tolerance >= 0
+                else 0
+            )
+            for start in range(start_min, length - win_len + 1):
+                yield win_len, start
+
+    def _distance(self, ids: list[int], start: int, win_len: int, ti: int) -> float:
+        anchors = self.target_anchors[ti]
+        if anchors:
+            return _edit_distance_anchored(
+                ids, start, win_len, self.targets[ti], anchors, self.word_sep_id
+            )
+        return _edit_distance(ids, start, win_len, self.targets[ti], self.word_sep_id)
+
+    def accepted_match(
+        self, decoded: list[int], confidence: list[float] | None
+    ) -> dict[str, Any]:
+        """Best target match of a decode that passes every gate."""
+        best: dict[str, Any] = {
+            "matched": False,
+            "target_index": -1,
+            "target_group_index": -1,
+            "target_group_size": 1,
+            "edit_distance": math.inf,
+            "confidence": 0.0,
+        }
+        if not decoded:
+            return best
+        has_conf = confidence is not None and len(confidence) == len(decoded)
+        trail = self.trail_tolerance
+
+        def mean_conf(start: int, length: int) -> float:
+            if not has_conf:
+                return 0.0
+            return sum(confidence[start:start + length]) / length
+
+        def conf_ok(ti: int, start: int, length: int) -> bool:
+            gate = self.target_min_matched_confidence[ti]
+            return (
+                not has_conf
+                or not math.isfinite(gate)
+                or mean_conf(start, length) >= gate
+            )
+
+        def consider(ti: int, start: int, length: int, ed: float) -> None:
+            conf = mean_conf(start, length)
+            if (
+                not best["matched"]
+                or ed < best["edit_distance"]
+                or (ed == best["edit_distance"] and conf > best["confidence"])
+            ):
+                group = self.target_group_ids[ti]
+                best.update(
+                    matched=True,
+                    target_index=ti,
+                    target_group_index=group,
+                    target_group_size=self.target_group_sizes.get(group, 1),
+                    edit_distance=ed,
+                    confidence=conf,
+                    gate_threshold=self.target_min_matched_confidence[ti],
+                )
+
+        for ti, target in enumerate(self.targets):
+            tlen = len(target)
+            for idx in range(len(decoded) - tlen + 1):
+                if decoded[idx:idx + tlen] != target:
+                    continue
+                trailing = len(decoded) - (idx + tlen)
+                if (trail < 0 or trailing <= trail) and conf_ok(ti, idx, tlen):
+                    consider(ti, idx, tlen, 0)
+        for ti in range(len(self.targets)):
+            max_ed = self.target_max_edit_distance[ti]
+            if max_ed <= 0:
+                continue
+            for win_len, start in self._windows(ti, len(decoded)):
+                ed = self._distance(decoded, start, win_len, ti)
+                if ed <= max_ed and conf_ok(ti, start, win_len):
+                    consider(ti, start, win_len, ed)
+        return best
+
+    def min_edit_distance_to_targets(self, decoded: list[int]) -> float:
+        """Loosest near-miss distance, for logging rejected decodes."""
+        if not decoded:
+            return math.inf
+        best: float = math.inf
+        for target in self.targets:
+            tlen = len(target)
+            span = max(2, tlen // 2)
+            for win_len in range(max(1, tlen - span), tlen + span + 1):
+                if win_len > len(decoded):
+                    continue
+                for start in range(len(decoded) - win_len + 1):
+                    best = min(
+                        best,
+                        _edit_distance(decoded, start, win_len, target, self.word_sep_id),
+                    )
+                    if best == 0:
+                        return 0
+        return best
+
+    def to_phonemes(self, ids: list[int]) -> list[str]:
+        """Render a decode as phoneme symbols (word separator as '_')."""
+        if not self.inventory:
+            return [str(i) for i in ids]
+        return [
+            "_"
+            if i == self.word_sep_id
+            else (self.inventory[i] if 0 <= i < len(self.inventory) else f"?{i}")
+            for i in ids
+        ]
+
+    # -- Cross-window stream matching ------------------------------------
+
+    def enable_stream_match(
+        self,
+        window_samples: int,
+        window_ms: float,
+        buffer_ms: float | None = None,
+        lag_frames: float | None = None,
+    ) -> None:
+        """Stitch per-window argmax frames into one rolling stream.
+
+        Catches phrases with a pause too long for one window ("okay ...
+        nabu"); stream matches land about lag frames after window ones.
+        """
+        frame_ms = window_ms / self.t_out
+        lag = min(
+            max(4, math.floor(20 if lag_frames is None else lag_frames)),
+            self.t_out - 2,
+        )
+        self._stream = {
+            "frame_samples": max(1, _js_round(window_samples / self.t_out)),
+            "lag": lag,
+            "buf_frames": max(
+                self.t_out,
+                _js_round((2500 if buffer_ms is None else buffer_ms) / frame_ms),
+            ),
+            "ids": [],
+            "logits": [],
+            "sample_acc": 0,
+            "bootstrapped": False,
+            "match_streak": 0,
+            "dirty": True,
+            "last_result": None,
+        }
+
+    def stream_update(
+        self, frame_ids: np.ndarray, frame_logits: np.ndarray, new_samples: int
+    ) -> None:
+        """Append the window's fresh frames, `lag` frames before its edge."""
+        st = self._stream
+        if st is None:
+            return
+        edge = self.t_out - st["lag"]
+        st["sample_acc"] += max(0, new_samples)
+        new_frames = st["sample_acc"] // st["frame_samples"]
+        if new_frames <= 0 and st["bootstrapped"]:
+            return
+        st["sample_acc"] -= new_frames * st["frame_samples"]
+        if not st["bootstrapped"]:
+            first = 0
+            st["bootstrapped"] = True
+        else:
+            first = edge - min(new_frames, edge)
+        ids = frame_ids[first:edge].tolist()
+        st["ids"].extend(ids)
+        st["logits"].extend(float(v) for v in frame_logits[first:edge])
+        if any(i != self.blank_id and i != self.pad_id for i in ids):
+            st["dirty"] = True
+        excess = len(st["ids"]) - st["buf_frames"]
+        if excess > 0:
+            del st["ids"][:excess]
+            del st["logits"][:excess]
+
+    def stream_analyze(self) -> dict[str, Any] | None:
+        """Decode and match the rolling stream."""
+        st = self._stream
+        if st is None or not st["ids"]:
+            return None
+        last = st["last_result"]
+        if not st["dirty"] and last is not None and not last["matched"]:
+            return last
+        ids: list[int] = []
+        confidence: list[float] = []
+        frames = st["ids"]
+        logits = st["logits"]
+        i = 0
+        while i < len(frames):
+            token = frames[i]
+            j = i
+            total = 0.0
+            while j < len(frames) and frames[j] == token:
+                total += logits[j]
+                j += 1
+            if token != self.blank_id and token != self.pad_id:
+                ids.append(token)
+                confidence.append(total / (j - i))
+            i = j
+        match = self.accepted_match(ids, confidence)
+        if match["matched"]:
+            st["match_streak"] += 1
+            if st["match_streak"] >= _STREAM_CONSUME_STREAK:
+                # Consume the utterance so it cannot fire twice.
+                frames.clear()
+                logits.clear()
+                st["match_streak"] = 0
+        else:
+            st["match_streak"] = 0
+        result = {
+            "decoded": ids,
+            "matched": match["matched"],
+            "matched_target_index": match["target_index"],
+            "matched_confidence": match["confidence"],
+            "min_edit_distance": match["edit_distance"],
+        }
+        st["dirty"] = False
+        st["last_result"] = result
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Models and streams
+# ---------------------------------------------------------------------------
+
+
+class VwwModel:
+    """One vsWakeWord model: its manifest and shared ONNX session."""
+
+    def __init__(self, name: str, models_dir: Path = VWW_MODELS_DIR) -> None:
+        """Load the manifest and session (blocking; run in an executor)."""
+        with (models_dir / f"{name}.json").open(encoding="utf-8") as f:
+            self.manifest: dict = json.load(f)
+        if "ctc" not in self.manifest:
+            raise ValueError(f"vsWakeWord model {name} is not a CTC model")
+        self.name = name
+        self._session = StackedSession(models_dir / f"{name}.onnx")
+        out_shape = self.manifest.get("output", {}).get("shape") or [1, 64, 0]
+        self.t_out = int(out_shape[1])
+        vocab = int(self.manifest["ctc"]["vocab_size"])
+        if out_shape[2] and out_shape[2] != vocab:
+            raise ValueError(
+                f"vsWakeWord model {name}: output dim {out_shape[2]} != vocab {vocab}"
+            )
+        self.runtime: dict = self.manifest.get("runtime") or {}
+        threshold = _finite(self.manifest.get("recommended_threshold"))
+        self.cutoff = _DEFAULT_CUTOFF if threshold is None else threshold
+
+    def run(self, features: np.ndarray) -> np.ndarray:
+        """Return the (T_out, V) logits for one (frames, n_mels) window."""
+        return self.run_batch(features[None])[0]
+
+    def run_batch(self, features: np.ndarray) -> np.ndarray:
+        """Return the (b, T_out, V) logits for (b, frames, n_mels) windows."""
+        out = self._session.run(features)
+        return out.reshape(features.shape[0], self.t_out, -1)
+
+
+class VwwStream:
+    """Streaming detection state for one keyword on one audio stream."""
+
+    def __init__(self, model: VwwModel, confidence_scale: float = 1.0) -> None:
+        """Start a stream; confidence_scale applies the sensitivity setting."""
+        self.model = model
+        feature_config = model.manifest.get("feature_config")
+        self.frontend = LogMelFrontend(feature_config)
+        self.decoder = CtcDecoder(model.manifest["ctc"], model.t_out)
+        self.decoder.set_confidence_scale(confidence_scale)
+        runtime = model.runtime
+        if runtime.get("stream_match") is not False:
+            self.decoder.enable_stream_match(
+                window_samples=self.frontend.window_samples,
+                window_ms=(feature_config or {}).get("window_ms", 1300),
+                buffer_ms=_finite(runtime.get("stream_buffer_ms")),
+                lag_frames=_finite(runtime.get("stream_lag_frames")),
+            )
+
+        required = _finite(runtime.get("required_hits"))
+        self._required_hits = max(1, math.floor(required)) if required and required > 0 else 1
+        target_hits = runtime.get("target_required_hits")
+        self._target_hits = (
+            [
+                max(1, math.floor(v)) if (v := _finite(h)) is not None and v > 0 else None
+                for h in target_hits
+            ]
+            if isinstance(target_hits, list)
+            else None
+        )
+        bypass = _finite(runtime.get("high_confidence_bypass"))
+        self._bypass = None if bypass is None else bypass * self._scale(confidence_scale)
+        bypass_hits = _finite(runtime.get("high_confidence_bypass_min_hits"))
+        self._bypass_min_hits = 1 if bypass_hits is None else max(1, math.floor(bypass_hits))
+        min_rms = _finite(runtime.get("min_window_rms"))
+        self._min_window_rms = min_rms if min_rms and min_rms > 0 else _HARD_SILENCE_VETO_RMS
+
+        self._counter = self._empty_counter()
+        self._pending = np.empty(0, dtype=np.float32)
+        self.last_info: dict[str, Any] | None = None
+
+    @staticmethod
+    def _scale(scale: float) -> float:
+        return scale if math.isfinite(scale) and scale > 0 else 1.0
+
+    @staticmethod
+    def _empty_counter() -> dict[str, Any]:
+        return {
+            "hits": 0,
+            "target_index": -1,
+            "group_index": -1,
+            "required_hits": None,
+            "bypass_min_hits": None,
+        }
+
+    def feed(self, pcm: bytes) -> str | None:
+        """Feed Int16 PCM; return the trigger type once the wake word fires.
+
+        The trigger type is "counter" (required hits reached) or "bypass"
+        (high-confidence single match).  Audio that does not fill a whole
+        chunk is kept for the next call.
+        """
+        return feed_streams([(self, pcm)])[0]
+
+    def split_chunks(self, pcm: bytes) -> list[np.ndarray]:
+        """Whole chunks of Int16 PCM (as ±1 float) plus the pending tail."""
+        samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+        if self._pending.size:
+            samples = np.concatenate((self._pending, samples))
+        whole = samples.size - samples.size % CHUNK_SAMPLES
+        self._pending = samples[whole:].copy()
+        return [samples[start:start + CHUNK_SAMPLES] for start in range(0, whole, CHUNK_SAMPLES)]
+
+    def feed_chunk(self, chunk: np.ndarray) -> str | None:
+        """Process one 1280-sample chunk of ±1 float audio."""
+        features = self.frontend.push(chunk)
+        if features is None:
+            return None
+        return self.decide(chunk, self.model.run(features))
+
+    def decide(self, chunk: np.ndarray, logits: np.ndarray) -> str | None:
+        """Decode a chunk's (T_out, V) window logits and run the hit gate."""
+        decoder = self.decoder
+        info = decoder.analyze(logits)
+        decoder.stream_update(info["frame_ids"], info["frame_logits"], chunk.size)
+        stream = decoder.stream_analyze()
+        info["stream_matched"] = bool(stream and stream["matched"])
+        self.last_info = info
+
+        window_rms = self.frontend.window_rms
+        rms = math.sqrt(float(np.dot(chunk, chunk)) / chunk.size)
+        if rms < _HARD_SILENCE_VETO_RMS and window_rms < _HARD_SILENCE_VETO_RMS:
+            return None
+        score = 1.0 if info["matched"] or info["stream_matched"] else 0.0
+        if window_rms < self._min_window_rms:
+            score = 0.0
+        return self._gate(score, info)
+
+    def _gate(self, score: float, info: dict[str, Any]) -> str | None:
+        """Consecutive-hit counter with per-target hits and bypass."""
+        target = info["matched_target_index"]
+        group = info["matched_target_group_index"]
+        base_required = self._required_hits
+        base_bypass_hits = self._bypass_min_hits
+        if target >= 0 and self._target_hits and target < len(self._target_hits):
+            hits = self._target_hits[target]
+            if hits is not None:
+                base_required = hits
+                if hits > self._required_hits:
+                    base_bypass_hits = max(base_bypass_hits, base_required)
+        if score <= self.model.cutoff:
+            self._counter = self._empty_counter()
+            return None
+
+        prev = self._counter
+        same_group = (
+            prev["group_index"] == group
+            if group >= 0
+            else prev["hits"] > 0 and prev["group_index"] < 0
+        )
+        required = base_required
+        bypass_hits = base_bypass_hits
+        if same_group and prev["required_hits"] is not None:
+            required = max(required, prev["required_hits"])
+        if same_group and prev["bypass_min_hits"] is not None:
+            bypass_hits = max(bypass_hits, prev["bypass_min_hits"])
+        hits = prev["hits"] + 1 if same_group else 1
+        self._counter = {
+            "hits": hits,
+            "target_index": target,
+            "group_index": group,
+            "required_hits": required,
+            "bypass_min_hits": bypass_hits,
+        }
+        confidence = info["matched_confidence"]
+        if self._bypass is not None and confidence >= self._bypass and hits >= bypass_hits:
+            self._counter = self._empty_counter()
+            return "bypass"
+        if hits >= required:
+            self._counter = self._empty_counter()
+            return "counter"
+        return None
+
+
+def feed_streams(jobs: list[tuple[VwwStream, bytes]]) -> list[str | None]:
+    """Feed several streams at once; return each one's trigger type, if any.
+
+    Chunk by chunk, the windows of every stream on the same model run
+    as one stacked inference.  A stream stops at its first trigger; the
+    rest of its audio is dropped, as a wake word run ends there.
+    """
+    chunks = [stream.split_chunks(pcm) for stream, pcm in jobs]
+    triggers: list[str | None] = [None] * len(jobs)
+    for step in range(max((len(c) for c in chunks), default=0)):
+        by_model: dict[VwwModel, list[tuple[int, np.ndarray]]] = {}
+        for n, (stream, _) in enumerate(jobs):
+            if step >= len(chunks[n]) or triggers[n]:
+                continue
+            features = stream.frontend.push(chunks[n][step])
+            if features is not None:
+                by_model.setdefault(stream.model, []).append((n, features))
+        for model, entries in by_model.items():
+            logits = model.run_batch(np.stack([features for _, features in entries]))
+            for (n, _), stream_logits in zip(entries, logits):
+                triggers[n] = jobs[n][0].decide(chunks[n][step], stream_logits)
+    return triggers
+
+
+_models: dict[str, VwwModel] = {}
+_models_lock = threading.Lock()
+
+
+def get_vww_model(name: str) -> VwwModel:
+    """Return the shared model for `name` (blocking on first use)."""
+    with _models_lock:
+        model = _models.get(name)
+        if model is None:
+            _LOGGER.debug("Loading vsWakeWord model %s", name)
+            model = _models[name] = VwwModel(name)
+        return model
@@ -0,0 +1,229 @@
+"""Arbitration between satellites that heard the same wake word.
+
+In an open-plan room two or three tablets hear "ok nabu" at once and
+each opens an stt run.  HA core only dedupes by wake word phrase, first
+come first served: the tablet whose WebSocket message happens to land
+first wins, whoever it was closest to.  The WakeArbiter holds each wake
+run for a short window instead and lets the satellites that heard the
+word compete:
+
+  * Satellites compete when they share an arbitration group - their
+    area, or one of a few named groups - picked per satellite with the
+    "Wake word arbitration" select (off by default).  A satellite with
+    no area, or with arbitration off, always runs.
+  * The first candidate of a group opens a round.  The round closes
+    after ARBITRATION_WINDOW_S, or as soon as every satellite of the
+    group has joined, so the winner waits no longer than it must.  A
+    group with a single satellite never waits.
+  * The winner is the candidate with the best wake word score, when
+    every candidate reported one from the same wake word engine and
+    model (scores of different engines or models are not comparable),
+    otherwise the one with the most speech energy.  Ties go to the
+    earliest candidate.
+  * Only satellites with a connected card or a run in progress count
+    towards a group, and a candidate whose run went away while it waited
+    (its wait was cancelled) cannot win.
+  * Losers end their run before the STT stage with a
+    `wake_arbitration_lost` error, which the card handles like HA's
+    duplicate_wake_up_detected: it cancels the pending wake chime and
+    goes back to idle.  A candidate arriving within
+    ARBITRATION_COOLDOWN_S after its group's round was decided loses
+    straight away.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .entity_index import async_get_index
+
+if TYPE_CHECKING:
+    from .assist_satellite import VoiceSatelliteEntity
+
+
+# Inside the card's 250 ms wake chime dedupe window, so a losing tablet
+# is told before it makes a sound.
+ARBITRATION_WINDOW_S = 0.2
+# Same as HA core's wake word cooldown: a straggler this soon after a
+# decided round heard the same utterance.
+ARBITRATION_COOLDOWN_S = 2.0
+
+WAKE_ARBITRATION_AREA = "area"
+WAKE_ARBITRATION_OFF = "off"
+WAKE_ARBITRATION_GROUPS = ["group_1", "group_2", "group_3", "group_4"]
+WAKE_ARBITRATION_OPTIONS = [
+    WAKE_ARBITRATION_AREA,
+    *WAKE_ARBITRATION_GROUPS,
+    WAKE_ARBITRATION_OFF,
+]
+# Opt-in: a contested wake waits for its group, and an existing install
+# should not start paying that on every wake after an update.
+WAKE_ARBITRATION_DEFAULT = WAKE_ARBITRATION_OFF
+
+
+@dataclass(slots=True)
+class WakeArbitrationStats:
+    """Cumulative arbitration results for one satellite."""
+
+    won: int = 0
+    lost: int = 0
+    uncontested: int = 0
+    wait_ms_total: float = 0.0
+    last: dict | None = None
+
+    def record(self, outcome: str, wait_s: float, detail: dict) -> None:
+        """Count one arbitration."""
+        if outcome == "won":
+            self.won += 1
+        elif outcome == "lost":
+            self.lost += 1
+        else:
+            self.uncontested += 1
+        self.wait_ms_total += wait_s * 1000
+        self.last = {"outcome": outcome, "wait_ms": round(wait_s * 1000, 1), **detail}
+
+    def as_dict(self) -> dict:
+        """Return the counters as a JSON-serializable dict."""
+        data = asdict(self)
+        data["wait_ms_total"] = round(self.wait_ms_total, 1)
+        return data
+
+
+@dataclass(slots=True)
+class _Candidate:
+    entity_id: str
+    score: float | None
+    energy: float | None
+    scorer: str | None  # "engine:model" that produced the score
+    future: asyncio.Future
+
+
+@dataclass(slots=True)
+class _Round:
+    peers: int
+    candidates: list[_Candidate] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+def _pick_winner(candidates: list[_Candidate]) -> _Candidate:
+    """Best score if all are comparable, else most energy; ties go first."""
+    scorer = candidates[0].scorer
+    if scorer is not None and all(
+        c.score is not None and c.scorer == scorer for c in candidates
+    ):
+        return max(candidates, key=lambda c: c.score)
+    return max(candidates, key=lambda c: c.energy or 0.0)
+
+
+class WakeArbiter:
+    """Picks one winner among satellites of a group waking together."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize with no open rounds."""
+        self._hass = hass
+        self._rounds: dict[str, _Round] = {}
+        # group -> (monotonic time decided, winning entity_id)
+        self._decided: dict[str, tuple[float, str]] = {}
+
+    async def async_arbitrate(
+        self,
+        satellite: VoiceSatelliteEntity,
+        score: float | None,
+        energy: float | None,
+        scorer: str | None = None,
+    ) -> bool:
+        """Return True if the satellite's wake run may go on.
+
+        scorer names the wake word engine and model behind score.
+        """
+        started = time.monotonic()
+        stats = satellite.wake_arbitration_stats
+        group = satellite.wake_arbitration_group
+        peers = _group_size(self._hass, group) if group is not None else 0
+        if peers < 2:
+            stats.record("uncontested", 0.0, {"group": group})
+            return True
+
+        decided = self._decided.get(group)
+        if (
+            group not in self._rounds
+            and decided is not None
+            and started - decided[0] < ARBITRATION_COOLDOWN_S
+            and decided[1] != satellite.entity_id
+        ):
+            stats.record("lost", 0.0, {"group": group, "winner": decided[1]})
+            return False
+
+        rnd = self._rounds.get(group)
+        if rnd is None:
+            rnd = self._rounds[group] = _Round(peers)
+            rnd.timer = self._hass.loop.call_later(
+                ARBITRATION_WINDOW_S, self._close, group
+            )
+        candidate = _Candidate(
+            satellite.entity_id,
+            score,
+            energy,
+            scorer,
+            self._hass.loop.create_future(),
+        )
+        rnd.candidates.append(candidate)
+        if len(rnd.candidates) >= rnd.peers:
+            self._close(group)
+
+        winner = await candidate.future
+        won = winner == satellite.entity_id
+        stats.record(
+            "won" if won else "lost",
+            time.monotonic() - started,
+            {
+                "group": group,
+                "winner": winner,
+                "candidates": len(rnd.candidates),
+                "score": score,
+                "energy": energy,
+                "scorer": scorer,
+            },
+        )
+        return won
+
+    @callback
+    def _close(self, group: str) -> None:
+        rnd = self._rounds.pop(group, None)
+        if rnd is None:
+            return
+        if rnd.timer is not None:
+            rnd.timer.cancel()
+        # A done future is a candidate whose run was cancelled while it
+        # waited: it has nobody left to tell.
+        waiting = [c for c in rnd.candidates if not c.future.done()]
+        if not waiting:
+            return
+        winner = _pick_winner(waiting).entity_id
+        self._decided[group] = (time.monotonic(), winner)
+        for candidate in waiting:
+            candidate.future.set_result(winner)
+
+
+@callback
+def _group_size(hass: HomeAssistant, group: str) -> int:
+    """Count the group's satellites that could take part in a round."""
+    return sum(
+        1
+        for sat in async_get_index(hass).satellites()
+        if sat.wake_arbitration_group == group and sat.is_live
+    )
+
+
+@callback
+def async_get_wake_arbiter(hass: HomeAssistant) -> WakeArbiter:
+    """Return the integration's arbiter, creating it on first use."""
+    index = async_get_index(hass)
+    if index.wake_arbiter is None:
+        index.wake_arbiter = WakeArbiter(hass)
+    return index.wake_arbiter
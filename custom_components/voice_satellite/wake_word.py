@@ -0,0 +1,390 @@
+"""Wake word detection entities for Voice Satellite integration.
+
+Run the bundled wake word models in-process, so "Home Assistant" wake
+word detection works without an external Wyoming wake word service.
+Select one as the wake word engine of an Assist pipeline.
+
+openWakeWord - the openWakeWord models (see oww_engine.py).  One stream
+scores the pipeline's wake word, the satellite's slot 2 wake word and,
+while the satellite is responding, the stop word off a single mel and
+embedding pass.
+vsWakeWord - the vsWakeWord CTC models (see vww_engine.py), with the
+satellite's wake word sensitivity applied to the confidence gates.
+microWakeWord - the microWakeWord TFLite models (see mww_engine.py), with
+the satellite's wake word sensitivity applied to the cutoff margin.
+
+An entity belongs to one satellite's device, but HA pipelines are shared:
+the satellite settings a stream uses (slot 2 wake word, sensitivity, stop
+word) are those of the satellite whose run is streaming, found through
+RUN_ENTRY_ID.  A run that does not come from a Voice Satellite gets the
+defaults - its wake word only, default sensitivity, no stop word.
+
+The audio of all satellites streaming to one engine is batched into a
+single executor job per tick (see wake_word_batch.py).  Within it,
+openWakeWord and vsWakeWord stack the streams into one inference per
+model and chunk; microWakeWord models keep their streaming state inside
+the interpreter, so each stream runs its own, one after another.
+
+openWakeWord and vsWakeWord need onnxruntime and NumPy; microWakeWord
+needs a TFLite runtime and NumPy.  Entities whose runtime is missing
+are not created.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.wake_word import (
+    DetectionResult,
+    WakeWord,
+    WakeWordDetectionEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity_index import RUN_ENTRY_ID, SatelliteEntities, async_get_index
+from .oww_engine import (
+    CHUNK_SAMPLES,
+    HAS_OWW,
+    OWW_MODELS_DIR,
+    OWW_STOP_MODEL,
+    OWW_STOP_THRESHOLD,
+    OWW_WAKE_THRESHOLD,
+    OwwStream,
+    feed_streams,
+    get_oww_models,
+)
+from .mww_engine import (
+    HAS_MWW,
+    MWW_SENSITIVITY_MARGIN_FACTORS,
+    MwwStream,
+    get_mww_model,
+)
+from .select import (
+    discover_microwakeword_models,
+    discover_openwakeword_models,
+    discover_vswakeword_models,
+)
+from .vww_engine import (
+    HAS_VWW,
+    VWW_SENSITIVITY_CONF_FACTORS,
+    VwwStream,
+    feed_streams as feed_vww_streams,
+    get_vww_model,
+)
+from .wake_word_batch import async_get_batcher
+
+_LOGGER = logging.getLogger(__name__)
+
+# Audio submitted per batch: HA streams 10 ms chunks, one hop per chunk
+# would cost more than the inference itself.
+_BATCH_BYTES = CHUNK_SAMPLES * 2
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the in-process wake word entities from a config entry."""
+    entities: list[_VoiceSatelliteWakeWordEntity] = []
+    if HAS_OWW and HAS_VWW:
+        entities.append(VoiceSatelliteOpenWakeWordEntity(entry))
+        entities.append(VoiceSatelliteVsWakeWordEntity(entry))
+    else:
+        _LOGGER.debug(
+            "onnxruntime/numpy not installed - in-process openWakeWord/vsWakeWord disabled"
+        )
+    if HAS_MWW:
+        entities.append(VoiceSatelliteMicroWakeWordEntity(entry))
+    else:
+        _LOGGER.debug(
+            "TFLite runtime/numpy not installed - in-process microWakeWord disabled"
+        )
+    if entities:
+        async_add_entities(entities)
+
+
+def _wake_word_name(model: str) -> str:
+    """Human-readable name for a model file stem (ok_nabu -> Ok Nabu)."""
+    return model.replace("_", " ").title()
+
+
+class _VoiceSatelliteWakeWordEntity(WakeWordDetectionEntity, ABC):
+    """Shared batching loop for the in-process wake word entities.
+
+    An engine supplies model discovery, detector creation and the batched
+    detection run on the inference pool.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, entry: ConfigEntry) -> None:
+        """Initialize the wake word entity."""
+        self._entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_{self._attr_translation_key}"
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device info - same identifiers as the satellite entity."""
+        return {
+            "identifiers": {(DOMAIN, self._entry.entry_id)},
+        }
+
+    @abstractmethod
+    def _discover_models(self) -> list[str]:
+        """Return the model names available on disk (blocking)."""
+
+    @abstractmethod
+    async def _async_create_detector(self, wake_word_id: str) -> Any:
+        """Load the model and start a detection stream."""
+
+    @classmethod
+    @abstractmethod
+    def _detect_batch(cls, jobs: list[tuple[Any, str, bytes]]) -> list[str | None]:
+        """Run one batch of (detector, wake_word_id, audio) jobs (blocking).
+
+        Returns, per job, the model that fired, if any.
+        """
+
+    @callback
+    def _async_update_detector(self, detector: Any) -> None:
+        """Refresh a detector's settings before its next batch."""
+
+    @callback
+    def _async_detected(
+        self, detector: Any, model: str, timestamp: int
+    ) -> DetectionResult | None:
+        """Handle a detection; None keeps the stream running."""
+        return DetectionResult(
+            wake_word_id=model,
+            wake_word_phrase=_wake_word_name(model),
+            timestamp=timestamp,
+        )
+
+    @callback
+    def _run_entities(self) -> SatelliteEntities | None:
+        """Entities of the satellite whose run is streaming, if it is one."""
+        entry_id = RUN_ENTRY_ID.get()
+        return async_get_index(self.hass).get_entry(entry_id) if entry_id else None
+
+    def _wake_word_sensitivity(self) -> str | None:
+        """Current option of the streaming satellite's sensitivity select."""
+        entry_id = RUN_ENTRY_ID.get()
+        if entry_id is None:
+            return None
+        entity_id = er.async_get(self.hass).async_get_entity_id(
+            "select", DOMAIN, f"{entry_id}_wake_word_sensitivity"
+        )
+        state = self.hass.states.get(entity_id) if entity_id else None
+        return state.state if state else None
+
+    async def get_supported_wake_words(self) -> list[WakeWord]:
+        """Return the wake word models available on disk."""
+        models = await self.hass.async_add_executor_job(self._discover_models)
+        return [
+            WakeWord(id=model, name=_wake_word_name(model)) for model in models
+        ]
+
+    async def _async_process_audio_stream(
+        self, stream: AsyncIterable[tuple[bytes, int]], wake_word_id: str | None
+    ) -> DetectionResult | None:
+        """Score the stream until the wake word fires or the stream ends."""
+        if wake_word_id is None:
+            supported = await self.get_supported_wake_words()
+            if not supported:
+                return None
+            wake_word_id = supported[0].id
+
+        detector = await self._async_create_detector(wake_word_id)
+        batcher = async_get_batcher(
+            self.hass, self._attr_translation_key, type(self)._detect_batch
+        )
+
+        pending: list[bytes] = []
+        pending_bytes = 0
+        with batcher.stream():
+            async for chunk, timestamp in stream:
+                pending.append(chunk)
+                pending_bytes += len(chunk)
+                if pending_bytes < _BATCH_BYTES:
+                    continue
+                audio = b"".join(pending)
+                pending.clear()
+                pending_bytes = 0
+                self._async_update_detector(detector)
+                model = await batcher.async_submit(detector, wake_word_id, audio)
+                if model is None:
+                    continue
+                result = self._async_detected(detector, model, timestamp)
+                if result is not None:
+                    return result
+        return None
+
+
+@dataclass(slots=True)
+class _OwwDetector:
+    """One openWakeWord stream and the classifiers its satellite uses."""
+
+    stream: OwwStream
+    wake_words: list[str]
+    has_stop: bool
+    stop_fired: bool = False
+
+
+class VoiceSatelliteOpenWakeWordEntity(_VoiceSatelliteWakeWordEntity):
+    """In-process openWakeWord detection for Assist pipelines."""
+
+    _attr_translation_key = "openwakeword"
+
+    def _discover_models(self) -> list[str]:
+        return discover_openwakeword_models()
+
+    async def _async_create_detector(self, wake_word_id: str) -> _OwwDetector:
+        entities = self._run_entities()
+        select = entities.wake_word_model_2 if entities else None
+        slot_2 = select.oww_selection if select else None
+        wake_words = [wake_word_id]
+        if slot_2 and slot_2 != wake_word_id:
+            wake_words.append(slot_2)
+
+        def _load() -> _OwwDetector:
+            models = get_oww_models()
+            for name in wake_words:
+                models.load_classifier(name)
+            has_stop = (OWW_MODELS_DIR / f"{OWW_STOP_MODEL}.onnx").is_file()
+            if has_stop:
+                models.load_classifier(OWW_STOP_MODEL)
+            return _OwwDetector(OwwStream(models, wake_words), wake_words, has_stop)
+
+        return await self.hass.async_add_executor_job(_load)
+
+    @callback
+    def _async_update_detector(self, detector: _OwwDetector) -> None:
+        # The stop word is scored only while the satellite is playing TTS
+        # with its stop word switch on, and once per response.
+        entities = self._run_entities()
+        satellite = entities.satellite if entities else None
+        responding = satellite is not None and satellite.state == "responding"
+        if not responding:
+            detector.stop_fired = False
+        stop = (
+            detector.has_stop
+            and responding
+            and not detector.stop_fired
+            and satellite.stop_word_enabled
+        )
+        classifiers = [*detector.wake_words, OWW_STOP_MODEL] if stop else detector.wake_words
+        if detector.stream.classifiers != classifiers:
+            detector.stream.set_classifiers(classifiers)
+
+    @callback
+    def _async_detected(
+        self, detector: _OwwDetector, model: str, timestamp: int
+    ) -> DetectionResult | None:
+        if model != OWW_STOP_MODEL:
+            return super()._async_detected(detector, model, timestamp)
+        detector.stop_fired = True
+        entities = self._run_entities()
+        if entities and entities.satellite:
+            entities.satellite.async_stop_word_detected()
+        return None
+
+    @classmethod
+    def _detect_batch(
+        cls, jobs: list[tuple[_OwwDetector, str, bytes]]
+    ) -> list[str | None]:
+        # All streams share one OwwModels: mel and embedding run batched,
+        # and each stream's embedding fans out to all of its classifiers.
+        scores = feed_streams(
+            get_oww_models(), [(detector.stream, audio) for detector, _, audio in jobs]
+        )
+        detected = []
+        for best in scores:
+            fired = None
+            for name, score in best.items():
+                threshold = OWW_STOP_THRESHOLD if name == OWW_STOP_MODEL else OWW_WAKE_THRESHOLD
+                if score >= threshold:
+                    _LOGGER.debug("openWakeWord detected '%s' (%.3f)", name, score)
+                    fired = name
+                    break
+            detected.append(fired)
+        return detected
+
+
+class VoiceSatelliteVsWakeWordEntity(_VoiceSatelliteWakeWordEntity):
+    """In-process vsWakeWord detection for Assist pipelines."""
+
+    _attr_translation_key = "vswakeword"
+
+    def _discover_models(self) -> list[str]:
+        return discover_vswakeword_models()
+
+    async def _async_create_detector(self, wake_word_id: str) -> VwwStream:
+        scale = VWW_SENSITIVITY_CONF_FACTORS.get(self._wake_word_sensitivity(), 1.0)
+        model = await self.hass.async_add_executor_job(get_vww_model, wake_word_id)
+        return await self.hass.async_add_executor_job(VwwStream, model, scale)
+
+    @classmethod
+    def _detect_batch(
+        cls, jobs: list[tuple[VwwStream, str, bytes]]
+    ) -> list[str | None]:
+        # Streams on the same model share one stacked inference per chunk.
+        triggers = feed_vww_streams([(detector, audio) for detector, _, audio in jobs])
+        detected = []
+        for (detector, wake_word_id, _), trigger in zip(jobs, triggers):
+            if trigger is None:
+                detected.append(None)
+                continue
+            info = detector.last_info or {}
+            _LOGGER.debug(
+                "vsWakeWord detected '%s' (%s) decoded=[%s] conf=%.2f",
+                wake_word_id,
+                trigger,
+                " ".join(detector.decoder.to_phonemes(info.get("decoded", []))),
+                info.get("matched_confidence", 0.0),
+            )
+            detected.append(wake_word_id)
+        return detected
+
+
+class VoiceSatelliteMicroWakeWordEntity(_VoiceSatelliteWakeWordEntity):
+    """In-process microWakeWord detection for Assist pipelines."""
+
+    _attr_translation_key = "microwakeword"
+
+    def _discover_models(self) -> list[str]:
+        return discover_microwakeword_models()
+
+    async def _async_create_detector(self, wake_word_id: str) -> MwwStream:
+        factor = MWW_SENSITIVITY_MARGIN_FACTORS.get(self._wake_word_sensitivity(), 1.0)
+        model = await self.hass.async_add_executor_job(get_mww_model, wake_word_id)
+        return await self.hass.async_add_executor_job(MwwStream, model, factor)
+
+    @classmethod
+    def _detect_batch(
+        cls, jobs: list[tuple[MwwStream, str, bytes]]
+    ) -> list[str | None]:
+        # Not stacked: every stream's interpreter holds its own ring buffers.
+        return [cls._detect(*job) for job in jobs]
+
+    @staticmethod
+    def _detect(detector: MwwStream, wake_word_id: str, audio: bytes) -> str | None:
+        trigger = detector.feed(audio)
+        if trigger is None:
+            return None
+        _LOGGER.debug(
+            "microWakeWord detected '%s' (%s) mean=%.3f cutoff=%.3f",
+            wake_word_id,
+            trigger,
+            detector.last_mean,
+            detector.cutoff,
+        )
+        return wake_word_id
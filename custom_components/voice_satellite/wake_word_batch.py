@@ -0,0 +1,119 @@
+"""Batching scheduler for the in-process wake word entities.
+
+Every satellite streaming to an in-process wake word entity hands the
+engine ~80 ms of audio at a time.  Run one executor job per stream and
+40 tablets cost 500 executor hops and tiny inference calls a second.
+Instead, each engine has one WakeWordBatcher shared by all of its
+streams: a stream submits its audio and waits, and once every active
+stream has submitted (or one tick has passed since the first did), the
+whole batch goes to the inference pool (inference_pool.py) as a single
+job.  The engine's batch function runs it - openWakeWord and vsWakeWord
+stack the streams into one inference per model and chunk - and the
+results are scattered back to the waiting streams.  A batch that could
+not start within _STALE_AFTER - the pool is overloaded - is dropped:
+each stream gets None, as if nothing fired, and moves on to fresh audio.
+
+A single active stream never waits: it is always the whole batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .entity_index import async_get_index
+from .inference_pool import StaleTaskError, async_get_inference_pool
+
+# Longest a submitted chunk waits for the other streams: one HA audio
+# chunk, well inside the 80 ms the engines consume per call.
+_BATCH_TICK = 0.01
+# A batch still waiting for a worker after this long is stale: by then
+# the next one is due, and the detectors would only fall further behind.
+_STALE_AFTER = 0.25
+
+BatchFunction = Callable[[list[tuple[Any, str, bytes]]], list[Any]]
+
+
+class WakeWordBatcher:
+    """Collects audio from concurrent streams into one executor job."""
+
+    def __init__(self, hass: HomeAssistant, name: str, run: BatchFunction) -> None:
+        """Initialize the batcher; run(jobs) executes a batch (blocking)."""
+        self._hass = hass
+        self._name = name
+        self._run = run
+        self._streams = 0
+        self._pending: list[tuple[Any, str, bytes, asyncio.Future]] = []
+        self._full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @contextmanager
+    def stream(self) -> Iterator[None]:
+        """Count a stream as active for the duration of the block."""
+        self._streams += 1
+        try:
+            yield
+        finally:
+            self._streams -= 1
+            self._check_full()
+
+    async def async_submit(self, detector: Any, wake_word_id: str, audio: bytes) -> Any:
+        """Queue audio for the next batch and return its result."""
+        future = self._hass.loop.create_future()
+        self._pending.append((detector, wake_word_id, audio, future))
+        self._check_full()
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_run(), f"{DOMAIN} {self._name} wake word batch"
+            )
+        return await future
+
+    @callback
+    def _check_full(self) -> None:
+        if self._pending and len(self._pending) >= self._streams:
+            self._full.set()
+
+    async def _async_run(self) -> None:
+        try:
+            while self._pending:
+                if len(self._pending) < self._streams:
+                    self._full.clear()
+                    with suppress(TimeoutError):
+                        async with asyncio.timeout(_BATCH_TICK):
+                            await self._full.wait()
+                batch, self._pending = self._pending, []
+                jobs = [(detector, wake_word_id, audio) for detector, wake_word_id, audio, _ in batch]
+                pool = async_get_inference_pool(self._hass)
+                try:
+                    results = await pool.async_run(
+                        self._run, jobs, deadline=time.monotonic() + _STALE_AFTER
+                    )
+                except StaleTaskError:
+                    results = [None] * len(batch)
+                except Exception as err:  # noqa: BLE001 - handed to every waiter
+                    for *_, future in batch:
+                        if not future.done():
+                            future.set_exception(err)
+                    continue
+                for (*_, future), result in zip(batch, results):
+                    # A stream whose run ended meanwhile has cancelled its future.
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._task = None
+
+
+@callback
+def async_get_batcher(hass: HomeAssistant, name: str, run: BatchFunction) -> WakeWordBatcher:
+    """Return the shared batcher for an engine, creating it on first use."""
+    batchers = async_get_index(hass).wake_word_batchers
+    batcher = batchers.get(name)
+    if batcher is None:
+        batcher = batchers[name] = WakeWordBatcher(hass, name, run)
+    return batcher
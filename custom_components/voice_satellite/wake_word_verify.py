@@ -0,0 +1,153 @@
+"""Server-side second opinion on wake words detected in the browser.
+
+In the On Device modes the card runs a small (often int8) model and
+starts an stt run the moment it fires.  Every false accept then costs an
+STT run and, with an LLM agent, a conversation turn.  When the
+satellite's "Server wake word verification" switch is on, the card
+opens the stt run with `verify_wake_word` and streams its pre-roll - the
+last `verify_preroll_ms` of audio up to the detection - ahead of the
+live audio.  The run re-scores that clip with the full-precision model
+of the same wake word:
+
+  * vsWakeWord - the fp32 model in models/vswakeword/ (the browser may
+    run the int8 copy in models/vswakeword/int8/);
+  * openWakeWord - otherwise, the classifier in models/openwakeword/.
+
+A rejected clip ends the run before the STT stage with a
+`wake_word_rejected` error.  A wake word with no server model, or a
+pre-roll that never arrives, is let through unverified.
+
+Which engine has a model for a wake word is looked up in the model
+lists scanned from disk once, on the first verification, and kept on
+the entity index; the models themselves are shared with the wake word
+entities (get_vww_model / get_oww_models).  Scoring runs on the
+inference pool.  Counts go to a per-satellite
+WakeVerifyStats, together with the STT seconds of accepted runs, from
+which the STT time saved by the rejections is estimated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+from homeassistant.core import HomeAssistant
+
+from .entity_index import async_get_index
+from .oww_engine import HAS_OWW, OWW_WAKE_THRESHOLD, OwwStream, get_oww_models
+from .select import discover_openwakeword_models, discover_vswakeword_models
+from .vww_engine import HAS_VWW, VwwStream, get_vww_model
+
+DEFAULT_VERIFY_PREROLL_MS = 1500
+VERIFY_MAX_PREROLL_MS = 3000
+# How long the run waits for the card's pre-roll before giving up on it.
+VERIFY_AUDIO_TIMEOUT_S = 2.0
+
+VERIFY_ACCEPTED = "accepted"
+VERIFY_REJECTED = "rejected"
+VERIFY_UNVERIFIED = "unverified"
+
+# Silence appended to the clip: the pre-roll ends right at the browser's
+# detection, and the last windows need to see the end of the word.
+_TAIL_PAD_BYTES = 2 * 16000 * 3 // 10
+
+
+@dataclass(slots=True)
+class WakeVerifyResult:
+    """Outcome of re-scoring one pre-roll clip."""
+
+    outcome: str
+    engine: str | None = None
+    score: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WakeVerifyModels:
+    """Wake word models each verifying engine has on disk."""
+
+    vswakeword: frozenset[str]
+    openwakeword: frozenset[str]
+
+
+@dataclass(slots=True)
+class WakeVerifyStats:
+    """Cumulative wake word verification results for one satellite."""
+
+    accepted: int = 0
+    rejected: int = 0
+    unverified: int = 0
+    accepted_stt_runs: int = 0
+    accepted_stt_s: float = 0.0
+    last: dict | None = None
+
+    def record(self, model: str, result: WakeVerifyResult) -> None:
+        """Count one verification."""
+        if result.outcome == VERIFY_ACCEPTED:
+            self.accepted += 1
+        elif result.outcome == VERIFY_REJECTED:
+            self.rejected += 1
+        else:
+            self.unverified += 1
+        self.last = {"wake_word": model, **asdict(result)}
+
+    def record_stt(self, seconds: float) -> None:
+        """Add the STT stage duration of an accepted run."""
+        self.accepted_stt_runs += 1
+        self.accepted_stt_s += seconds
+
+    def as_dict(self) -> dict:
+        """Return the counters as a JSON-serializable dict."""
+        data = asdict(self)
+        data["accepted_stt_s"] = round(self.accepted_stt_s, 3)
+        mean = (
+            self.accepted_stt_s / self.accepted_stt_runs
+            if self.accepted_stt_runs
+            else 0.0
+        )
+        data["saved_stt_s_est"] = round(self.rejected * mean, 3)
+        return data
+
+
+def _discover_verify_models() -> WakeVerifyModels:
+    return WakeVerifyModels(
+        frozenset(discover_vswakeword_models()) if HAS_VWW else frozenset(),
+        frozenset(discover_openwakeword_models()) if HAS_OWW else frozenset(),
+    )
+
+
+async def async_get_verify_models(hass: HomeAssistant) -> WakeVerifyModels:
+    """Return the verifiable wake word models, scanning the disk on first use."""
+    index = async_get_index(hass)
+    if index.wake_verify_models is None:
+        index.wake_verify_models = await hass.async_add_executor_job(
+            _discover_verify_models
+        )
+    return index.wake_verify_models
+
+
+def verify_wake_word(
+    model: str, audio: bytes, models: WakeVerifyModels
+) -> WakeVerifyResult:
+    """Re-score 16 kHz Int16 pre-roll audio for a wake word (blocking)."""
+    if not audio:
+        return WakeVerifyResult(VERIFY_UNVERIFIED)
+    audio += bytes(_TAIL_PAD_BYTES)
+
+    if model in models.vswakeword:
+        stream = VwwStream(get_vww_model(model))
+        trigger = stream.feed(audio)
+        confidence = (stream.last_info or {}).get("matched_confidence")
+        return WakeVerifyResult(
+            VERIFY_ACCEPTED if trigger else VERIFY_REJECTED, "vswakeword", confidence
+        )
+
+    if model in models.openwakeword:
+        oww_models = get_oww_models()
+        oww_models.load_classifier(model)
+        score = OwwStream(oww_models, [model]).feed(audio).get(model, 0.0)
+        return WakeVerifyResult(
+            VERIFY_ACCEPTED if score >= OWW_WAKE_THRESHOLD else VERIFY_REJECTED,
+            "openwakeword",
+            score,
+        )
+
+    return WakeVerifyResult(VERIFY_UNVERIFIED)
@@ -1,13 +1,14 @@
 /**
  * Audio Comms
  *
- * Binary PCM audio transmission via WebSocket.
+ * Binary audio transmission via WebSocket.
  */
 
 /**
- * Send binary PCM data via the HA WebSocket connection.
+ * Send binary audio data via the HA WebSocket connection.
  * @param {object} card - Card instance (for connection access)
- * @param {Int16Array} pcmData - 16-bit PCM audio samples
+ * @param {ArrayBufferView} pcmData - 16-bit PCM samples, or their
+ *   encoding in the run's audio codec
  * @param {number} binaryHandlerId - Pipeline binary handler ID
  */
 export function sendBinaryAudio(card, pcmData, binaryHandlerId) {
@@ -17,6 +18,6 @@ export function sendBinaryAudio(card, pcmData, binaryHandlerId) {
 
   const message = new Uint8Array(1 + pcmData.byteLength);
   message[0] = binaryHandlerId;
-  message.set(new Uint8Array(pcmData.buffer), 1);
+  message.set(new Uint8Array(pcmData.buffer, pcmData.byteOffset, pcmData.byteLength), 1);
   connection.socket.send(message.buffer);
 }
@@ -0,0 +1,131 @@
+/**
+ * Upstream Audio Encoders
+ *
+ * Card side of the integration's `audio_codec` (see audio_codecs.py):
+ * Int16 PCM is encoded just before it goes out on the binary handler,
+ * and the server decodes every payload back to PCM as it arrives.
+ *
+ *   pcm16     - Int16 little-endian, sent untouched (256 kbit/s at 16 kHz).
+ *   mulaw     - ITU-T G.711 µ-law, one byte per sample (128 kbit/s).
+ *   ima_adpcm - IMA ADPCM, 4 bits per sample (~64 kbit/s).  Every payload
+ *               is self-contained: a 4-byte header (Int16 LE predictor,
+ *               uint8 step index, uint8 reserved) and packed nibbles, low
+ *               nibble first.  A payload with an odd sample count keeps
+ *               its last sample for the next one.
+ */
+
+export const AUDIO_CODEC_PCM16 = 'pcm16';
+export const AUDIO_CODEC_MULAW = 'mulaw';
+export const AUDIO_CODEC_IMA_ADPCM = 'ima_adpcm';
+export const AUDIO_CODECS = [AUDIO_CODEC_PCM16, AUDIO_CODEC_MULAW, AUDIO_CODEC_IMA_ADPCM];
+
+const MULAW_BIAS = 0x84;
+const MULAW_CLIP = 32635;
+// Segment (exponent) of a biased magnitude, indexed by magnitude >> 7.
+const MULAW_SEGMENT = new Uint8Array(256);
+for (let i = 1; i < 256; i++) MULAW_SEGMENT[i] = Math.floor(Math.log2(i));
+
+const IMA_STEPS = new Int16Array([
+  7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41,
+  45, 50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190,
+  209, 230, 253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658, 724,
+  796, 876, 963, 1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066, 2272,
+  2499, 2749, 3024, 3327, 3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132,
+  7845, 8630, 9493, 10442, 11487, 12635, 13899, 15289, 16818, 18500,
+  20350, 22385, 24623, 27086, 29794, 32767,
+]);
+const IMA_INDEX_ADJUST = [-1, -1, -1, -1, 2, 4, 6, 8];
+const IMA_HEADER_BYTES = 4;
+
+/**
+ * G.711 µ-law code of one 16-bit sample.
+ * @param {number} sample
+ * @returns {number}
+ */
+function linearToMulaw(sample) {
+  const sign = sample < 0 ? 0x80 : 0;
+  let magnitude = Math.min(sign ? -sample : sample, MULAW_CLIP) + MULAW_BIAS;
+  const segment = MULAW_SEGMENT[magnitude >> 7];
+  magnitude = (magnitude >> (segment + 3)) & 0x0F;
+  return ~(sign | (segment << 4) | magnitude) & 0xFF;
+}
+
+class PcmEncoder {
+  encode(pcm) { return pcm; }
+}
+
+class MulawEncoder {
+  encode(pcm) {
+    const out = new Uint8Array(pcm.length);
+    for (let i = 0; i < pcm.length; i++) out[i] = linearToMulaw(pcm[i]);
+    return out;
+  }
+}
+
+class ImaAdpcmEncoder {
+  constructor() {
+    this._predictor = 0;
+    this._index = 0;
+    this._carry = null; // odd last sample of the previous payload
+  }
+
+  encode(pcm) {
+    let samples = pcm;
+    if (this._carry !== null) {
+      samples = new Int16Array(pcm.length + 1);
+      samples[0] = this._carry;
+      samples.set(pcm, 1);
+      this._carry = null;
+    }
+    let count = samples.length;
+    if (count & 1) {
+      this._carry = samples[count - 1];
+      count -= 1;
+    }
+
+    const out = new Uint8Array(IMA_HEADER_BYTES + count / 2);
+    const header = new DataView(out.buffer);
+    header.setInt16(0, this._predictor, true);
+    header.setUint8(2, this._index);
+
+    let predictor = this._predictor;
+    let index = this._index;
+    for (let i = 0; i < count; i++) {
+      let step = IMA_STEPS[index];
+      let diff = samples[i] - predictor;
+      let nibble = 0;
+      if (diff < 0) {
+        nibble = 8;
+        diff = -diff;
+      }
+      // Same delta the decoder rebuilds from the nibble.
+      let delta = step >> 3;
+      if (diff >= step) { nibble |= 4; diff -= step; delta += step; }
+      step >>= 1;
+      if (diff >= step) { nibble |= 2; diff -= step; delta += step; }
+      step >>= 1;
+      if (diff >= step) { nibble |= 1; delta += step; }
+
+      predictor += nibble & 8 ? -delta : delta;
+      predictor = Math.max(-32768, Math.min(32767, predictor));
+      index = Math.max(0, Math.min(88, index + IMA_INDEX_ADJUST[nibble & 7]));
+
+      const byte = IMA_HEADER_BYTES + (i >> 1);
+      out[byte] |= i & 1 ? nibble << 4 : nibble;
+    }
+    this._predictor = predictor;
+    this._index = index;
+    return out;
+  }
+}
+
+/**
+ * New encoder for one audio stream.  Unknown codecs fall back to pcm16.
+ * @param {string} codec
+ * @returns {{encode: (pcm: Int16Array) => ArrayBufferView}}
+ */
+export function createEncoder(codec) {
+  if (codec === AUDIO_CODEC_MULAW) return new MulawEncoder();
+  if (codec === AUDIO_CODEC_IMA_ADPCM) return new ImaAdpcmEncoder();
+  return new PcmEncoder();
+}
@@ -6,12 +6,16 @@
  */
 
 import { setupAudioWorklet, sendAudioBuffer } from './processing.js';
+import { AUDIO_CODEC_PCM16, createEncoder } from './encoders.js';
 import { resolveDspForMode } from './dsp-config.js';
 import { describeAudioInputDevices, describeSelectedAudioTrack } from './devices.js';
 import * as kiosk from '../kiosk/index.js';
 import { nativePipelinePreferred } from '../pipeline/kiosk-transport.js';
 
 const TARGET_SAMPLE_RATE = 16000;
+// Audio held back while the server has paused streaming; matches the
+// server's default queue bound, so the backlog fits once it resumes.
+const MAX_PAUSED_BACKLOG_S = 5;
 
 /**
  * Stands in for a MediaStream when Kiosk Satellite is the audio source.
@@ -40,6 +44,13 @@ export class AudioManager {
     this._sendSessionCount = 0;
     this._silentGainNode = null;
     this._captureBuffering = false;
+    // Server backpressure (audio-pause / audio-resume): the send loop
+    // holds audio back, keeping at most MAX_PAUSED_BACKLOG_S of it.
+    this._sendPaused = false;
+    // Upstream format of the current run's audio (see encoders.js), shared
+    // by the live audio and the wake word pre-roll sent ahead of it.
+    this._encoder = createEncoder(AUDIO_CODEC_PCM16);
+    this._streamSampleRate = TARGET_SAMPLE_RATE;
     // Authoritative mute flag — separate from any specific MediaStreamTrack
     // so a stream swap (switchMicMode) can re-apply it to the new tracks
     // without racing the wake-word handler's synchronous mute call.
@@ -97,6 +108,9 @@ export class AudioManager {
     }
   }
   get actualSampleRate() { return this._actualSampleRate; }
+
+  /** Rate the current run's audio is sent at (captured audio is resampled to it). */
+  get streamSampleRate() { return this._streamSampleRate; }
   get currentMicMode() { return this._currentMicMode || 'wake_word'; }
   /**
    * Acquire the mic.  `mode` selects which DSP config group applies — the
@@ -486,6 +500,7 @@ export class AudioManager {
   startSending(binaryHandlerIdGetter) {
     this.stopSending();
     this._captureBuffering = false;
+    this._sendPaused = false;
     this._sendSessionCount += 1;
     // Delegated pipeline: the app owns the buffer, the handler ID and the
     // socket; it drains buffered chunks first, exactly like the loop below.
@@ -503,10 +518,59 @@ export class AudioManager {
         const phase = sendSession === 1 ? 'First audio send' : 'Audio send resumed';
         this._log.log('mic', `${phase} - handlerId=${handlerId} bufferChunks=${this._audioBuffer.length}`);
       }
+      if (this._sendPaused) {
+        this._trimPausedBacklog();
+        return;
+      }
       sendAudioBuffer(this, handlerId);
     }, 100);
   }
 
+  /**
+   * Pause or resume the send loop on the server's audio-pause /
+   * audio-resume (its audio queue is full / has drained).  Capture keeps
+   * buffering meanwhile and the backlog goes out on resume, oldest audio
+   * dropped first if the pause outlasts MAX_PAUSED_BACKLOG_S.
+   * @param {boolean} paused
+   */
+  setSendPaused(paused) {
+    if (this._sendPaused === paused) return;
+    this._sendPaused = paused;
+    this._log.log('mic', paused ? 'Server audio queue full - holding audio' : 'Server audio queue drained - resuming send');
+  }
+
+  /**
+   * Send the next run's audio at `sampleRate`, encoded with `codec`
+   * (PipelineManager.start).
+   * @param {string} codec - one of encoders.js AUDIO_CODECS
+   * @param {number} sampleRate
+   */
+  setStreamFormat(codec, sampleRate) {
+    this._encoder = createEncoder(codec);
+    this._streamSampleRate = sampleRate;
+  }
+
+  /**
+   * Encode Int16 PCM for the binary handler with the run's codec.
+   * @param {Int16Array} pcm
+   * @returns {ArrayBufferView}
+   */
+  encodePcm(pcm) {
+    return this._encoder.encode(pcm);
+  }
+
+  _trimPausedBacklog() {
+    const limit = MAX_PAUSED_BACKLOG_S * this._actualSampleRate;
+    let total = 0;
+    for (const chunk of this._audioBuffer) total += chunk.length;
+    let dropped = 0;
+    while (total > limit && this._audioBuffer.length > 1) {
+      total -= this._audioBuffer.shift().length;
+      dropped += 1;
+    }
+    if (dropped) this._log.log('mic', `Paused backlog full - dropped ${dropped} oldest chunk(s)`);
+  }
+
   stopSending() {
     if (this._sendInterval) {
       clearInterval(this._sendInterval);
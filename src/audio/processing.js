@@ -115,12 +115,15 @@ export function sendAudioBuffer(mgr, binaryHandlerId) {
   }
   mgr.audioBuffer = [];
 
-  const resampled = mgr.actualSampleRate !== 16000
-    ? resample(combined, mgr.actualSampleRate, 16000)
+  // Usually the stream rate is the capture rate and this is a no-op: the
+  // integration resamples.
+  const rate = mgr.streamSampleRate;
+  const resampled = mgr.actualSampleRate !== rate
+    ? resample(combined, mgr.actualSampleRate, rate)
     : combined;
 
   const pcmData = floatTo16BitPCM(resampled);
-  sendBinaryAudio(mgr.card, pcmData, binaryHandlerId);
+  sendBinaryAudio(mgr.card, mgr.encodePcm(pcmData), binaryHandlerId);
 }
 
 /**
@@ -153,6 +156,19 @@ function resample(inputSamples, fromSampleRate, toSampleRate) {
   return _resampleBuf;
 }
 
+/**
+ * Send 16 kHz float audio that bypassed the capture buffer (the wake
+ * word pre-roll), at the run's stream rate and codec.
+ * @param {object} card - Card instance
+ * @param {Float32Array} samples - 16 kHz samples
+ * @param {number} binaryHandlerId - Pipeline binary handler ID
+ */
+export function sendPcm16(card, samples, binaryHandlerId) {
+  const rate = card.audio.streamSampleRate;
+  const resampled = rate !== 16000 ? resample(samples, 16000, rate) : samples;
+  sendBinaryAudio(card, card.audio.encodePcm(floatTo16BitPCM(resampled)), binaryHandlerId);
+}
+
 /**
  * Convert float audio samples to 16-bit PCM.
  * @param {Float32Array} float32Array
@@ -31,6 +31,8 @@ export const EXPECTED_ERRORS = [
   'wake-word-timeout',
   'stt-no-text-recognized',
   'duplicate_wake_up_detected',
+  'wake_word_rejected',
+  'wake_arbitration_lost',
 ];
 
 /** Blur overlay reason identifiers */
@@ -100,6 +102,14 @@ export const DEFAULT_CONFIG = {
   // Off by default (the existing flow continues silently).  Useful as an
   // audible "speak now" cue when paired with a follow-up listen delay.
   stt_followup_chime: false,
+  // Codec of the audio streamed to Home Assistant: 'pcm16' (raw),
+  // 'mulaw' (half the bandwidth) or 'ima_adpcm' (a quarter).  Decoded
+  // back to PCM by the integration; worth it on slow or metered Wi-Fi.
+  stt_audio_codec: 'pcm16',
+  // Stream the mic at the capture rate (44.1 / 48 kHz) and let the
+  // integration resample it, instead of resampling to 16 kHz here.  Off
+  // by default: three times the upload for no tablet CPU saving.
+  stt_native_sample_rate: false,
   // Skip the wake chime and keep buffering mic audio while the STT pipeline
   // starts, so users can say "hey vesta turn off the lights" in one run.
   seamless_wake_command: false,
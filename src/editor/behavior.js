@@ -6,6 +6,12 @@ import { t } from '../i18n/index.js';
 
 export const behaviorSchema = [];
 
+const AUDIO_CODEC_OPTIONS = [
+  { value: 'pcm16', label: 'Uncompressed (PCM)' },
+  { value: 'mulaw', label: 'µ-law (half the bandwidth)' },
+  { value: 'ima_adpcm', label: 'IMA ADPCM (a quarter of the bandwidth)' },
+];
+
 export const entitySchema = [
   {
     name: 'satellite_entity',
@@ -53,6 +59,12 @@ export const sttMicrophoneSchema = [
         selector: { number: { min: 0, max: 1000, step: 50, mode: 'slider', unit_of_measurement: 'ms' } },
       },
       { name: 'stt_followup_chime', default: false, selector: { boolean: {} } },
+      {
+        name: 'stt_audio_codec',
+        default: 'pcm16',
+        selector: { select: { options: AUDIO_CODEC_OPTIONS, mode: 'dropdown' } },
+      },
+      { name: 'stt_native_sample_rate', default: false, selector: { boolean: {} } },
     ],
   },
 ];
@@ -204,6 +216,8 @@ export const behaviorLabels = {
   seamless_wake_command: t(null, 'editor.behavior.seamless_wake_command', 'Seamless wake command (experimental)'),
   stt_followup_delay_ms: t(null, 'editor.behavior.stt_followup_delay_ms', 'Follow-up listen delay'),
   stt_followup_chime: t(null, 'editor.behavior.stt_followup_chime', 'Follow-up ready chime'),
+  stt_audio_codec: t(null, 'editor.behavior.stt_audio_codec', 'Audio upload codec'),
+  stt_native_sample_rate: t(null, 'editor.behavior.stt_native_sample_rate', 'Stream at native sample rate'),
 };
 
 export const behaviorHelpers = {
@@ -226,4 +240,6 @@ export const behaviorHelpers = {
   timer_named_tts_text: t(null, 'editor.behavior.helper_timer_named_tts_text', 'Phrase for named timers. Use %%TIMER_NAME%% where the timer name should be inserted.'),
   stt_followup_delay_ms: t(null, 'editor.behavior.helper_stt_followup_delay_ms', 'Pause between the assistant finishing speaking and the mic listening again on follow-up turns. Use this if the tail of the response (last word or two) is being captured into your next reply. Common on tablets without hardware echo cancellation, especially with synthesized voices like Piper. Try 300-500 ms; leave at 0 if follow-ups already work cleanly.'),
   stt_followup_chime: t(null, 'editor.behavior.helper_stt_followup_chime', 'Play the wake chime when the mic starts listening for a follow-up turn, so you have an audible "speak now" cue. Pairs naturally with a non-zero follow-up listen delay.'),
+  stt_audio_codec: t(null, 'editor.behavior.helper_stt_audio_codec', 'How the microphone audio is compressed on its way to Home Assistant. Keep uncompressed on a good network; µ-law or IMA ADPCM cut the upload for tablets on slow or busy Wi-Fi, at a small cost in audio quality.'),
+  stt_native_sample_rate: t(null, 'editor.behavior.helper_stt_native_sample_rate', "Send the microphone audio at the tablet's own rate (usually 44.1 or 48 kHz) and let Home Assistant resample it for speech to text with a proper anti-aliasing filter. Slightly cleaner audio at about three times the upload, and no CPU saving on the tablet. Off by default."),
 };
@@ -110,11 +110,15 @@ export default {
       seamless_wake_command: 'Seamless wake command (experimental)',
       stt_followup_delay_ms: 'Follow-up listen delay',
       stt_followup_chime: 'Follow-up ready chime',
+      stt_audio_codec: 'Audio upload codec',
+      stt_native_sample_rate: 'Stream at native sample rate',
       helper_satellite_entity: 'Add a satellite device first via Settings → Devices & Services → Voice Satellite.',
       helper_voice_isolation: 'AI-based voice isolation, currently only available in Chrome',
       helper_seamless_wake_command: 'Experimental and off by default. Lets one-shot phrases like "hey vesta turn off the lights" flow directly into STT. Skips the wake chime for that turn; results can vary by microphone, room acoustics, and STT engine.',
       helper_stt_followup_delay_ms: 'Pause between the assistant finishing speaking and the mic listening again on follow-up turns. Use this if the tail of the response (last word or two) is being captured into your next reply. Common on tablets without hardware echo cancellation, especially with synthesized voices like Piper. Try 300-500 ms; leave at 0 if follow-ups already work cleanly.',
       helper_stt_followup_chime: 'Play the wake chime when the mic starts listening for a follow-up turn, so you have an audible "speak now" cue. Pairs naturally with a non-zero follow-up listen delay.',
+      helper_stt_audio_codec: 'How the microphone audio is compressed on its way to Home Assistant. Keep uncompressed on a good network; µ-law or IMA ADPCM cut the upload for tablets on slow or busy Wi-Fi, at a small cost in audio quality.',
+      helper_stt_native_sample_rate: "Send the microphone audio at the tablet's own rate (usually 44.1 or 48 kHz) and let Home Assistant resample it for speech to text with a proper anti-aliasing filter. Slightly cleaner audio at about three times the upload, and no CPU saving on the tablet. Off by default.",
     },
     skin: {
       appearance: 'Skins & Appearance',
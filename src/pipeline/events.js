@@ -572,19 +572,41 @@ export function handleError(mgr, errorData) {
   if (EXPECTED_ERRORS.includes(errorCode)) {
     mgr.log.log('pipeline', `Expected error: ${errorCode} - restarting`);
 
+    // Server-side verification did not confirm the local wake word (see
+    // the wake_word_verify switch).  The run never reached STT: abort as
+    // silently as a losing duplicate wake.
+    if (errorCode === 'wake_word_rejected') {
+      mgr.card.wakeWord?.cancelPendingChime?.();
+      mgr.card.wakeWord?.clearPendingWakeLatency?.();
+      mgr.card.audio.stopBuffering?.({ clear: true });
+      mgr.card.ui.hideBlurOverlay(BlurReason.PIPELINE);
+      mgr.card.mediaPlayer.resumeAfterInterrupt();
+      if (INTERACTING_STATES.includes(mgr.card.currentState)) {
+        mgr.card.setState(State.IDLE);
+        mgr.card.chat.clear();
+        mgr.shouldContinue = false;
+        mgr.continueConversationId = null;
+      }
+      mgr.restart(0);
+      return;
+    }
+
     // Special case for cross-tablet wake word dedupe: if our wake chime
     // is still pending (we're inside the WAKE_DEDUPE_WINDOW_MS window
     // after a local detection), cancel it so the user doesn't hear
     // anything from this tablet at all. The other tablet — the one
     // that won the dedupe race — handles the user's actual interaction.
+    // Losing the server's wake arbitration (wake_arbitration.py) is the
+    // same outcome, decided by score instead of arrival order.
+    const duplicateWake = errorCode === 'duplicate_wake_up_detected'
+      || errorCode === 'wake_arbitration_lost';
     let duplicateLatencyMs = null;
-    if (errorCode === 'duplicate_wake_up_detected') {
+    if (duplicateWake) {
       duplicateLatencyMs = mgr.card.wakeWord?.getPendingWakeLatencyMs?.();
       if (duplicateLatencyMs !== null && duplicateLatencyMs !== undefined) {
         mgr.log.log('pipeline', `Duplicate wake-up received ${duplicateLatencyMs}ms after local wake activation`);
       }
     }
-    const duplicateWake = errorCode === 'duplicate_wake_up_detected';
     const cancelledPendingChime = duplicateWake && mgr.card.wakeWord?.cancelPendingChime?.();
     const seamlessPendingWake = duplicateWake
       && mgr.card.config?.seamless_wake_command === true
@@ -636,7 +658,7 @@ export function handleError(mgr, errorData) {
       mgr.shouldContinue = false;
       mgr.continueConversationId = null;
       mgr.card.mediaPlayer.resumeAfterInterrupt();
-      if (errorCode === 'duplicate_wake_up_detected') {
+      if (duplicateWake) {
         mgr.card.wakeWord?.clearPendingWakeLatency?.();
         // Late duplicate (chime already played, dedupe window passed):
         // surface the same info toast as the silent-abort branch so the
@@ -2,7 +2,8 @@
  * PipelineManager
  *
  * Manages the HA Assist pipeline lifecycle via the integration's
- * voice_satellite/run_pipeline subscription.
+ * voice_satellite/run_pipeline subscription, or as turns on a persistent
+ * voice_satellite/stream_session (see stream-session.js).
  *
  * Handles starting, stopping, restarting, error recovery with
  * linear backoff, continue conversation, and stale event filtering.
@@ -13,10 +14,13 @@
  */
 
 import { State, INTERACTING_STATES, BlurReason, Timing } from '../constants.js';
-import { getSelectState } from '../shared/satellite-state.js';
+import { getSelectState, getSwitchState } from '../shared/satellite-state.js';
 import { resumeNativeWake } from '../wake-word/native-handoff.js';
 import { subscribePipelineRun, setupReconnectListener } from './comms.js';
 import { subscribeKioskPipelineRun, nativePipelinePreferred } from './kiosk-transport.js';
+import { StreamSession } from './stream-session.js';
+import { sendPcm16 } from '../audio/processing.js';
+import { AUDIO_CODEC_PCM16, AUDIO_CODECS } from '../audio/encoders.js';
 import {
   handleRunStart,
   handleWakeWordStart,
@@ -30,6 +34,9 @@ import {
   handleVadWatchdog,
 } from './events.js';
 
+// Rate HA's pipeline runs at; audio at any other rate is resampled.
+const PIPELINE_SAMPLE_RATE = 16000;
+
 export class PipelineManager {
   constructor(card) {
     this._card = card;
@@ -53,6 +60,9 @@ export class PipelineManager {
     // up turns route through the same Pipeline N as the original turn.
     this._activeWakeWordSlot = null;
     this._isStreaming = false;
+    // Cleared if the integration answers not_supported to a run at the
+    // capture rate (stt_native_sample_rate): 16 kHz from then on.
+    this._serverResample = true;
     // Latched by resumeDeferredAudio() when the wake chime window elapses
     // before the init event has delivered the binary handler ID; start()
     // reads it so a deferred-audio run still begins streaming.
@@ -87,6 +97,9 @@ export class PipelineManager {
     // superseded and abort without clobbering the current subscription.
     this._pipelineGen = 0;
     this._cancelInit = null;
+
+    // Persistent audio stream shared by the page-transport audio runs.
+    this._streamSession = new StreamSession(card);
   }
   get card() { return this._card; }
   get log() { return this._log; }
@@ -167,7 +180,7 @@ export class PipelineManager {
     const runConfig = {
       start_stage: opts.start_stage || 'wake_word',
       end_stage: opts.end_stage || 'tts',
-      sample_rate: 16000,
+      sample_rate: PIPELINE_SAMPLE_RATE,
     };
 
     if (opts.conversation_id) {
@@ -185,6 +198,26 @@ export class PipelineManager {
       runConfig.wake_word_phrase = opts.wake_word_phrase;
     }
 
+    // Detection score / speech level for cross-satellite wake arbitration,
+    // and the engine and model the score came from.
+    if (Number.isFinite(opts.wake_word_score)) {
+      runConfig.wake_word_score = opts.wake_word_score;
+      if (opts.wake_word_engine && opts.wake_word_model) {
+        runConfig.wake_word_engine = opts.wake_word_engine;
+        runConfig.wake_word_model = opts.wake_word_model;
+      }
+    }
+    if (Number.isFinite(opts.wake_word_energy)) {
+      runConfig.wake_word_energy = opts.wake_word_energy;
+    }
+
+    // Server-side speech gate (the satellite's vad_gate switch): trims
+    // the silence around the command before it reaches STT.  The server
+    // applies it to stt runs only.
+    if (getSwitchState(this._card.hass, config.satellite_entity, 'vad_gate') === true) {
+      runConfig.vad_gate = true;
+    }
+
     if (opts.wake_word_slot === 1 || opts.wake_word_slot === 2) {
       runConfig.wake_word_slot = opts.wake_word_slot;
       // Remember the slot so a subsequent restartContinue() can route the
@@ -230,6 +263,54 @@ export class PipelineManager {
       }
     }
 
+    // Server-side wake word verification: the pre-roll goes out ahead of
+    // the live audio as soon as the handler ID is known.  Page transport
+    // only - a delegated run's audio lives in the app.
+    const verifyAudio = !useKiosk && opts.verify_wake_word && opts.verify_audio?.length
+      ? opts.verify_audio
+      : null;
+    if (verifyAudio) {
+      runConfig.verify_wake_word = opts.verify_wake_word;
+      runConfig.verify_preroll_ms = Math.round(verifyAudio.length / 16);
+    }
+    // Otherwise the tail of the wake word ring is the stt run's pre-roll:
+    // a streaming session buffers it on the server, which replays
+    // preroll_ms of it into the new turn; a run_pipeline run gets it
+    // ahead of the live audio, like the verification pre-roll.
+    const prerollAudio = !useKiosk && !verifyAudio && runConfig.start_stage === 'stt'
+      && opts.preroll_audio?.length
+      ? opts.preroll_audio
+      : null;
+    if (prerollAudio) {
+      runConfig.preroll_ms = Math.round(prerollAudio.length / 16);
+    }
+
+    // Page transport honours audio-pause / audio-resume (see
+    // AudioManager.setSendPaused), so a server that falls behind holds
+    // the card back instead of dropping the oldest speech.
+    if (!useKiosk && !isTextInput) {
+      runConfig.audio_queue_policy = 'pause';
+    }
+
+    // Upstream format.  The page resamples to 16 kHz; with the
+    // stt_native_sample_rate option it streams at its capture rate for
+    // the server to resample instead, unless the integration said it
+    // cannot (no NumPy).  The stt_audio_codec option picks the codec; the page encodes its audio, pre-roll included, and
+    // the server decodes it back to PCM.  A delegated run's audio is sent
+    // by the app, as 16 kHz PCM - and so is a kiosk fallback's, whose mic
+    // is reacquired after this point.
+    let streamCodec = AUDIO_CODEC_PCM16;
+    let streamRate = PIPELINE_SAMPLE_RATE;
+    if (!useKiosk && !isTextInput) {
+      if (AUDIO_CODECS.includes(config.stt_audio_codec)) streamCodec = config.stt_audio_codec;
+      if (config.stt_native_sample_rate === true && this._serverResample) {
+        streamRate = this._card.audio.actualSampleRate;
+      }
+    }
+    runConfig.sample_rate = streamRate;
+    if (streamCodec !== AUDIO_CODEC_PCM16) runConfig.audio_codec = streamCodec;
+    this._card.audio.setStreamFormat(streamCodec, streamRate);
+
     // Reset run-start tracking - used to detect stale run-end events
     this._runStartReceived = false;
     this._startStage = runConfig.start_stage;
@@ -294,13 +375,22 @@ export class PipelineManager {
         }
       }
     }
+    if (!unsub && !isTextInput && !this._streamSession.unsupported) {
+      unsub = await this._startSessionTurn(runConfig, onRunMessage, gen, prerollAudio);
+    }
+    const prerollPending = !!prerollAudio && !unsub;
     if (!unsub) {
-      unsub = await subscribePipelineRun(
-        connection,
-        config.satellite_entity,
-        runConfig,
-        onRunMessage,
-      );
+      try {
+        unsub = await subscribePipelineRun(
+          connection,
+          config.satellite_entity,
+          runConfig,
+          onRunMessage,
+        );
+      } catch (e) {
+        this._noteResampleError(e, runConfig);
+        throw e;
+      }
     }
     if (this._pipelineGen !== gen) {
       this._log.log('pipeline', 'Aborting stale start() after subscribe - pipeline was stopped');
@@ -329,6 +419,15 @@ export class PipelineManager {
       return;
     }
 
+    if (verifyAudio) {
+      this._log.log('pipeline', `Sending ${runConfig.verify_preroll_ms}ms wake word pre-roll for verification`);
+      sendPcm16(this._card, verifyAudio, this._binaryHandlerId);
+    }
+    if (prerollPending) {
+      this._log.log('pipeline', `Sending ${runConfig.preroll_ms}ms wake word pre-roll`);
+      sendPcm16(this._card, prerollAudio, this._binaryHandlerId);
+    }
+
     if (opts.defer_audio_start) {
       if (this._deferredAudioReady) {
         // The chime/unmute window already elapsed while the subscribe +
@@ -383,6 +482,57 @@ export class PipelineManager {
     // The reconnect handler covers WebSocket drops.
   }
 
+  /**
+   * Start the run as the next turn of the streaming session, opening the
+   * session first if needed. The session's handler ID stands in for the
+   * init event of a run_pipeline subscription. A wake word pre-roll goes
+   * out on the session just before the turn starts, for the server to
+   * replay into it. Returns null when the integration has no session
+   * support (use run_pipeline instead).
+   */
+  async _startSessionTurn(runConfig, onRunMessage, gen, prerollAudio = null) {
+    const { connection, config } = this._card;
+    const session = this._streamSession;
+    for (let attempt = 0; ; attempt++) {
+      try {
+        await session.open(connection, config.satellite_entity, runConfig);
+        if (prerollAudio) sendPcm16(this._card, prerollAudio, session.handlerId);
+        const endTurn = await session.startTurn(runConfig, onRunMessage);
+        if (this._pipelineGen === gen) {
+          onRunMessage({ type: 'init', handler_id: session.handlerId });
+        }
+        return endTurn;
+      } catch (e) {
+        if (session.unsupported) return null;
+        // The server lost the session (reconnect, integration reload):
+        // reopen once.
+        if (e?.code === 'no_session' && attempt === 0) {
+          this._log.log('pipeline', 'Streaming session gone on the server - reopening');
+          await session.close();
+          continue;
+        }
+        this._noteResampleError(e, runConfig);
+        throw e;
+      }
+    }
+  }
+
+  /**
+   * A run at the capture rate was refused because the integration cannot
+   * resample (no NumPy on the server): resample on the tablet from the
+   * next run on.  The failed run is retried by the caller as usual.
+   */
+  _noteResampleError(e, runConfig) {
+    if (e?.code !== 'not_supported' || runConfig.sample_rate === PIPELINE_SAMPLE_RATE) return;
+    this._log.log('pipeline', `Integration cannot resample ${runConfig.sample_rate} Hz audio - resampling to 16 kHz on the device`);
+    this._serverResample = false;
+  }
+
+  /** Close the streaming session (card teardown). */
+  closeStreamSession() {
+    this._streamSession.close().catch(() => { /* connection may be gone */ });
+  }
+
   /**
    * Called by the wake chime choreography once the dedupe window and chime
    * have elapsed and the mic is live again. If the init event has already
@@ -0,0 +1,172 @@
+/**
+ * StreamSession
+ *
+ * Client side of the integration's voice_satellite/stream_session
+ * command: one subscription and one binary handler per satellite, kept
+ * across pipeline runs.  Each run is a voice_satellite/session_turn call;
+ * its events come back on the session subscription tagged with the turn
+ * number and are routed to that turn's listener, so a late event of the
+ * previous turn never reaches the current one.  Saves the subscribe +
+ * init round trip and the server-side setup of every wake and
+ * continue-conversation turn.
+ */
+
+import { sendBinaryAudio } from '../audio/comms.js';
+
+// run_pipeline settings of the audio transport: a session takes them once,
+// when it opens, and a turn with different ones reopens the session.
+const TRANSPORT_KEYS = ['sample_rate', 'audio_queue_policy', 'audio_codec'];
+
+/**
+ * Split a run config into its audio transport settings and the rest.
+ * @param {object} runConfig
+ * @returns {{transport: object, turnConfig: object}}
+ */
+function splitTransport(runConfig) {
+  const transport = {};
+  const turnConfig = {};
+  for (const [key, value] of Object.entries(runConfig)) {
+    if (TRANSPORT_KEYS.includes(key)) transport[key] = value;
+    else turnConfig[key] = value;
+  }
+  return { transport, turnConfig };
+}
+
+export class StreamSession {
+  constructor(card) {
+    this._card = card;
+    this._log = card.logger;
+    this._connection = null;
+    this._entityId = null;
+    this._transportKey = null;
+    this._unsubscribe = null;
+    this._handlerId = null;
+    this._opening = null;
+    this._turn = null;
+    this._onMessage = null;
+    // Latched when the backend does not know the session commands; the
+    // pipeline then falls back to one run_pipeline subscription per run.
+    this._unsupported = false;
+  }
+
+  get handlerId() { return this._handlerId; }
+  get unsupported() { return this._unsupported; }
+
+  /**
+   * Open the session (once per connection + satellite + transport).
+   * @param {object} connection - HA WebSocket connection
+   * @param {string} entityId - Satellite entity ID
+   * @param {object} runConfig - the run's settings; only the audio
+   *   transport ones (sample rate, queue policy, codec) are used
+   */
+  async open(connection, entityId, runConfig) {
+    const { transport } = splitTransport(runConfig);
+    const transportKey = JSON.stringify(transport);
+    while (this._opening) {
+      try { await this._opening; } catch (_) { /* retried below */ }
+    }
+    if (
+      this._unsubscribe
+      && this._connection === connection
+      && this._entityId === entityId
+      && this._transportKey === transportKey
+    ) return;
+    this._opening = this._open(connection, entityId, transport, transportKey)
+      .finally(() => { this._opening = null; });
+    await this._opening;
+  }
+
+  async _open(connection, entityId, transport, transportKey) {
+    await this.close();
+    let resolveInit;
+    const initPromise = new Promise((resolve) => { resolveInit = resolve; });
+    let unsub;
+    try {
+      unsub = await connection.subscribeMessage(
+        (message) => this._onSessionMessage(message, resolveInit),
+        { type: 'voice_satellite/stream_session', entity_id: entityId, ...transport },
+        // A dropped socket ends the session server side; the next turn
+        // reopens it rather than the library resubscribing behind our back.
+        { resubscribe: false },
+      );
+    } catch (e) {
+      if (e?.code === 'unknown_command') {
+        this._log.log('pipeline', 'Streaming session not supported by the integration - using per-run subscriptions');
+        this._unsupported = true;
+      }
+      throw e;
+    }
+    this._unsubscribe = unsub;
+    this._connection = connection;
+    this._entityId = entityId;
+    this._transportKey = transportKey;
+    await initPromise;
+    this._log.log('pipeline', `Streaming session open - handler ID: ${this._handlerId}`);
+  }
+
+  _onSessionMessage(message, resolveInit) {
+    if (message.turn === undefined) {
+      if (message.type === 'init') {
+        this._handlerId = message.handler_id;
+        resolveInit();
+      } else if (message.type === 'reload') {
+        // The satellite entity is going away; the next turn reopens.
+        this._log.log('pipeline', 'Streaming session closed by integration reload');
+        this._drop();
+      }
+      return;
+    }
+    if (message.turn !== this._turn) return;
+    this._onMessage?.(message);
+  }
+
+  /**
+   * Start the next pipeline run on the session.
+   * @param {object} runConfig - run settings (the transport ones are
+   *   session-wide and were sent by open())
+   * @param {(message: object) => void} onMessage - the turn's event callback
+   * @returns {Promise<Function>} ends the turn's audio stream
+   */
+  async startTurn(runConfig, onMessage) {
+    const { turnConfig } = splitTransport(runConfig);
+    this._turn = null;
+    this._onMessage = onMessage;
+    const result = await this._connection.sendMessagePromise({
+      type: 'voice_satellite/session_turn',
+      entity_id: this._entityId,
+      ...turnConfig,
+    });
+    this._turn = result.turn;
+    const turn = result.turn;
+    return async () => this._endTurn(turn);
+  }
+
+  _endTurn(turn) {
+    if (this._turn !== turn) return;
+    this._turn = null;
+    this._onMessage = null;
+    // Empty payload = end of this turn's audio stream.
+    if (this._handlerId !== null) {
+      sendBinaryAudio(this._card, new Int16Array(0), this._handlerId);
+    }
+  }
+
+  _drop() {
+    this._unsubscribe = null;
+    this._connection = null;
+    this._entityId = null;
+    this._transportKey = null;
+    this._handlerId = null;
+    this._turn = null;
+    this._onMessage = null;
+  }
+
+  /** Close the session subscription (card teardown, stale session). */
+  async close() {
+    const unsub = this._unsubscribe;
+    this._drop();
+    if (unsub) {
+      try { await unsub(); } catch (_) { /* connection may be gone */ }
+    }
+  }
+}
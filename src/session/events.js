@@ -719,6 +719,8 @@ export function handlePipelineMessage(session, message) {
     case 'tts-start': setState(session, State.TTS); break;
     case 'tts-end': session.pipeline.handleTtsEnd(eventData); break;
     case 'tts-audio-duration': session.tts.setAudioDuration(eventData.duration); break;
+    case 'audio-pause': session.audio.setSendPaused(true); break;
+    case 'audio-resume': session.audio.setSendPaused(false); break;
     case 'run-end': session.pipeline.handleRunEnd(); break;
     case 'error': session.pipeline.handleError(eventData); break;
     case 'displaced':
@@ -363,7 +363,8 @@ export class VoiceSatelliteSession {
     const sessionKeys = [
       'satellite_entity', 'debug',
       ...micKeys,
-      'seamless_wake_command', 'stt_followup_delay_ms', 'stt_followup_chime',
+      'seamless_wake_command', 'stt_followup_delay_ms', 'stt_followup_chime', 'stt_audio_codec',
+      'stt_native_sample_rate',
       'reactive_bar', 'reactive_bar_update_interval_ms',
       'chat_show_user_command', 'chat_show_assistant_response', 'chat_show_tool_usage',
       'media_panel_linger_s',
@@ -498,6 +499,7 @@ export class VoiceSatelliteSession {
     }
     try { this._wakeWord?.release(); } catch (e) { this._logger.log('session', `wakeWord.release: ${e.message || e}`); }
     try { this._pipeline.stop(); } catch (e) { this._logger.log('session', `pipeline.stop: ${e.message || e}`); }
+    try { this._pipeline.closeStreamSession(); } catch (e) { this._logger.log('session', `pipeline.closeStreamSession: ${e.message || e}`); }
     try { this._audio.stopMicrophone(); } catch (e) { this._logger.log('session', `audio.stopMicrophone: ${e.message || e}`); }
     try { this._tts.stop(); } catch (e) { this._logger.log('session', `tts.stop: ${e.message || e}`); }
     try { this._timer.destroy(); } catch (e) { this._logger.log('session', `timer.destroy: ${e.message || e}`); }
@@ -87,6 +87,10 @@ export function dispatchSatelliteEvent(card, event) {
 
   // TTS audio duration - route to TTS manager and any active notification manager
   if (type === 'tts-audio-duration') {
+    if (data.final === false) {
+      card.tts.setAudioDurationEstimate(data.duration, data.tts_url);
+      return;
+    }
     card.tts.setAudioDuration(data.duration, data.tts_url);
     _setNotificationAudioDuration(card, data.duration);
     return;
@@ -104,6 +108,13 @@ export function dispatchSatelliteEvent(card, event) {
     return;
   }
 
+  // Stop word heard by the in-process openWakeWord entity while this
+  // satellite was responding.  Same handler as an on-device detection.
+  if (type === 'stop_word') {
+    card.wakeWord?.onNativeStopDetection?.();
+    return;
+  }
+
   // voice_satellite.set_screensaver action. Updates the per-browser
   // panel config and propagates to the running session so the screensaver
   // re-renders with the new settings.
@@ -57,14 +57,59 @@ export function getSiblingEntities(hass, satelliteId) {
   return byDevice.get(satellite.device_id) || _noSiblings;
 }
 
+/**
+ * Config pushed on the satellite subscription (`config` events).
+ *
+ * The integration sends a full snapshot right after subscribing, then
+ * only the keys that changed, each under a higher revision. While every
+ * connected card reads config from this channel, the server stops
+ * re-writing the satellite state on settings changes, so the entity's
+ * config attributes can lag: getSatelliteAttr() answers from here first.
+ */
+let _config = null; // {entityId, revision, values}
+
+/**
+ * Apply a `config` event from the satellite subscription.
+ * @param {string} entityId - Satellite entity ID the subscription is for
+ * @param {{revision: number, full: boolean, config: object}} data
+ * @returns {boolean} false when a delta skipped a revision (re-subscribe
+ *   for a fresh snapshot)
+ */
+export function applyConfigEvent(entityId, data) {
+  if (!data?.config) return true;
+  if (data.full || !_config || _config.entityId !== entityId) {
+    if (!data.full) return false;
+    _config = { entityId, revision: data.revision, values: { ...data.config } };
+    return true;
+  }
+  if (data.revision <= _config.revision) return true; // duplicate delivery
+  if (data.revision !== _config.revision + 1) return false;
+  // A removed key (null) stays known, so it does not fall back to a
+  // stale attribute.
+  for (const [key, value] of Object.entries(data.config)) {
+    _config.values[key] = value === null ? undefined : value;
+  }
+  _config.revision = data.revision;
+  return true;
+}
+
+/** Forget the pushed config (satellite subscription torn down). */
+export function clearConfig() {
+  _config = null;
+}
+
 /**
  * Read an attribute from the satellite entity's HA state.
+ * Config keys come from the pushed config when the subscription has one.
  * @param {object} hass - HA frontend object
  * @param {string} entityId - Satellite entity ID
  * @param {string} name - Attribute name
  * @returns {*} Attribute value, or undefined if unavailable
  */
 export function getSatelliteAttr(hass, entityId, name) {
+  if (_config && _config.entityId === entityId && name in _config.values) {
+    return _config.values[name];
+  }
   if (!hass || !entityId) return undefined;
   const state = hass.states[entityId];
   return state?.attributes?.[name];
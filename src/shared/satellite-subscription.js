@@ -27,6 +27,7 @@ import {
   resetNotificationDedup,
   teardownVisibilityListener,
 } from './satellite-notification.js';
+import { applyConfigEvent, clearConfig } from './satellite-state.js';
 
 let _unsubscribe = null;
 let _subscribed = false;
@@ -154,11 +155,23 @@ function _doSubscribe(card, connection, onEvent) {
         }
         return;
       }
+      // Config channel: kept in satellite-state.js, not dispatched. A gap
+      // in revisions means a delta was lost - re-subscribe for a snapshot.
+      if (message.type === 'config') {
+        if (!applyConfigEvent(card.config.satellite_entity, message.data)) {
+          card.logger.log('satellite-sub', 'Config revision gap - re-subscribing');
+          _cleanup();
+          _subscribed = true;
+          _doSubscribe(card, connection, onEvent);
+        }
+        return;
+      }
       onEvent(message);
     },
     {
       type: 'voice_satellite/subscribe_events',
       entity_id: card.config.satellite_entity,
+      config_events: true,
     },
     // No haws auto-replay: the 'ready' listener above re-subscribes with
     // retry/backoff instead (see the header comment for why).
@@ -233,6 +246,7 @@ export function teardownSatelliteSubscription() {
   }
   _card = null;
   _onEvent = null;
+  clearConfig();
   teardownVisibilityListener();
 }
 
@@ -1,10 +1,25 @@
 /**
  * TTS Comms
  *
- * Remote media player service calls for TTS playback.
+ * Remote media player service calls for TTS playback, and the playback
+ * ACK the integration times its first-audio latency with.
  * Pure comms - no timer scheduling or manager state mutation.
  */
 
+/**
+ * Tell the integration a pipeline's TTS audio started playing (feeds the
+ * satellite's response latency). Fire-and-forget.
+ * @param {object} card - Card instance
+ */
+export function sendPlaybackStarted(card) {
+  if (!card.connection || !card.config.satellite_entity) return;
+
+  card.connection.sendMessagePromise({
+    type: 'voice_satellite/tts_playback_started',
+    entity_id: card.config.satellite_entity,
+  }).catch(() => { /* older integration, or the socket is gone */ });
+}
+
 /**
  * Play TTS on a remote media player entity.
  * Uses media-source:// URIs when available so HA resolves/proxies the audio
@@ -7,7 +7,7 @@
 
 import { playChime as playChimeSound, CHIME_WAKE, CHIME_ERROR, CHIME_DONE, getChimeDuration } from '../audio/chime.js';
 import { buildMediaUrl, buildRemoteMediaUrl } from '../audio/media-playback.js';
-import { playRemote, restoreRemote, stopRemote } from './comms.js';
+import { playRemote, restoreRemote, stopRemote, sendPlaybackStarted } from './comms.js';
 import { getSelectState } from '../shared/satellite-state.js';
 import { supportsNativeSound, playNativeSoundTracked } from '../kiosk/index.js';
 import { Timing } from '../constants.js';
@@ -55,6 +55,9 @@ export class TtsManager {
     // 'Playback complete' log can show elapsed-vs-expected in one line.
     this._playStartTs = 0;
     this._serverDuration = 0;
+    // Interim lower bound from `final: false` duration events while the
+    // server is still reading a streamed reply; pacing only.
+    this._estimatedDuration = 0;
 
     // Retry fallback - tts-end URL stored for retry on playback failure
     this._pendingTtsEndUrl = null;
@@ -111,10 +114,11 @@ export class TtsManager {
       }
     }
 
-    if (!this._serverDuration || !this._playStartTs) return null;
+    const duration = this._serverDuration || this._estimatedDuration;
+    if (!duration || !this._playStartTs) return null;
     return {
       elapsed: Math.max(0, (performance.now() - this._playStartTs) / 1000),
-      duration: this._serverDuration,
+      duration,
     };
   }
 
@@ -145,6 +149,7 @@ export class TtsManager {
     // these against the actual end time to detect early stream-close.
     this._playStartTs = performance.now();
     this._serverDuration = 0;
+    this._estimatedDuration = 0;
 
     // Remote media player target - monitor entity state for completion
     const ttsTarget = this._card.ttsTarget;
@@ -255,6 +260,7 @@ export class TtsManager {
       if (handled || this._nativeSound !== tracked) return;
       this._log.log('tts', 'Playback started (native)');
       this._pendingTtsEndUrl = null;
+      sendPlaybackStarted(this._card);
       this._card.mediaPlayer.notifyAudioStart('tts');
       if (this._card.isReactiveBarEnabled) {
         // The audio never enters the page; the app measures it and streams
@@ -409,6 +415,7 @@ export class TtsManager {
       if (handled) return;
       this._log.log('tts', 'Playback started successfully');
       this._pendingTtsEndUrl = null;
+      sendPlaybackStarted(this._card);
       this._card.mediaPlayer.notifyAudioStart('tts');
       if (this._card.isReactiveBarEnabled) {
         this._card.analyser.attachAudio(audio, this._card.audio.audioContext);
@@ -632,10 +639,23 @@ export class TtsManager {
     }
   }
 
+  /**
+   * Interim duration while the integration is still walking a streamed
+   * reply: a lower bound that grows. Feeds playback pacing only - the
+   * completion timer waits for the final measurement.
+   * @param {number} duration - Audio duration walked so far, in seconds
+   * @param {string} [ttsUrl] - TTS proxy URL to correlate with current playback
+   */
+  setAudioDurationEstimate(duration, ttsUrl) {
+    if (!this._playing || this._serverDuration) return;
+    if (ttsUrl && this._ttsUrl && ttsUrl !== this._ttsUrl) return;
+    this._estimatedDuration = duration;
+  }
+
   /**
    * Set a duration-based completion timer for remote TTS playback.
-   * Called when the integration sends a tts-audio-duration event after
-   * measuring the audio length server-side via mutagen.
+   * Called when the integration sends the final tts-audio-duration event
+   * after measuring the audio length server-side.
    * @param {number} duration - Audio duration in seconds
    * @param {string} [ttsUrl] - TTS proxy URL to correlate with current playback
    */
@@ -759,6 +779,7 @@ export class TtsManager {
       if (wasAlreadyActive && contentId === this._remoteInitialContentId) return;
 
       this._remoteSawPlaying = true;
+      sendPlaybackStarted(this._card);
       return;
     }
 
@@ -29,6 +29,13 @@ const DETECTION_MODE_LOCAL_VWW = 'On Device (vsWakeWord)';
 
 const CHUNK_SIZE = 1280; // 80ms @ 16kHz
 const MAX_POOL = 20;    // cap recycled frame pool (20 * 5KB = 100KB max)
+// Audio kept for server-side wake word verification: the detection's
+// pre-roll (matches the integration's DEFAULT_VERIFY_PREROLL_MS).
+const VERIFY_PREROLL_SAMPLES = 16000 * 1.5;
+// Tail of that audio sent as an stt run's pre-roll when the run is not
+// verified: detection fires a little after the wake word ends, so the
+// newest audio fed to the model may already be the start of the command.
+const WAKE_PREROLL_SAMPLES = 16000 * 0.3;
 
 // Detect constrained WebView (Fully Kiosk, Android WebView) - load
 // delay applied at the start of wake-word.start() to avoid OOM during
@@ -107,6 +114,31 @@ function formatWakeRuntimeStatus(result) {
 // to "chime then silence").
 const WAKE_DEDUPE_WINDOW_MS = 250;
 
+/**
+ * Pipeline start options for server-side wake arbitration: the detection
+ * score and speech level, which the server compares across satellites of
+ * the same group that heard the same wake word (see wake_arbitration.py),
+ * and the engine and model behind the score - scores are only compared
+ * between detections of the same engine and model.
+ * @param {object} [result] - the detection result
+ * @param {string|null} [engine] - 'mww' | 'oww' | 'vww'
+ * @param {string} [modelName]
+ * @returns {object}
+ */
+function arbitrationOpts(result, engine, modelName) {
+  const opts = {};
+  if (Number.isFinite(result?.score)) {
+    opts.wake_word_score = result.score;
+    if (engine && modelName) {
+      opts.wake_word_engine = engine;
+      opts.wake_word_model = modelName;
+    }
+  }
+  const energy = Number.isFinite(result?.windowRms) ? result.windowRms : result?.rms;
+  if (Number.isFinite(energy)) opts.wake_word_energy = energy;
+  return opts;
+}
+
 // ─── Detection thresholds ────────────────────────────────────────────
 // microWakeWord models output confidence scores (0-1 via uint8/255).
 // Detection uses sliding window mean > cutoff. The base cutoff comes from
@@ -173,6 +205,9 @@ export class WakeWordManager {
     this._active = false;
     this._sampleBuf = new Float32Array(CHUNK_SIZE * 2);
     this._sampleBufLen = 0;
+    this._prerollRing = new Float32Array(VERIFY_PREROLL_SAMPLES);
+    this._prerollPos = 0;
+    this._prerollFill = 0;
     this._framePool = []; // recycled Float32Array buffers to avoid allocation
     this._loadedModelsKey = null; // sorted model names string for change detection
     this._processing = false;
@@ -872,6 +907,8 @@ export class WakeWordManager {
   feedAudio(chunk) {
     if ((!this._active && !this._stopOnlyMode) || !this._inference) return;
 
+    if (this._active) this._recordPreroll(chunk);
+
     // Grow pre-allocated buffer if needed (rare - only if chunk is unusually large)
     const needed = this._sampleBufLen + chunk.length;
     if (needed > this._sampleBuf.length) {
@@ -915,6 +952,49 @@ export class WakeWordManager {
     this._drainQueue();
   }
 
+  /**
+   * Keep the latest VERIFY_PREROLL_SAMPLES of fed audio in a ring.
+   * @param {Float32Array} chunk
+   */
+  _recordPreroll(chunk) {
+    const ring = this._prerollRing;
+    const src = chunk.length > ring.length ? chunk.subarray(chunk.length - ring.length) : chunk;
+    const first = Math.min(src.length, ring.length - this._prerollPos);
+    ring.set(src.subarray(0, first), this._prerollPos);
+    ring.set(src.subarray(first), 0);
+    this._prerollPos = (this._prerollPos + src.length) % ring.length;
+    this._prerollFill = Math.min(ring.length, this._prerollFill + src.length);
+  }
+
+  /**
+   * Pipeline start options carrying the detection's pre-roll, oldest
+   * first: all of it for server-side wake word verification when the
+   * satellite's wake_word_verify switch is on, otherwise its newest
+   * WAKE_PREROLL_SAMPLES as the stt run's pre-roll.  Empties the ring.
+   * @param {string} modelName
+   * @returns {object}
+   */
+  _prerollOpts(modelName) {
+    const session = this._session;
+    const fill = this._prerollFill;
+    this._prerollFill = 0;
+    const verify = getSwitchState(
+      session.hass, session.config.satellite_entity, 'wake_word_verify',
+    ) === true;
+    if (verify && fill < VERIFY_PREROLL_SAMPLES) return {};
+    const count = verify ? fill : Math.min(fill, WAKE_PREROLL_SAMPLES);
+    if (!count) return {};
+    const ring = this._prerollRing;
+    const audio = new Float32Array(count);
+    const start = (this._prerollPos - count + ring.length) % ring.length;
+    const first = Math.min(count, ring.length - start);
+    audio.set(ring.subarray(start, start + first));
+    audio.set(ring.subarray(0, count - first), first);
+    return verify
+      ? { verify_wake_word: modelName, verify_audio: audio }
+      : { preroll_audio: audio };
+  }
+
   /**
    * Process queued frames one at a time (serialized).
    * Prevents concurrent inference from corrupting shared state.
@@ -946,7 +1026,7 @@ export class WakeWordManager {
           if (isStopModelName(result.model)) {
             await this._onStopDetection();
           } else {
-            await this._onDetection(result.model);
+            await this._onDetection(result.model, result);
           }
           return;
         }
@@ -961,8 +1041,9 @@ export class WakeWordManager {
   /**
    * Handle wake word detection - mirrors pipeline handleWakeWordEnd behavior.
    * @param {string} modelName - the model that triggered detection
+   * @param {object} [result] - the detection result (score, rms, windowRms)
    */
-  async _onDetection(modelName) {
+  async _onDetection(modelName, result) {
     // Stop listening for more wake words
     this._active = false;
     this._pendingWakeActivatedAt = performance.now();
@@ -1068,6 +1149,8 @@ export class WakeWordManager {
           wake_word_phrase: this.getWakeWordPhrase(modelName),
           wake_word_slot: this.getSlotForModel(modelName),
           preserve_audio_buffer: true,
+          ...this._prerollOpts(modelName),
+          ...arbitrationOpts(result, this.getEngine(), modelName),
         })
         .catch((e) => {
           this._log.error('wake-word', `Pipeline start failed after seamless detection: ${e.message || e}`);
@@ -1122,6 +1205,8 @@ export class WakeWordManager {
         wake_word_phrase: this.getWakeWordPhrase(modelName),
         wake_word_slot: this.getSlotForModel(modelName),
         defer_audio_start: true,
+        ...this._prerollOpts(modelName),
+        ...arbitrationOpts(result, this.getEngine(), modelName),
       })
       .catch((e) => {
         this._log.error('wake-word', `Pipeline start failed after detection: ${e.message || e}`);
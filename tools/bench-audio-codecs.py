@@ -0,0 +1,161 @@
+"""Benchmark: server-side decode cost of the upstream audio codecs.
+
+Encodes a synthetic speech-like signal (gliding harmonics plus noise,
+16 kHz Int16) into card-sized payloads for each codec in
+audio_codecs.py, then times the integration's decoders on them.
+Reports per codec and decoder (NumPy / pure Python):
+
+  * usPerSatSecond   - decode CPU per second of audio from one satellite
+  * streamsPerCore   - satellites one core could decode at 10 % load
+  * kbitPerSecond    - upstream bandwidth per satellite
+  * snrDb            - round-trip signal-to-noise ratio vs the source PCM
+                       (null when lossless)
+
+The encoders here are straightforward references (G.711 µ-law and IMA
+ADPCM with the 4-byte per-payload header the decoder expects); they
+only exist to produce test input.
+
+Runs without Home Assistant installed: audio_codecs has no imports from
+the package, so it is loaded as a bare namespace (skipping __init__.py).
+"""
+
+import argparse
+import json
+import math
+import random
+import struct
+import sys
+import time
+import types
+from pathlib import Path
+
+
+def load_audio_codecs(repo_root: Path):
+    pkg_dir = repo_root / "custom_components" / "voice_satellite"
+    pkg = types.ModuleType("voice_satellite")
+    pkg.__path__ = [str(pkg_dir)]
+    sys.modules["voice_satellite"] = pkg
+    import voice_satellite.audio_codecs as audio_codecs  # noqa: E402
+
+    return audio_codecs
+
+
+def make_signal(seconds: float, seed: int) -> list[int]:
+    rng = random.Random(seed)
+    samples = []
+    phase = 0.0
+    for n in range(int(seconds * 16000)):
+        t = n / 16000
+        f0 = 140 + 60 * math.sin(2 * math.pi * 0.7 * t)
+        phase += 2 * math.pi * f0 / 16000
+        envelope = 0.5 + 0.5 * math.sin(2 * math.pi * 3 * t)
+        value = sum(math.sin(k * phase) / k for k in range(1, 6))
+        samples.append(int(6000 * envelope * value + rng.gauss(0, 300)))
+    return [max(-32768, min(32767, s)) for s in samples]
+
+
+def mulaw_encode(sample: int) -> int:
+    sign = 0x80 if sample < 0 else 0
+    magnitude = min(32635, abs(sample)) + 0x84
+    exponent = max(0, magnitude.bit_length() - 8)
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    return ~(sign | (exponent << 4) | mantissa) & 0xFF
+
+
+def adpcm_encode(codecs, samples: list[int]) -> bytes:
+    predictor = samples[0]
+    index = 0
+    header = struct.pack("<hBB", predictor, index, 0)
+    nibbles = []
+    for sample in samples:
+        step = codecs._IMA_STEPS[index]
+        delta = sample - predictor
+        nibble = 8 if delta < 0 else 0
+        delta = abs(delta)
+        if delta >= step:
+            nibble |= 4
+            delta -= step
+        if delta >= step >> 1:
+            nibble |= 2
+            delta -= step >> 1
+        if delta >= step >> 2:
+            nibble |= 1
+        predictor += codecs._ima_diff(step, nibble)
+        predictor = max(-32768, min(32767, predictor))
+        index = codecs._ima_next_index(index, nibble)
+        nibbles.append(nibble)
+    if len(nibbles) % 2:
+        nibbles.append(0)
+    body = bytes(lo | (hi << 4) for lo, hi in zip(nibbles[0::2], nibbles[1::2]))
+    return header + body
+
+
+def encode(codecs, codec: str, samples: list[int], payload_ms: int) -> list[bytes]:
+    per = 16 * payload_ms
+    chunks = [samples[i:i + per] for i in range(0, len(samples), per)]
+    if codec == codecs.AUDIO_CODEC_MULAW:
+        return [bytes(map(mulaw_encode, chunk)) for chunk in chunks]
+    if codec == codecs.AUDIO_CODEC_IMA_ADPCM:
+        return [adpcm_encode(codecs, chunk) for chunk in chunks]
+    return [struct.pack(f"<{len(c)}h", *c) for c in chunks]
+
+
+def snr_db(reference: list[int], decoded: bytes) -> float | None:
+    out = struct.unpack(f"<{len(decoded) // 2}h", decoded)
+    signal = sum(s * s for s in reference)
+    noise = sum((a - b) ** 2 for a, b in zip(reference, out))
+    if not noise:
+        return None  # lossless
+    return round(10 * math.log10(signal / noise), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--payload-ms", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1337)
+    args = parser.parse_args()
+
+    codecs = load_audio_codecs(Path(__file__).resolve().parents[1])
+    samples = make_signal(args.seconds, args.seed)
+
+    decoders = {"python": {
+        codecs.AUDIO_CODEC_PCM16: codecs._decode_pcm16,
+        codecs.AUDIO_CODEC_MULAW: codecs._decode_mulaw_py,
+        codecs.AUDIO_CODEC_IMA_ADPCM: codecs._decode_adpcm_py,
+    }}
+    if codecs.HAS_NUMPY:
+        decoders["numpy"] = {
+            codecs.AUDIO_CODEC_PCM16: codecs._decode_pcm16,
+            codecs.AUDIO_CODEC_MULAW: codecs._decode_mulaw_np,
+            codecs.AUDIO_CODEC_IMA_ADPCM: codecs._decode_adpcm_np,
+        }
+
+    results = []
+    for codec in codecs.AUDIO_CODECS:
+        payloads = encode(codecs, codec, samples, args.payload_ms)
+        wire_bytes = sum(len(p) for p in payloads)
+        for impl, table in decoders.items():
+            decode = table[codec]
+            best = math.inf
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                decoded = [decode(p) for p in payloads]
+                best = min(best, time.perf_counter() - start)
+            us_per_sec = best / args.seconds * 1e6
+            results.append({
+                "codec": codec,
+                "decoder": impl,
+                "usPerSatSecond": round(us_per_sec, 1),
+                "streamsPerCore": int(0.1 * 1e6 / us_per_sec) if us_per_sec else None,
+                "kbitPerSecond": round(wire_bytes * 8 / args.seconds / 1000, 1),
+                "snrDb": snr_db(samples, b"".join(decoded)),
+            })
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""Benchmark: TTS audio duration probes on a synthetic corpus.
+
+Builds TTS-sized files (3, 10 and 30 s by default) in every format
+audio_duration.py understands, with the framing real TTS engines emit:
+
+  * mp3-cbr      - MPEG2 Layer III, 24 kHz, 48 kbit/s
+  * mp3-vbr      - headerless VBR: a low-bitrate silence frame first,
+                   then mixed bitrates (what mutagen overestimates)
+  * mp3-junk     - mp3-vbr behind 64 KiB of junk without a sync byte
+                   (the cost of resyncing)
+  * wav          - 22.05 kHz Int16 mono
+  * wav-streamed - the same with a placeholder data size
+  * flac         - STREAMINFO plus frame-sized filler
+  * ogg-opus     - 20 ms packets, 48 kHz granules, 312-sample pre-skip
+  * adts         - AAC-LC, 24 kHz, one raw block per frame
+
+Payload bytes are random: the probes only read headers, and mutagen
+does not decode either.  Reports per file:
+
+  * seconds         - the duration the file was built with
+  * probeSeconds    - probe_duration() result
+  * probeUs         - probe_duration() time
+  * mutagenSeconds  - mutagen's result (null when not installed)
+  * mutagenUs       - mutagen's time
+  * legacyMp3Us     - the previous byte-by-byte frame walk (MP3 only)
+
+--out DIR also writes the corpus to DIR.
+
+Runs without Home Assistant installed: audio_duration has no imports
+from the package, so it is loaded as a bare namespace (skipping
+__init__.py).
+"""
+
+import argparse
+import io
+import json
+import math
+import random
+import struct
+import sys
+import time
+import types
+import wave
+from pathlib import Path
+
+
+def load_audio_duration(repo_root: Path):
+    pkg_dir = repo_root / "custom_components" / "voice_satellite"
+    pkg = types.ModuleType("voice_satellite")
+    pkg.__path__ = [str(pkg_dir)]
+    sys.modules["voice_satellite"] = pkg
+    import voice_satellite.audio_duration as audio_duration  # noqa: E402
+
+    return audio_duration
+
+
+# --- corpus ---------------------------------------------------------------
+
+
+def mp3_frame(ad, rng, version: int, br_idx: int, sr_idx: int) -> tuple[bytes, float]:
+    h1 = 0xE0 | (version << 3) | (1 << 1) | 1  # Layer III, no CRC
+    h2 = (br_idx << 4) | (sr_idx << 2)
+    header = bytes((0xFF, h1, h2, 0xC4))
+    table = ad._MP3_BITRATES_V1 if version == 3 else ad._MP3_BITRATES_V2
+    rate = ad._MP3_RATES[version][sr_idx]
+    samples = 1152 if version == 3 else 576
+    length = (144 if version == 3 else 72) * table[br_idx] * 1000 // rate
+    # No 0xFF in the body, so the walker never mistakes it for a header.
+    return header + rng.randbytes(length - 4).replace(b"\xff", b"\x00"), samples / rate
+
+
+def make_mp3(ad, rng, seconds: float, vbr: bool) -> tuple[bytes, float]:
+    out = [b"ID3\x04\x00\x00\x00\x00\x00\x0a" + bytes(10)]
+    total = 0.0
+    first = True
+    while total < seconds:
+        br_idx = 1 if vbr and first else (rng.choice((4, 6, 8, 10)) if vbr else 6)
+        frame, dur = mp3_frame(ad, rng, 2, br_idx, 1)  # MPEG2, 24 kHz
+        out.append(frame)
+        total += dur
+        first = False
+    return b"".join(out), total
+
+
+def make_wav(rng, seconds: float, streamed: bool) -> tuple[bytes, float]:
+    rate = 22050
+    frames = int(seconds * rate)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(rng.randbytes(frames * 2))
+    data = bytearray(buf.getvalue())
+    if streamed:
+        data[4:8] = b"\xff\xff\xff\xff"
+        data[40:44] = b"\xff\xff\xff\xff"
+    return bytes(data), frames / rate
+
+
+def make_flac(rng, seconds: float) -> tuple[bytes, float]:
+    rate = 22050
+    total = int(seconds * rate)
+    packed = (rate << 44) | (0 << 41) | (15 << 36) | total  # mono, 16 bit
+    streaminfo = struct.pack(">HH", 4096, 4096) + bytes(6) + packed.to_bytes(8, "big") + bytes(16)
+    header = b"fLaC" + bytes((0x80,)) + len(streaminfo).to_bytes(3, "big") + streaminfo
+    # ~55 % of the PCM size, like FLAC on speech.
+    return header + rng.randbytes(int(total * 2 * 0.55)), total / rate
+
+
+_OGG_CRC = []
+for _i in range(256):
+    _r = _i << 24
+    for _ in range(8):
+        _r = ((_r << 1) ^ 0x04C11DB7) if _r & 0x80000000 else (_r << 1)
+    _OGG_CRC.append(_r & 0xFFFFFFFF)
+
+
+def ogg_page(serial: int, seq: int, granule: int, flags: int, packets: list[bytes]) -> bytes:
+    lacing = []
+    for packet in packets:
+        lacing += [255] * (len(packet) // 255) + [len(packet) % 255]
+    header = struct.pack(
+        "<4sBBqIIIB", b"OggS", 0, flags, granule, serial, seq, 0, len(lacing)
+    ) + bytes(lacing)
+    page = bytearray(header + b"".join(packets))
+    crc = 0
+    for byte in page:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ _OGG_CRC[(crc >> 24) ^ byte]
+    page[22:26] = struct.pack("<I", crc)
+    return bytes(page)
+
+
+def make_ogg_opus(rng, seconds: float) -> tuple[bytes, float]:
+    serial, pre_skip = 0x5EED, 312
+    head = b"OpusHead" + struct.pack("<BBHIhB", 1, 1, pre_skip, 24000, 0, 0)
+    tags = b"OpusTags" + struct.pack("<I", 4) + b"test" + struct.pack("<I", 0)
+    pages = [ogg_page(serial, 0, 0, 0x02, [head]), ogg_page(serial, 1, 0, 0, [tags])]
+    packets = int(seconds / 0.02)
+    granule = pre_skip
+    seq = 2
+    for start in range(0, packets, 50):  # one second per page
+        batch = [rng.randbytes(60) for _ in range(min(50, packets - start))]
+        granule += 960 * len(batch)
+        last = start + 50 >= packets
+        pages.append(ogg_page(serial, seq, granule, 0x04 if last else 0, batch))
+        seq += 1
+    return b"".join(pages), (granule - pre_skip) / 48000
+
+
+def make_adts(rng, seconds: float) -> tuple[bytes, float]:
+    rate_idx, rate = 6, 24000
+    frames = math.ceil(seconds * rate / 1024)
+    out = []
+    for _ in range(frames):
+        payload = rng.randbytes(rng.randrange(80, 200)).replace(b"\xff", b"\x00")
+        length = 7 + len(payload)
+        header = bytes((
+            0xFF, 0xF1,  # sync, MPEG-4, layer 0, no CRC
+            (1 << 6) | (rate_idx << 2),  # AAC-LC
+            0x40 | (length >> 11),  # mono
+            (length >> 3) & 0xFF,
+            ((length & 0x07) << 5) | 0x1F,
+            0xFC,  # buffer fullness, one raw block
+        ))
+        out.append(header + payload)
+    return b"".join(out), frames * 1024 / rate
+
+
+def build_corpus(ad, durations: list[float], seed: int) -> list[tuple[str, float, bytes, float]]:
+    rng = random.Random(seed)
+    corpus = []
+    for seconds in durations:
+        cases = {
+            "mp3-cbr": make_mp3(ad, rng, seconds, vbr=False),
+            "mp3-vbr": make_mp3(ad, rng, seconds, vbr=True),
+            "wav": make_wav(rng, seconds, streamed=False),
+            "wav-streamed": make_wav(rng, seconds, streamed=True),
+            "flac": make_flac(rng, seconds),
+            "ogg-opus": make_ogg_opus(rng, seconds),
+            "adts": make_adts(rng, seconds),
+        }
+        vbr, vbr_len = cases["mp3-vbr"]
+        junk = rng.randbytes(65536).replace(b"\xff", b"\x00")
+        cases["mp3-junk"] = (junk + vbr[20:], vbr_len)
+        for name, (data, length) in cases.items():
+            corpus.append((name, seconds, data, length))
+    return corpus
+
+
+# --- previous implementation ------------------------------------------------
+
+
+def legacy_mp3_walk(ad, data: bytes) -> float:
+    """The frame walk before audio_duration.py: byte-by-byte resync."""
+    n = len(data)
+    i = 0
+    if n >= 10 and data[:3] == b"ID3":
+        i = 10 + (
+            ((data[6] & 0x7F) << 21) | ((data[7] & 0x7F) << 14)
+            | ((data[8] & 0x7F) << 7) | (data[9] & 0x7F)
+        )
+    seconds = 0.0
+    frames = 0
+    while i + 4 <= n:
+        if data[i] != 0xFF or (data[i + 1] & 0xE0) != 0xE0:
+            i += 1
+            continue
+        h1, h2 = data[i + 1], data[i + 2]
+        version = (h1 >> 3) & 0x03
+        layer = (h1 >> 1) & 0x03
+        if version == 1 or layer != 1:
+            return 0.0
+        br_idx = (h2 >> 4) & 0x0F
+        sr_idx = (h2 >> 2) & 0x03
+        if br_idx in (0, 15) or sr_idx == 3:
+            i += 1
+            continue
+        bitrate = (ad._MP3_BITRATES_V1 if version == 3 else ad._MP3_BITRATES_V2)[br_idx] * 1000
+        rate = ad._MP3_RATES[version][sr_idx]
+        padding = (h2 >> 1) & 0x01
+        if version == 3:
+            frame_len = 144 * bitrate // rate + padding
+            seconds += 1152 / rate
+        else:
+            frame_len = 72 * bitrate // rate + padding
+            seconds += 576 / rate
+        if frame_len <= 0:
+            return 0.0
+        i += frame_len
+        frames += 1
+    return seconds if frames else 0.0
+
+
+def best_us(fn, data: bytes, repeat: int) -> tuple[float, float]:
+    best = math.inf
+    result = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(data)
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, nargs="+", default=[3.0, 10.0, 30.0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--out", type=Path, help="also write the corpus here")
+    args = parser.parse_args()
+
+    ad = load_audio_duration(Path(__file__).resolve().parents[1])
+    corpus = build_corpus(ad, args.seconds, args.seed)
+
+    results = []
+    for name, seconds, data, length in corpus:
+        if args.out:
+            args.out.mkdir(parents=True, exist_ok=True)
+            ext = {"mp3": "mp3", "wav": "wav", "flac": "flac", "ogg": "opus", "adts": "aac"}
+            suffix = ext[name.split("-")[0]]
+            (args.out / f"{name}-{seconds:g}s.{suffix}").write_bytes(data)
+        probe_s, probe_us = best_us(ad.probe_duration, data, args.repeat)
+        row = {
+            "file": name,
+            "targetSeconds": seconds,
+            "bytes": len(data),
+            "seconds": round(length, 3),
+            "probeSeconds": round(probe_s, 3),
+            "probeUs": round(probe_us, 1),
+            "mutagenSeconds": None,
+            "mutagenUs": None,
+            "legacyMp3Us": None,
+        }
+        if ad.HAS_MUTAGEN:
+            mut_s, mut_us = best_us(ad.mutagen_duration, data, args.repeat)
+            row["mutagenSeconds"] = round(mut_s, 3)
+            row["mutagenUs"] = round(mut_us, 1)
+        if name.startswith("mp3"):
+            _, legacy_us = best_us(lambda d: legacy_mp3_walk(ad, d), data, args.repeat)
+            row["legacyMp3Us"] = round(legacy_us, 1)
+        results.append(row)
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
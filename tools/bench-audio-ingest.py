@@ -0,0 +1,143 @@
+"""Micro-benchmark: memory and CPU cost of bridged pipeline audio ingest.
+
+Replays a synthetic card stream (Int16 16 kHz PCM in batches of varying
+size, like src/audio/processing.js produces) through three ingest
+strategies and reports, per second of audio:
+
+  * passthrough - yield each WS payload as-is (the old audio_stream()).
+  * bytearray   - naive coalescing: append to a bytearray, slice a frame
+                  off the front, delete it.
+  * ring        - the integration's FrameCoalescer (audio_frames.py).
+
+tracemalloc measures the one-off per-run setup (the ring allocation), the
+steady-state peak held above that while the stream is ingested (output
+frames are consumed immediately, as the pipeline does) and the memory
+left behind once the stream ends.  Wall time is reported separately
+with tracemalloc stopped.
+
+Runs without Home Assistant installed: audio_frames has no imports from
+the package, so it is loaded as a bare namespace (skipping __init__.py).
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+
+def load_audio_frames(repo_root: Path):
+    pkg_dir = repo_root / "custom_components" / "voice_satellite"
+    pkg = types.ModuleType("voice_satellite")
+    pkg.__path__ = [str(pkg_dir)]
+    sys.modules["voice_satellite"] = pkg
+    import voice_satellite.audio_frames as audio_frames  # noqa: E402
+
+    return audio_frames
+
+
+def make_stream(seconds: float, seed: int) -> list[bytes]:
+    """Card-like payloads: 40-120 ms batches, whole samples."""
+    rng = random.Random(seed)
+    total = int(seconds * 32000)
+    payloads = []
+    while total > 0:
+        size = min(total, rng.randrange(1280, 3840, 2))
+        payloads.append(rng.randbytes(size))
+        total -= size
+    return payloads
+
+
+def passthrough(payloads, frame_bytes):
+    for chunk in payloads:
+        yield chunk
+
+
+def bytearray_coalesce(payloads, frame_bytes):
+    buf = bytearray()
+    for chunk in payloads:
+        buf += chunk
+        while len(buf) >= frame_bytes:
+            frame = bytes(buf[:frame_bytes])
+            del buf[:frame_bytes]
+            yield frame
+    if buf:
+        yield bytes(buf)
+
+
+def make_ring(audio_frames, frame_ms):
+    def ring_coalesce(payloads, frame_bytes):
+        coalescer = audio_frames.FrameCoalescer(frame_ms)
+        for chunk in payloads:
+            yield from coalescer.push(chunk)
+        tail = coalescer.flush()
+        if tail:
+            yield tail
+
+    return ring_coalesce
+
+
+def consume(frames_iter) -> int:
+    frames = 0
+    for _frame in frames_iter:
+        frames += 1
+    return frames
+
+
+def measure(strategy, payloads, frame_bytes, seconds):
+    tracemalloc.start()
+    setup_base, _ = tracemalloc.get_traced_memory()
+    frames_iter = strategy(payloads, frame_bytes)
+    next(frames_iter)  # per-run setup (ring allocation) happens here
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    frames = 1 + consume(frames_iter)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    consume(strategy(payloads, frame_bytes))
+    elapsed = time.perf_counter() - start
+    return {
+        "framesPerSecond": round(frames / seconds, 1),
+        "setupBytes": base - setup_base,
+        "steadyPeakBytes": peak - base,
+        "retainedBytes": current - setup_base,
+        "usPerAudioSecond": round(elapsed / seconds * 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--frame-ms", type=int, nargs="+", default=[10, 20, 30])
+    parser.add_argument("--seed", type=int, default=1337)
+    args = parser.parse_args()
+
+    audio_frames = load_audio_frames(Path(__file__).resolve().parents[1])
+    payloads = make_stream(args.seconds, args.seed)
+    results = []
+
+    for frame_ms in args.frame_ms:
+        frame_bytes = audio_frames.frame_bytes_for(frame_ms)
+        strategies = {
+            "passthrough": passthrough,
+            "bytearray": bytearray_coalesce,
+            "ring": make_ring(audio_frames, frame_ms),
+        }
+        for name, strategy in strategies.items():
+            results.append({
+                "frameMs": frame_ms,
+                "strategy": name,
+                **measure(strategy, payloads, frame_bytes, args.seconds),
+            })
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
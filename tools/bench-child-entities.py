@@ -0,0 +1,182 @@
+"""Micro-benchmark: satellite attribute rendering, registry vs cached ids.
+
+Every async_write_ha_state of a satellite renders extra_state_attributes,
+which reads the state of about 15 sibling switches, selects and numbers.
+Before the sibling entity_id cache, each read first asked the entity
+registry for the sibling's entity_id by (platform, domain, unique_id);
+now the ids are resolved once into a dict keyed by unique_id suffix.
+Both paths are replayed here against a registry holding every sibling of
+N satellites:
+
+  * legacy - er.async_get(hass), then per sibling a unique_id f-string,
+             EntityRegistry.async_get_entity_id() (the same two-level
+             lookup HA does: registry -> entities index) and states.get()
+  * cached - per sibling one dict read and states.get()
+
+Reports per satellite count the microseconds spent on sibling lookups
+per state write, and the registry lookups a write costs.  The rest of
+async_write_ha_state (state object, event fire, recorder) is the same
+for both paths and is not modelled.
+
+Runs without Home Assistant installed: the sibling list is read from
+assist_satellite.py's _CHILD_ENTITIES with ast, so it stays in step with
+the integration.
+"""
+
+import argparse
+import ast
+import json
+import sys
+import timeit
+from pathlib import Path
+
+DOMAIN = "voice_satellite"
+DATA_REGISTRY = "entity_registry"
+
+# The siblings _config_attributes() reads, in its order.
+RENDERED_SUFFIXES = (
+    "_mute",
+    "_wake_sound",
+    "_stop_word",
+    "_mute_timers",
+    "_screensaver",
+    "_tts_output",
+    "_announcement_display_duration",
+    "_wake_word_detection",
+    "_wake_word_model",
+    "_wake_word_model_2",
+    "_wake_word_sensitivity",
+    "_pipeline_2",
+    "_tts_output_mode_remote",
+    "-pipeline",
+)
+
+
+def load_child_entities(repo_root: Path) -> tuple[tuple[str, str], ...]:
+    source = (
+        repo_root / "custom_components" / "voice_satellite" / "assist_satellite.py"
+    ).read_text()
+    for node in ast.parse(source).body:
+        if (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == "_CHILD_ENTITIES"
+        ):
+            return ast.literal_eval(node.value)
+    raise SystemExit("_CHILD_ENTITIES not found in assist_satellite.py")
+
+
+class FakeRegistryItems:
+    """EntityRegistryItems: entity_id lookups through a (domain, platform, unique_id) index."""
+
+    def __init__(self) -> None:
+        self._index: dict[tuple[str, str, str], str] = {}
+
+    def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
+        return self._index.get(key)
+
+
+class FakeRegistry:
+    def __init__(self) -> None:
+        self.entities = FakeRegistryItems()
+        self.lookups = 0
+
+    def async_get_entity_id(self, domain: str, platform: str, unique_id: str) -> str | None:
+        self.lookups += 1
+        return self.entities.get_entity_id((domain, platform, unique_id))
+
+
+class FakeState:
+    def __init__(self, state: str) -> None:
+        self.state = state
+        self.attributes: dict[str, str] = {}
+
+
+class FakeHass:
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.states: dict[str, FakeState] = {}
+
+
+def build(children, count: int) -> tuple[FakeHass, list[str]]:
+    hass = FakeHass()
+    registry = FakeRegistry()
+    hass.data[DATA_REGISTRY] = registry
+    entry_ids = []
+    for n in range(count):
+        entry_id = f"entry{n:05d}"
+        entry_ids.append(entry_id)
+        for platform, suffix in children:
+            entity_id = f"{platform}.tablet_{n}{suffix.replace('-', '_')}"
+            registry.entities._index[(platform, DOMAIN, f"{entry_id}{suffix}")] = entity_id
+            hass.states[entity_id] = FakeState("on" if platform == "switch" else "x")
+    return hass, entry_ids
+
+
+def legacy_render(hass: FakeHass, platforms: dict[str, str], entry_id: str) -> int:
+    registry = hass.data[DATA_REGISTRY]  # er.async_get(hass)
+    found = 0
+    for suffix in RENDERED_SUFFIXES:
+        eid = registry.async_get_entity_id(platforms[suffix], DOMAIN, f"{entry_id}{suffix}")
+        if (eid and hass.states.get(eid)) is not None:
+            found += 1
+    return found
+
+
+def cached_render(hass: FakeHass, child_eids: dict[str, str | None]) -> int:
+    found = 0
+    for suffix in RENDERED_SUFFIXES:
+        eid = child_eids.get(suffix)
+        if (eid and hass.states.get(eid)) is not None:
+            found += 1
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--satellites", type=int, nargs="+", default=[1, 40, 200])
+    parser.add_argument("--writes", type=int, default=20000)
+    args = parser.parse_args()
+
+    children = load_child_entities(Path(__file__).resolve().parents[1])
+    platforms = {suffix: platform for platform, suffix in children}
+    results = []
+
+    for count in args.satellites:
+        hass, entry_ids = build(children, count)
+        registry: FakeRegistry = hass.data[DATA_REGISTRY]
+        entry_id = entry_ids[-1]
+        child_eids = {
+            suffix: registry.async_get_entity_id(platform, DOMAIN, f"{entry_id}{suffix}")
+            for platform, suffix in children
+        }
+
+        registry.lookups = 0
+        legacy_render(hass, platforms, entry_id)
+        lookups_per_write = registry.lookups
+
+        def legacy():
+            for _ in range(args.writes):
+                legacy_render(hass, platforms, entry_id)
+
+        def cached():
+            for _ in range(args.writes):
+                cached_render(hass, child_eids)
+
+        legacy_s = min(timeit.repeat(legacy, number=1, repeat=5))
+        cached_s = min(timeit.repeat(cached, number=1, repeat=5))
+        results.append({
+            "satellites": count,
+            "registryEntities": len(registry.entities._index),
+            "legacyUsPerWrite": round(legacy_s / args.writes * 1e6, 2),
+            "cachedUsPerWrite": round(cached_s / args.writes * 1e6, 2),
+            "legacyRegistryLookupsPerWrite": lookups_per_write,
+            "cachedRegistryLookupsPerWrite": 0,
+        })
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
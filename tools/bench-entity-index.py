@@ -0,0 +1,104 @@
+"""Micro-benchmark: satellite lookup cost vs number of satellites.
+
+Compares the integration's EntityIndex against the linear scan over
+hass.data[DOMAIN] that the WebSocket handlers used before it existed.
+Each satellite config entry contributes three objects (satellite, media
+player, screensaver sensor), as in a real install.
+
+Runs without Home Assistant installed: entity_index only needs const.py,
+so the package is loaded as a bare namespace (skipping __init__.py and
+its Home Assistant imports).
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+import types
+from pathlib import Path
+
+
+def load_entity_index(repo_root: Path):
+    pkg_dir = repo_root / "custom_components" / "voice_satellite"
+    pkg = types.ModuleType("voice_satellite")
+    pkg.__path__ = [str(pkg_dir)]
+    sys.modules["voice_satellite"] = pkg
+    import voice_satellite.entity_index as entity_index  # noqa: E402
+
+    return entity_index
+
+
+class FakeEntity:
+    def __init__(self, entity_id: str) -> None:
+        self.entity_id = entity_id
+
+
+def build(entity_index, count: int):
+    index = entity_index.EntityIndex()
+    legacy: dict[str, FakeEntity] = {}
+    ids = []
+    for n in range(count):
+        entry_id = f"entry{n:05d}"
+        sat = FakeEntity(f"assist_satellite.tablet_{n}")
+        mp = FakeEntity(f"media_player.tablet_{n}_media_player")
+        sensor = FakeEntity(f"binary_sensor.tablet_{n}_screensaver_active")
+
+        siblings = index.entry(entry_id)
+        siblings.satellite = sat
+        siblings.media_player = mp
+        siblings.screensaver_sensor = sensor
+        index.add_satellite(sat)
+        index.add_media_player(mp)
+
+        legacy[entry_id] = sat
+        legacy[f"{entry_id}_media_player"] = mp
+        legacy[f"{entry_id}_screensaver_sensor"] = sensor
+        ids.append(sat.entity_id)
+    return index, legacy, ids
+
+
+def legacy_find(data: dict, entity_id: str):
+    for _, ent in data.items():
+        if ent.entity_id == entity_id:
+            return ent
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=1337)
+    args = parser.parse_args()
+
+    entity_index = load_entity_index(Path(__file__).resolve().parents[1])
+    rng = random.Random(args.seed)
+    results = []
+
+    for size in args.sizes:
+        index, legacy, ids = build(entity_index, size)
+        targets = [rng.choice(ids) for _ in range(args.lookups)]
+
+        def indexed():
+            for eid in targets:
+                index.satellite(eid)
+
+        def scanned():
+            for eid in targets:
+                legacy_find(legacy, eid)
+
+        indexed_s = min(timeit.repeat(indexed, number=1, repeat=5))
+        scanned_s = min(timeit.repeat(scanned, number=1, repeat=3))
+        results.append({
+            "satellites": size,
+            "indexNsPerLookup": round(indexed_s / args.lookups * 1e9, 1),
+            "scanNsPerLookup": round(scanned_s / args.lookups * 1e9, 1),
+        })
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark: in-process openWakeWord real-time factor per concurrent stream.
+
+Feeds N simultaneous streams of synthetic 16 kHz audio through the
+integration's openWakeWord engine (oww_engine.py) two ways:
+
+  * unbatched - one thread per stream, each running its own mel,
+                embedding and classifier inference per 80 ms chunk
+  * batched   - one job per 80 ms tick feeding every stream through
+                feed_streams(), as the wake word batcher does: one
+                batched mel, embedding and classifier inference per tick
+
+and reports for each N and mode:
+
+  * rtfPerStream  - wall time / audio time as seen by each stream (< 1.0
+                    means every stream keeps up with real time)
+  * cpuMsPerSec   - process CPU per second of audio per stream
+  * chunkP95Ms    - 95th percentile latency of one 80 ms chunk (for
+                    batched: of one tick covering all N streams)
+  * totalCpuPct   - CPU for all N streams as % of one core
+
+Sessions are shared across streams and pinned to one intra-op thread
+each, as in the integration.  Needs onnxruntime and NumPy; runs without
+Home Assistant installed (the package is loaded as a bare namespace).
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+
+
+def load_oww_engine(repo_root: Path):
+    pkg_dir = repo_root / "custom_components" / "voice_satellite"
+    pkg = types.ModuleType("voice_satellite")
+    pkg.__path__ = [str(pkg_dir)]
+    sys.modules["voice_satellite"] = pkg
+    import voice_satellite.oww_engine as oww_engine  # noqa: E402
+
+    return oww_engine
+
+
+def make_audio(count, seconds, seed):
+    rng = np.random.default_rng(seed)
+    return [
+        rng.normal(0, 800, int(seconds * 16000)).astype("<i2").tobytes()
+        for _ in range(count)
+    ]
+
+
+def summarize(count, seconds, wall, cpu, latencies):
+    return {
+        "rtfPerStream": round(wall / seconds, 4),
+        "cpuMsPerSec": round(cpu / (count * seconds) * 1000, 2),
+        "chunkP95Ms": round(float(np.percentile(latencies, 95)) * 1000, 2),
+        "totalCpuPct": round(cpu / seconds * 100, 1),
+    }
+
+
+def run_streams(engine, models, classifiers, count, seconds, seed):
+    audio = make_audio(count, seconds, seed)
+    latencies = [[] for _ in range(count)]
+    step = engine.CHUNK_SAMPLES * 2
+    barrier = threading.Barrier(count + 1)
+
+    def worker(n):
+        stream = engine.OwwStream(models, classifiers)
+        pcm = audio[n]
+        barrier.wait()
+        for start in range(0, len(pcm), step):
+            t0 = time.perf_counter()
+            stream.feed(pcm[start:start + step])
+            latencies[n].append(time.perf_counter() - t0)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for thread in threads:
+        thread.join()
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    all_lat = np.concatenate([np.array(lat) for lat in latencies])
+    return summarize(count, seconds, wall, cpu, all_lat)
+
+
+def run_batched(engine, models, classifiers, count, seconds, seed):
+    audio = make_audio(count, seconds, seed)
+    streams = [engine.OwwStream(models, classifiers) for _ in range(count)]
+    step = engine.CHUNK_SAMPLES * 2
+    latencies = []
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for start in range(0, len(audio[0]), step):
+        t0 = time.perf_counter()
+        engine.feed_streams(
+            models, [(stream, pcm[start:start + step]) for stream, pcm in zip(streams, audio)]
+        )
+        latencies.append(time.perf_counter() - t0)
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    return summarize(count, seconds, wall, cpu, np.array(latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--classifiers", nargs="+", default=["ok_nabu"])
+    parser.add_argument("--seed", type=int, default=1337)
+    args = parser.parse_args()
+
+    engine = load_oww_engine(Path(__file__).resolve().parents[1])
+    models = engine.get_oww_models()
+    for name in args.classifiers:
+        models.load_classifier(name)
+
+    results = {"cpuCount": os.cpu_count(), "runs": []}
+    for count in args.streams:
+        run_args = (engine, models, args.classifiers, count, args.seconds, args.seed)
+        results["runs"].append({
+            "streams": count,
+            "unbatched": run_streams(*run_args),
+            "batched": run_batched(*run_args),
+        })
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark: server-side resampling cost vs tablet CPU it saves.
+
+Server side: times the integration's StreamingResampler (audio_resample.py)
+on 80 ms card-sized payloads captured at 44.1 / 48 kHz, and reports CPU
+per satellite-second plus how many streams one core absorbs at 10 %
+load.
+
+Tablet side: runs the card's own capture path under Node (resample() and
+floatTo16BitPCM() copied verbatim from src/audio/processing.js) twice:
+resampling to 16 kHz before conversion, as today, and converting at the
+native rate, as with server-side resampling.  The difference is the CPU
+the tablet saves.  Node on this host is much faster than a wall tablet's
+browser, so the tablet numbers are also scaled by --tablet-slowdown
+(default 8, roughly a low-end Android tablet running Chrome vs. a
+desktop core); pass the factor measured on your own hardware.  Skipped
+when `node` is not on PATH.
+
+Runs without Home Assistant installed: audio_resample only imports
+audio_codecs, so the package is loaded as a bare namespace.
+"""
+
+import argparse
+import json
+import math
+import shutil
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+import numpy as np
+
+NODE_BENCH = r"""
+let _resampleBuf = null;
+let _resampleBufLen = 0;
+function resample(inputSamples, fromSampleRate, toSampleRate) {
+  if (fromSampleRate === toSampleRate) return inputSamples;
+  const ratio = fromSampleRate / toSampleRate;
+  const outputLength = Math.round(inputSamples.length / ratio);
+  if (outputLength !== _resampleBufLen) {
+    _resampleBuf = new Float32Array(outputLength);
+    _resampleBufLen = outputLength;
+  }
+  for (let i = 0; i < outputLength; i++) {
+    const srcIndex = i * ratio;
+    const low = Math.floor(srcIndex);
+    const high = Math.min(low + 1, inputSamples.length - 1);
+    const frac = srcIndex - low;
+    _resampleBuf[i] = inputSamples[low] * (1 - frac) + inputSamples[high] * frac;
+  }
+  return _resampleBuf;
+}
+function floatTo16BitPCM(float32Array) {
+  const pcmData = new Int16Array(float32Array.length);
+  for (let i = 0; i < float32Array.length; i++) {
+    const s = Math.max(-1, Math.min(1, float32Array[i]));
+    pcmData[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
+  }
+  return pcmData;
+}
+const [rate, seconds, repeat] = process.argv.slice(1).map(Number);
+const per = Math.round(rate * 0.08);
+const chunks = [];
+for (let n = 0; n < seconds * rate; n += per) {
+  const c = new Float32Array(per);
+  for (let i = 0; i < per; i++) c[i] = 0.3 * Math.sin(2 * Math.PI * 440 * (n + i) / rate);
+  chunks.push(c);
+}
+function time(fn) {
+  let best = Infinity;
+  for (let r = 0; r < repeat; r++) {
+    const t0 = process.hrtime.bigint();
+    for (const c of chunks) fn(c);
+    best = Math.min(best, Number(process.hrtime.bigint() - t0) / 1e3);
+  }
+  return best / seconds;
+}
+const client = time((c) => floatTo16BitPCM(resample(c, rate, 16000)));
+const native = time((c) => floatTo16BitPCM(c));
+console.log(JSON.stringify({ client, native }));
+"""
+
+
+def load_audio_resample(repo_root: Path):
+    pkg_dir = repo_root / "custom_components" / "voice_satellite"
+    pkg = types.ModuleType("voice_satellite")
+    pkg.__path__ = [str(pkg_dir)]
+    sys.modules["voice_satellite"] = pkg
+    import voice_satellite.audio_resample as audio_resample  # noqa: E402
+
+    return audio_resample
+
+
+def server_us_per_second(audio_resample, rate: int, seconds: float, repeat: int):
+    per = round(rate * 0.08)
+    t = np.arange(int(seconds * rate)) / rate
+    pcm = (9000 * np.sin(2 * np.pi * 440 * t)).astype("<i2").tobytes()
+    payloads = [pcm[i:i + per * 2] for i in range(0, len(pcm), per * 2)]
+    best = math.inf
+    for _ in range(repeat):
+        resampler = audio_resample.StreamingResampler(rate)
+        start = time.perf_counter()
+        for payload in payloads:
+            resampler.process(payload)
+        best = min(best, time.perf_counter() - start)
+    return best / seconds * 1e6
+
+
+def tablet_us_per_second(rate: int, seconds: float, repeat: int):
+    node = shutil.which("node")
+    if node is None:
+        return None
+    result = subprocess.run(
+        [node, "-e", NODE_BENCH, str(rate), str(seconds), str(repeat)],
+        capture_output=True, check=True, text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rates", type=int, nargs="+", default=[44100, 48000])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tablet-slowdown", type=float, default=8.0)
+    args = parser.parse_args()
+
+    audio_resample = load_audio_resample(Path(__file__).resolve().parents[1])
+    results = []
+    for rate in args.rates:
+        server = server_us_per_second(audio_resample, rate, args.seconds, args.repeat)
+        row = {
+            "sampleRate": rate,
+            "serverUsPerSatSecond": round(server, 1),
+            "serverStreamsPerCore": int(0.1 * 1e6 / server),
+        }
+        tablet = tablet_us_per_second(rate, args.seconds, args.repeat)
+        if tablet is not None:
+            saved = tablet["client"] - tablet["native"]
+            row.update({
+                "nodeUsClientResample": round(tablet["client"], 1),
+                "nodeUsNativeRate": round(tablet["native"], 1),
+                "tabletUsSavedPerSecond": round(saved * args.tablet_slowdown, 1),
+                "tabletCpuSavedPct": round(saved * args.tablet_slowdown / 1e4, 3),
+            })
+        results.append(row)
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Parity check: Python vsWakeWord engine (vww_engine.py) vs the card's JS.
+
+Runs the card's own log-mel frontend (VwwInference in
+src/wake-word/vww/inference.js) and CtcDecoder (ctc-decoder.js) under
+Node on the same inputs as the integration's Python port, and reports
+where they disagree:
+
+  * frontend - log-mel windows for synthetic audio patterns (silence,
+    noise, tone sweep, noise bursts).  The JS FFT runs in float32 and
+    NumPy in float64, so expect ~1e-4 differences, not zero.
+  * decoder  - per-window and stream decode/match results.  Both sides
+    decode the SAME logits: the model's real output on the audio
+    patterns, plus fabricated logits that spell each wake word target
+    with substitutions, insertions, deletions, word-separator edits and
+    confidences either side of the gates, so the matcher paths that
+    noise never reaches are exercised too.  Decoder results must match
+    exactly.
+
+inference.js imports the WebGPU runner, which Node cannot load; the
+tool copies it to a temp dir with those imports removed.  Needs node,
+NumPy and onnxruntime; runs without Home Assistant installed.
+"""
+
+import argparse
+import json
+import math
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+import numpy as np
+
+NODE_RUNNER = r"""
+import fs from 'node:fs';
+import { VwwInference, CHUNK_SAMPLES } from './inference.js';
+import { CtcDecoder } from './ctc-decoder.js';
+
+const req = JSON.parse(fs.readFileSync(0, 'utf8'));
+const manifest = req.manifest;
+const fc = manifest.feature_config || {};
+const out = { frontend: [], decoder: [] };
+
+for (const audio of req.audio) {
+  const inf = new VwwInference(null, fc);
+  const samples = Float32Array.from(audio);
+  const windows = [];
+  for (let i = 0; i + CHUNK_SAMPLES <= samples.length; i += CHUNK_SAMPLES) {
+    inf.ingestChunk(samples.subarray(i, i + CHUNK_SAMPLES));
+    if (inf._ringFilled >= inf._windowSamples) windows.push(Array.from(inf._featureBuf));
+  }
+  out.frontend.push(windows);
+}
+
+const shape = [1, req.tOut, manifest.ctc.vocab_size];
+const rt = manifest.runtime || {};
+const windowSamples = Math.round(fc.sample_rate * fc.window_ms / 1000);
+for (const run of req.logits) {
+  const dec = new CtcDecoder(manifest.ctc, shape);
+  dec.setConfidenceScale(req.scale);
+  if (rt.stream_match !== false) {
+    dec.enableStreamMatch({
+      windowSamples,
+      windowMs: fc.window_ms ?? 1300,
+      bufferMs: rt.stream_buffer_ms,
+      lagFrames: rt.stream_lag_frames,
+    });
+  }
+  const steps = [];
+  for (const flat of run) {
+    const logits = Float32Array.from(flat);
+    const info = dec.analyzeWithConfidence(logits);
+    dec.streamUpdate(logits, CHUNK_SAMPLES);
+    const stream = dec.streamAnalyze();
+    steps.push({
+      decoded: info.decoded,
+      matched: info.matched,
+      targetIndex: info.matchedTargetIndex,
+      groupIndex: info.matchedTargetGroupIndex,
+      minEditDistance: Number.isFinite(info.minEditDistance) ? info.minEditDistance : null,
+      matchedConfidence: info.matchedConfidence,
+      streamDecoded: stream ? stream.decoded : [],
+      streamMatched: !!(stream && stream.matched),
+    });
+  }
+  out.decoder.push(steps);
+}
+process.stdout.write(JSON.stringify(out));
+"""
+
+SAMPLE_RATE = 16000
+
+
+def load_vww_engine(repo_root: Path):
+    pkg_dir = repo_root / "custom_components" / "voice_satellite"
+    pkg = types.ModuleType("voice_satellite")
+    pkg.__path__ = [str(pkg_dir)]
+    sys.modules["voice_satellite"] = pkg
+    import voice_satellite.vww_engine as vww_engine  # noqa: E402
+
+    return vww_engine
+
+
+def create_audio(seconds: float, seed: int):
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE)
+    t = np.arange(n) / SAMPLE_RATE
+    sweep = 0.3 * np.sin(2 * np.pi * (100 + 3900 * t / seconds) * t)
+    bursts = rng.normal(0, 0.2, n) * (np.sin(2 * np.pi * 1.5 * t) > 0.6)
+    return {
+        "silence": np.zeros(n),
+        "noise": rng.normal(0, 0.05, n),
+        "sweep": sweep,
+        "bursts": bursts,
+    }
+
+
+def fabricate_logits(decoder, rng: random.Random, t_out: int, vocab: int):
+    """Logit windows whose argmax spells perturbed wake word targets."""
+    windows = []
+    for target in decoder.targets:
+        for _ in range(12):
+            seq = list(target)
+            edit = rng.choice(["none", "sub", "ins", "del", "sep", "trail"])
+            pos = rng.randrange(len(seq))
+            if edit == "sub":
+                seq[pos] = rng.randrange(3, vocab)
+            elif edit == "ins":
+                seq.insert(pos, rng.randrange(3, vocab))
+            elif edit == "del":
+                del seq[pos]
+            elif edit == "sep":
+                seq.insert(pos, decoder.word_sep_id)
+            elif edit == "trail":
+                seq += [rng.randrange(3, vocab) for _ in range(rng.randint(1, 3))]
+            gate = decoder.target_min_matched_confidence[0]
+            center = gate if math.isfinite(gate) else 4.0
+            window = np.full((t_out, vocab), -5.0, dtype=np.float32)
+            window[:, decoder.blank_id] = 2.0
+            frame = rng.randrange(0, max(1, t_out - 2 * len(seq)))
+            for token in seq:
+                for _ in range(rng.randint(1, 2)):
+                    if frame >= t_out:
+                        break
+                    window[frame, token] = center + rng.uniform(-1.0, 2.0)
+                    window[frame, decoder.blank_id] = -5.0
+                    frame += 1
+                frame += rng.randint(0, 1)
+            windows.append(window)
+    return windows
+
+
+def run_node(repo_root: Path, request: dict):
+    src = repo_root / "src" / "wake-word" / "vww"
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        inference = (src / "inference.js").read_text(encoding="utf-8")
+        inference = "\n".join(
+            line
+            for line in inference.splitlines()
+            if not line.startswith("import ") or "ctc-decoder" in line
+        )
+        (tmp_dir / "inference.js").write_text(inference, encoding="utf-8")
+        shutil.copy(src / "ctc-decoder.js", tmp_dir / "ctc-decoder.js")
+        (tmp_dir / "runner.mjs").write_text(NODE_RUNNER, encoding="utf-8")
+        result = subprocess.run(
+            ["node", str(tmp_dir / "runner.mjs")],
+            cwd=tmp_dir,
+            input=json.dumps(request),
+            text=True,
+            capture_output=True,
+            check=True,
+        )
+    return json.loads(result.stdout)
+
+
+def python_decode(engine, model, windows, scale: float):
+    stream = engine.VwwStream(model, confidence_scale=scale)
+    decoder = stream.decoder
+    steps = []
+    for logits in windows:
+        info = decoder.analyze(logits)
+        decoder.stream_update(info["frame_ids"], info["frame_logits"], engine.CHUNK_SAMPLES)
+        result = decoder.stream_analyze()
+        ed = info["min_edit_distance"]
+        steps.append({
+            "decoded": info["decoded"],
+            "matched": info["matched"],
+            "targetIndex": info["matched_target_index"],
+            "groupIndex": info["matched_target_group_index"],
+            "minEditDistance": ed if math.isfinite(ed) else None,
+            "matchedConfidence": info["matched_confidence"],
+            "streamDecoded": result["decoded"] if result else [],
+            "streamMatched": bool(result and result["matched"]),
+        })
+    return steps
+
+
+def compare_steps(py_steps, js_steps):
+    mismatches = 0
+    first = None
+    conf_diff = 0.0
+    for idx, (py, js) in enumerate(zip(py_steps, js_steps)):
+        conf_diff = max(conf_diff, abs(py["matchedConfidence"] - js["matchedConfidence"]))
+        same = all(
+            py[key] == js[key]
+            for key in py
+            if key != "matchedConfidence"
+        )
+        if not same:
+            mismatches += 1
+            if first is None:
+                first = {"step": idx, "py": py, "js": js}
+    return {
+        "steps": len(py_steps),
+        "matches": sum(1 for s in py_steps if s["matched"] or s["streamMatched"]),
+        "mismatchSteps": mismatches,
+        "maxConfidenceDiff": conf_diff,
+        "firstMismatch": first,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", action="append", dest="models")
+    parser.add_argument("--seconds", type=float, default=4.0)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=1337)
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).resolve().parents[1]
+    engine = load_vww_engine(repo_root)
+    models = args.models or [
+        p.stem for p in sorted(engine.VWW_MODELS_DIR.glob("*.json"))
+    ]
+    rng = random.Random(args.seed)
+    audio = create_audio(args.seconds, args.seed)
+    results = []
+
+    for model_name in models:
+        model = engine.get_vww_model(model_name)
+        frontend_windows = {}
+        model_logits = []
+        for name, signal in audio.items():
+            frontend = engine.LogMelFrontend(model.manifest.get("feature_config"))
+            samples = signal.astype(np.float32)
+            windows = []
+            logits = []
+            for start in range(0, samples.size - engine.CHUNK_SAMPLES + 1, engine.CHUNK_SAMPLES):
+                features = frontend.push(samples[start:start + engine.CHUNK_SAMPLES])
+                if features is not None:
+                    windows.append(features.copy())
+                    logits.append(model.run(features))
+            frontend_windows[name] = windows
+            model_logits.append(logits)
+
+        decoder = engine.CtcDecoder(model.manifest["ctc"], model.t_out)
+        vocab = model.manifest["ctc"]["vocab_size"]
+        fabricated = fabricate_logits(decoder, rng, model.t_out, vocab)
+        logit_runs = model_logits + [fabricated]
+        run_names = list(audio) + ["fabricated"]
+
+        js = run_node(repo_root, {
+            "manifest": model.manifest,
+            "tOut": model.t_out,
+            "scale": args.scale,
+            "audio": [signal.astype(np.float32).tolist() for signal in audio.values()],
+            "logits": [[w.reshape(-1).tolist() for w in run] for run in logit_runs],
+        })
+
+        frontend = {}
+        for (name, windows), js_windows in zip(frontend_windows.items(), js["frontend"]):
+            diffs = [
+                float(np.max(np.abs(py - np.asarray(jw, dtype=np.float32).reshape(py.shape))))
+                for py, jw in zip(windows, js_windows)
+            ]
+            frontend[name] = {
+                "windows": len(windows),
+                "jsWindows": len(js_windows),
+                "maxAbsDiff": max(diffs) if diffs else 0.0,
+            }
+        decoding = {
+            name: compare_steps(python_decode(engine, model, run, args.scale), js_run)
+            for name, run, js_run in zip(run_names, logit_runs, js["decoder"])
+        }
+        results.append({
+            "modelName": model_name,
+            "frontend": frontend,
+            "decoder": decoding,
+            "totalDecoderMismatchSteps": sum(d["mismatchSteps"] for d in decoding.values()),
+        })
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,32 @@
+"""Parity and throughput checks for the microWakeWord ports.
+
+  * model      - the card's custom TFLite runner (custom-model-runner.js)
+                 vs LiteRT on synthetic int8 input frames.
+  * frontend   - the integration's NumPy micro frontend (mww_engine.py)
+                 vs the card's micro-frontend-js on synthetic audio
+                 (silence, noise, tone sweep, noise bursts, clipping),
+                 fed in 80 ms chunks.  Features and their int8
+                 quantization must match exactly.
+  * throughput - N simultaneous MwwStream detectors on synthetic audio,
+                 one thread per stream as HA's executor runs them:
+                 real-time factor, CPU per audio-second and p95 chunk
+                 latency.
+
+Needs node, NumPy and ai-edge-litert; runs without Home Assistant
+installed (the package is loaded as a bare namespace).
+"""
+
 import argparse
 import json
+import os
 import random
 import statistics
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import types
 from pathlib import Path
 
 import numpy as np
@@ -21,6 +44,44 @@ DEFAULT_MODELS = [
     "stop",
 ]
 
+FRONTEND_RUNNER = r"""
+import fs from 'node:fs';
+const { createJsMicroFrontend, roundBankers } = await import(process.argv[2]);
+
+const req = JSON.parse(fs.readFileSync(0, 'utf8'));
+const scale = Math.fround(req.scale);
+const zeroPoint = Math.fround(req.zeroPoint);
+const out = [];
+for (const audio of req.audio) {
+  const frontend = await createJsMicroFrontend();
+  const samples = Float32Array.from(audio);
+  const features = [];
+  const quantized = [];
+  for (let i = 0; i < samples.length; i += req.chunk) {
+    for (const feature of frontend.feed(samples.subarray(i, i + req.chunk))) {
+      features.push(Array.from(feature));
+      quantized.push(Array.from(feature, (f) => Math.min(127, Math.max(-128,
+        roundBankers(Math.fround(Math.fround(f / scale) + zeroPoint))))));
+    }
+  }
+  out.push({ features, quantized });
+}
+process.stdout.write(JSON.stringify(out));
+"""
+
+SAMPLE_RATE = 16000
+CHUNK_SAMPLES = 1280
+
+
+def load_mww_engine(repo_root: Path):
+    pkg_dir = repo_root / "custom_components" / "voice_satellite"
+    pkg = types.ModuleType("voice_satellite")
+    pkg.__path__ = [str(pkg_dir)]
+    sys.modules["voice_satellite"] = pkg
+    import voice_satellite.mww_engine as mww_engine  # noqa: E402
+
+    return mww_engine
+
 
 def create_patterns(length: int, steps: int, seed: int):
     rng = random.Random(seed)
@@ -121,17 +182,154 @@ def compare_outputs(ref_outputs, js_outputs, sequence):
     }
 
 
+def create_audio(seconds: float, seed: int):
+    rng = np.random.default_rng(seed)
+    n = int(seconds * SAMPLE_RATE)
+    t = np.arange(n) / SAMPLE_RATE
+    sweep = 0.3 * np.sin(2 * np.pi * (100 + 3900 * t / seconds) * t)
+    bursts = rng.normal(0, 0.2, n) * (np.sin(2 * np.pi * 1.5 * t) > 0.6)
+    # Saturated square wave: exercises the int16 wraps and a -32768 peak.
+    clipped = np.sign(np.sin(2 * np.pi * 440 * t)) * 1.2
+    return {
+        "silence": np.zeros(n),
+        "noise": rng.normal(0, 0.05, n),
+        "sweep": sweep,
+        "bursts": bursts,
+        "clipped": clipped,
+    }
+
+
+def to_int16(samples: np.ndarray) -> np.ndarray:
+    """floatToInt16 in micro-frontend-js: scale, clamp, truncate."""
+    return np.trunc(np.clip(samples * 32768.0, -32768, 32767)).astype(np.int16)
+
+
+def check_frontend(repo_root: Path, engine, seconds: float, seed: int):
+    audio = {
+        name: signal.astype(np.float32) for name, signal in create_audio(seconds, seed).items()
+    }
+    model = engine.MwwModel("ok_nabu")
+    index_js = repo_root / "src" / "wake-word" / "micro-frontend-js" / "index.js"
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = Path(tmp) / "runner.mjs"
+        runner.write_text(FRONTEND_RUNNER, encoding="utf-8")
+        result = subprocess.run(
+            ["node", str(runner), index_js.as_uri()],
+            input=json.dumps({
+                "audio": [signal.tolist() for signal in audio.values()],
+                "chunk": CHUNK_SAMPLES,
+                "scale": model.input_scale,
+                "zeroPoint": model.input_zero_point,
+            }),
+            text=True,
+            capture_output=True,
+            check=True,
+        )
+    js_runs = json.loads(result.stdout)
+
+    results = {}
+    for (name, signal), js in zip(audio.items(), js_runs):
+        frontend = engine.MicroFrontend()
+        pcm = to_int16(signal)
+        py = np.concatenate([
+            frontend.feed(pcm[start:start + CHUNK_SAMPLES])
+            for start in range(0, pcm.size, CHUNK_SAMPLES)
+        ])
+        js_features = np.asarray(js["features"], dtype=np.float32).reshape(-1, engine.FEATURE_SIZE)
+        frames = min(len(py), len(js_features))
+        diff = np.abs(py[:frames] - js_features[:frames])
+        divided = (py.astype(np.float64) / model.input_scale).astype(np.float32)
+        shifted = (divided.astype(np.float64) + model.input_zero_point).astype(np.float32)
+        quantized = np.clip(np.round(shifted), -128, 127)[:frames]
+        js_quantized = np.asarray(js["quantized"]).reshape(-1, engine.FEATURE_SIZE)[:frames]
+        mismatches = np.flatnonzero(diff.max(axis=1) > 0)
+        results[name] = {
+            "frames": len(py),
+            "jsFrames": len(js_features),
+            "maxAbsDiff": float(diff.max()) if frames else 0.0,
+            "mismatchFrames": int(mismatches.size),
+            "quantizedMismatchFrames": int(
+                np.count_nonzero((quantized != js_quantized).any(axis=1))
+            ),
+            "firstMismatch": int(mismatches[0]) if mismatches.size else None,
+        }
+    return results
+
+
+def check_throughput(engine, model_name: str, counts, seconds: float, seed: int):
+    model = engine.MwwModel(model_name)
+    rng = np.random.default_rng(seed)
+    step = CHUNK_SAMPLES * 2
+    runs = []
+    for count in counts:
+        audio = [
+            rng.normal(0, 800, int(seconds * SAMPLE_RATE)).astype("<i2").tobytes()
+            for _ in range(count)
+        ]
+        latencies = [[] for _ in range(count)]
+        barrier = threading.Barrier(count + 1)
+
+        def worker(n):
+            stream = engine.MwwStream(model)
+            pcm = audio[n]
+            barrier.wait()
+            for start in range(0, len(pcm), step):
+                t0 = time.perf_counter()
+                stream.feed(pcm[start:start + step])
+                latencies[n].append(time.perf_counter() - t0)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        cpu0, wall0 = time.process_time(), time.perf_counter()
+        for thread in threads:
+            thread.join()
+        cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+        all_lat = np.concatenate([np.array(lat) for lat in latencies])
+        runs.append({
+            "streams": count,
+            "rtfPerStream": round(wall / seconds, 4),
+            "cpuMsPerSec": round(cpu / (count * seconds) * 1000, 2),
+            "chunkP95Ms": round(float(np.percentile(all_lat, 95)) * 1000, 2),
+        })
+    return {"modelName": model_name, "cpuCount": os.cpu_count(), "runs": runs}
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--model", action="append", dest="models")
     parser.add_argument("--steps", type=int, default=32)
     parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument(
+        "--check",
+        action="append",
+        dest="checks",
+        choices=["model", "frontend", "throughput"],
+    )
+    parser.add_argument("--seconds", type=float, default=4.0)
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 2, 4, 8, 16])
     args = parser.parse_args()
 
     repo_root = Path(__file__).resolve().parents[1]
     models = args.models or DEFAULT_MODELS
-    results = []
+    checks = args.checks or ["model", "frontend", "throughput"]
+    output = {}
 
+    if "frontend" in checks or "throughput" in checks:
+        engine = load_mww_engine(repo_root)
+    if "frontend" in checks:
+        output["frontend"] = check_frontend(repo_root, engine, args.seconds, args.seed)
+    if "throughput" in checks:
+        output["throughput"] = check_throughput(
+            engine, models[0], args.streams, args.seconds, args.seed
+        )
+    if "model" not in checks:
+        json.dump(output, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    results = []
     for model_name in models:
         model_path = repo_root / "custom_components" / "voice_satellite" / "models" / f"{model_name}.tflite"
         if not model_path.exists():
@@ -159,8 +357,9 @@ def main():
             pattern["mismatchSteps"] for pattern in model_result["patterns"].values()
         )
         results.append(model_result)
+    output["model"] = results
 
-    json.dump(results, sys.stdout, indent=2)
+    json.dump(output, sys.stdout, indent=2)
     sys.stdout.write("\n")
 
 